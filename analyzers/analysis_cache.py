@@ -0,0 +1,205 @@
+"""시트 분석 결과 캐시
+
+로드한 시트의 내용 해시와 분석기 버전을 키로 태그 집계, 카테고리 분류, 업체 통계를
+저장합니다. 메모리 LRU 캐시를 먼저 확인하고, 디스크 캐시 경로가 설정되어 있으면
+JSON 파일로도 보관하여 시트나 분석 모드를 바꿔도 다시 계산하지 않습니다. 디스크 캐시는
+오래 안 쓴 파일과 용량 한도를 넘는 파일을 최근에 쓰지 않은 것부터 지웁니다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+import pandas as pd
+
+from analyzers.tag_analyzer import (
+    analyze_company_stats,
+    analyze_tags,
+    categorize_tags_advanced,
+    count_consultations,
+)
+from config import (
+    ANALYSIS_CACHE_CONFIG,
+    COMPANY_PRODUCT_PREFIXES,
+    TAG_CATEGORIES,
+    TAG_PREFIX_ALIASES,
+    TAG_SUBCATEGORY_MATCH,
+)
+from utils import metrics, perf
+
+# 분석 로직이 바뀌면 올려서 이전 결과를 무효화합니다.
+ANALYZER_VERSION = "1"
+
+# 분석에 사용하는 열 (해시 대상)
+ANALYSIS_COLUMNS = ["id", "name", "tags"]
+
+AnalysisResult = namedtuple(
+    "AnalysisResult",
+    ["tag_counts", "category_counts", "company_stats", "total_consultations"],
+)
+
+_memory_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def _analyzer_fingerprint():
+    """분석기 버전과 분류 규칙 설정을 합친 식별자를 반환합니다."""
+    rules = json.dumps(
+        [TAG_CATEGORIES, TAG_PREFIX_ALIASES, TAG_SUBCATEGORY_MATCH, COMPANY_PRODUCT_PREFIXES],
+        ensure_ascii=False,
+    )
+    return f"{ANALYZER_VERSION}-{hashlib.sha1(rules.encode('utf-8')).hexdigest()[:12]}"
+
+
+def content_hash(df):
+    """분석에 쓰이는 열의 내용으로 시트 해시를 계산합니다."""
+    columns = [column for column in ANALYSIS_COLUMNS if column in df.columns]
+    digest = hashlib.sha1(json.dumps(columns, ensure_ascii=False).encode("utf-8"))
+    if columns and len(df):
+        row_hashes = pd.util.hash_pandas_object(
+            df[columns].astype(object), index=False
+        ).to_numpy()
+        digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+def _disk_path(key):
+    return os.path.join(ANALYSIS_CACHE_CONFIG["disk_dir"], f"{key}.json")
+
+
+def _read_disk(key):
+    if not ANALYSIS_CACHE_CONFIG["disk_dir"]:
+        return None
+    path = _disk_path(key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            result = AnalysisResult(**json.load(f))
+        # 최근 사용 시각 갱신 (용량 초과 시 오래 안 쓴 파일부터 삭제)
+        os.utime(path)
+    except (OSError, ValueError, TypeError):
+        return None
+    return result
+
+
+def _write_disk(key, result):
+    if not ANALYSIS_CACHE_CONFIG["disk_dir"]:
+        return
+    path = _disk_path(key)
+    try:
+        os.makedirs(ANALYSIS_CACHE_CONFIG["disk_dir"], exist_ok=True)
+        # 같은 디렉터리의 고유한 임시 파일에 쓴 뒤 교체
+        fd, temp_path = tempfile.mkstemp(dir=ANALYSIS_CACHE_CONFIG["disk_dir"], suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result._asdict(), f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except BaseException:
+            _remove_file(temp_path)
+            raise
+    except OSError:
+        return
+    evict_disk_cache()
+
+
+def evict_disk_cache():
+    """오래 안 쓴 디스크 캐시를 지우고, 전체 용량이 한도를 넘으면 최근에 쓰지 않은 것부터 지웁니다."""
+    cache_dir = ANALYSIS_CACHE_CONFIG["disk_dir"]
+    if not cache_dir:
+        return
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+
+    now = time.time()
+    max_age = ANALYSIS_CACHE_CONFIG["disk_max_age_days"] * 86400
+    entries = []
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+
+        if now - stat.st_mtime > max_age:
+            _remove_file(path)
+        else:
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_bytes <= ANALYSIS_CACHE_CONFIG["disk_max_bytes"]:
+            break
+        _remove_file(path)
+        total_bytes -= size
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _remember(key, result):
+    with _lock:
+        _memory_cache[key] = result
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > ANALYSIS_CACHE_CONFIG["max_entries"]:
+            _memory_cache.popitem(last=False)
+
+
+def get_cached_analysis(key):
+    """캐시된 분석 결과를 반환합니다. 없으면 None."""
+    with _lock:
+        result = _memory_cache.get(key)
+        if result is not None:
+            _memory_cache.move_to_end(key)
+            metrics.cache_requests.inc(cache="analysis", result="hit")
+            return result
+
+    result = _read_disk(key)
+    if result is not None:
+        _remember(key, result)
+    metrics.cache_requests.inc(cache="analysis", result="miss" if result is None else "hit")
+    return result
+
+
+def store_analysis(key, result):
+    """분석 결과를 메모리와 (설정된 경우) 디스크 캐시에 저장합니다."""
+    _remember(key, result)
+    _write_disk(key, result)
+
+
+def run_analysis(df):
+    """캐시를 거치지 않고 시트를 분석합니다."""
+    tag_counts = analyze_tags(df)
+    return AnalysisResult(
+        tag_counts=tag_counts,
+        category_counts=categorize_tags_advanced(tag_counts),
+        company_stats=analyze_company_stats(df),
+        total_consultations=count_consultations(df),
+    )
+
+
+def analysis_key(df):
+    """시트 내용 해시와 분석기 식별자로 캐시 키를 만듭니다."""
+    return f"{content_hash(df)}-{_analyzer_fingerprint()}"
+
+
+def analyze_sheet(df):
+    """시트 분석 결과(AnalysisResult)를 반환합니다. 같은 내용이면 캐시를 사용합니다."""
+    with perf.timed("analyze_sheet", rows=len(df)) as record:
+        key = analysis_key(df)
+        result = get_cached_analysis(key)
+        record["cache"] = "miss" if result is None else "hit"
+        if result is None:
+            result = run_analysis(df)
+            store_analysis(key, result)
+    return result
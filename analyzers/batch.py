@@ -0,0 +1,228 @@
+"""월별 집계 일괄 계산 (headless CLI)
+
+모든 상담데이터 시트를 불러와 태그 집계, 카테고리 분류, 업체별 대분류 플래그를 계산하고
+SQLite 파일에 저장합니다. 대시보드 요청 시점에 원본 행을 다시 분석하지 않도록
+야간 작업 등으로 미리 실행해 둘 수 있습니다.
+
+    python -m analyzers.batch [--db 경로] [--sheet 시트이름 ...] [--force]
+
+저장 테이블 (모두 시트 이름 sheet와 월 month 열을 가짐):
+    sheets          시트별 상담 건수와 분석 키 (내용이 같으면 다시 계산하지 않음)
+    tag_counts      태그 × 월 건수
+    category_tags   카테고리 × 태그 × 월 건수 (categorize_tags_advanced 결과)
+    company_flags   업체 × 대분류(COMPANY_CATEGORIES 키) × 월, 해당하는 조합만 저장
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+from analyzers.analysis_cache import AnalysisResult, analysis_key
+from analyzers.tag_analyzer import (
+    analyze_tags,
+    categorize_tags_advanced,
+    company_category_flags,
+    count_consultations,
+)
+from analyzers.trend_analyzer import sheet_month
+from config import BATCH_CONFIG, COMPANY_CATEGORIES, SHEET_COLUMNS, SHEETS_API_CONFIG
+from services.sheets_service import (
+    create_service,
+    list_consultation_sheets,
+    load_sheets_concurrently,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sheets (
+    sheet TEXT PRIMARY KEY,
+    month TEXT NOT NULL,
+    total_consultations INTEGER NOT NULL,
+    analysis_key TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tag_counts (
+    sheet TEXT NOT NULL,
+    month TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (sheet, tag)
+);
+CREATE TABLE IF NOT EXISTS category_tags (
+    sheet TEXT NOT NULL,
+    month TEXT NOT NULL,
+    category TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (sheet, category, tag)
+);
+CREATE TABLE IF NOT EXISTS company_flags (
+    sheet TEXT NOT NULL,
+    month TEXT NOT NULL,
+    company TEXT NOT NULL,
+    category TEXT NOT NULL,
+    PRIMARY KEY (sheet, company, category)
+);
+CREATE INDEX IF NOT EXISTS tag_counts_month ON tag_counts (month, tag);
+CREATE INDEX IF NOT EXISTS company_flags_month ON company_flags (month, category);
+"""
+
+def connect(db_path=None):
+    """집계 저장소에 연결하고 테이블이 없으면 만듭니다."""
+    db_path = db_path or BATCH_CONFIG["db_path"]
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def stored_analysis_key(conn, sheet_name):
+    """저장된 시트의 분석 키를 반환합니다. 없으면 None."""
+    row = conn.execute(
+        "SELECT analysis_key FROM sheets WHERE sheet = ?", (sheet_name,)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def write_sheet_aggregates(conn, sheet_name, df, key=None):
+    """시트 하나를 분석하여 집계 테이블의 해당 시트 행을 교체합니다."""
+    month = sheet_month(sheet_name)
+    tag_counts = analyze_tags(df)
+    category_counts = categorize_tags_advanced(tag_counts)
+    flags = company_category_flags(df)
+    flagged = flags.stack()
+    flagged = flagged[flagged]
+
+    with conn:
+        for table in ("sheets", "tag_counts", "category_tags", "company_flags"):
+            conn.execute(f"DELETE FROM {table} WHERE sheet = ?", (sheet_name,))
+
+        conn.execute(
+            "INSERT INTO sheets VALUES (?, ?, ?, ?, ?)",
+            (sheet_name, month, count_consultations(df), key or analysis_key(df), time.time()),
+        )
+        conn.executemany(
+            "INSERT INTO tag_counts VALUES (?, ?, ?, ?)",
+            [(sheet_name, month, tag, count) for tag, count in tag_counts.items()],
+        )
+        conn.executemany(
+            "INSERT INTO category_tags VALUES (?, ?, ?, ?, ?)",
+            [
+                (sheet_name, month, category, tag, count)
+                for category, tags in category_counts.items()
+                for tag, count in tags.items()
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO company_flags VALUES (?, ?, ?, ?)",
+            [(sheet_name, month, company, category) for company, category in flagged.index],
+        )
+
+
+def read_sheet_aggregates(conn, sheet_name):
+    """저장된 시트 집계를 AnalysisResult로 반환합니다. 없으면 None."""
+    row = conn.execute(
+        "SELECT total_consultations FROM sheets WHERE sheet = ?", (sheet_name,)
+    ).fetchone()
+    if row is None:
+        return None
+
+    tag_counts = dict(
+        conn.execute("SELECT tag, count FROM tag_counts WHERE sheet = ?", (sheet_name,))
+    )
+    # 태그가 없는 카테고리도 빈 dict로 포함 (categorize_tags_advanced와 같은 형태)
+    category_counts = categorize_tags_advanced({})
+    for category, tag, count in conn.execute(
+        "SELECT category, tag, count FROM category_tags WHERE sheet = ?", (sheet_name,)
+    ):
+        category_counts.setdefault(category, {})[tag] = count
+
+    company_stats = {key: 0 for key in COMPANY_CATEGORIES}
+    for category, companies in conn.execute(
+        "SELECT category, COUNT(*) FROM company_flags WHERE sheet = ? GROUP BY category",
+        (sheet_name,),
+    ):
+        company_stats[category] = companies
+
+    return AnalysisResult(
+        tag_counts=tag_counts,
+        category_counts=category_counts,
+        company_stats=company_stats,
+        total_consultations=row[0],
+    )
+
+
+def run_batch(db_path=None, sheet_names=None, force=False):
+    """상담데이터 시트를 불러와 집계 저장소를 갱신합니다.
+
+    sheet_names를 지정하지 않으면 스프레드시트의 모든 상담데이터 시트를 처리합니다.
+    내용이 바뀌지 않은 시트는 force가 아니면 다시 계산하지 않습니다.
+
+    Returns:
+        {"updated": [...], "unchanged": [...], "errors": [...]}
+    """
+    summary = {"updated": [], "unchanged": [], "errors": []}
+    spreadsheet_id = os.environ.get("SPREADSHEET_ID")
+    if not spreadsheet_id:
+        summary["errors"].append("SPREADSHEET_ID 환경변수가 설정되지 않았습니다.")
+        return summary
+
+    if not sheet_names:
+        sheet_names = list_consultation_sheets(create_service(), spreadsheet_id)
+
+    conn = connect(db_path)
+    try:
+        # 전체 시트를 한 번에 메모리에 올리지 않도록 batchGet 묶음 단위로 처리
+        batch_size = SHEETS_API_CONFIG["batch_ranges"]
+        for start in range(0, len(sheet_names), batch_size):
+            chunk = sheet_names[start:start + batch_size]
+            frames, errors = load_sheets_concurrently(
+                [(spreadsheet_id, sheet_name) for sheet_name in chunk], SHEET_COLUMNS
+            )
+            summary["errors"].extend(errors)
+
+            for (_, sheet_name), df in frames.items():
+                if df is None:
+                    summary["errors"].append(f"'{sheet_name}' 시트에 충분한 데이터가 없습니다.")
+                    continue
+                key = analysis_key(df)
+                if not force and stored_analysis_key(conn, sheet_name) == key:
+                    summary["unchanged"].append(sheet_name)
+                    continue
+                write_sheet_aggregates(conn, sheet_name, df, key)
+                summary["updated"].append(sheet_name)
+    finally:
+        conn.close()
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m analyzers.batch",
+        description="상담데이터 월별 집계를 SQLite에 저장합니다.",
+    )
+    parser.add_argument("--db", default=BATCH_CONFIG["db_path"], help="집계 저장 파일 경로")
+    parser.add_argument("--sheet", action="append", dest="sheets", help="처리할 시트 이름 (여러 번 지정 가능)")
+    parser.add_argument("--force", action="store_true", help="내용이 같아도 다시 계산")
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    started = time.monotonic()
+    summary = run_batch(args.db, args.sheets, args.force)
+
+    for error in summary["errors"]:
+        print(f"⚠️  {error}", file=sys.stderr)
+    print(
+        f"✅ 갱신 {len(summary['updated'])}개, 변경 없음 {len(summary['unchanged'])}개 "
+        f"({time.monotonic() - started:.1f}초) → {args.db}"
+    )
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
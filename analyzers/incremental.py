@@ -0,0 +1,86 @@
+"""현재 월 시트 증분 집계
+
+하루 종일 행이 추가되는 현재 월 상담데이터 시트를 매번 전부 다시 분석하지 않도록,
+마지막으로 적재한 행 위치와 누적 집계(태그 Counter, 업체별 카테고리 플래그)를
+보관하고 새로 추가된 행의 기여분만 더합니다.
+"""
+
+import threading
+from collections import Counter
+
+import numpy as np
+
+from analyzers.analysis_cache import AnalysisResult
+from analyzers.tag_analyzer import (
+    analyze_tags,
+    categorize_tags_advanced,
+    company_category_flags,
+    count_consultations,
+)
+from config import COMPANY_CATEGORIES
+
+
+class IncrementalAggregate:
+    """시트 하나의 누적 집계 상태입니다.
+
+    새 행 추가만 반영하며, 이미 적재한 행이 수정·삭제된 경우는 reset() 후
+    처음부터 다시 적재해야 합니다. 여러 세션이 공유할 수 있도록 lock을 제공합니다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """누적 상태를 비웁니다."""
+        self.headers = None
+        self.row_count = 0  # 적재한 데이터 행 수 (헤더 제외)
+        self.tag_counts = Counter()
+        self.total_consultations = 0
+        # 업체명 → COMPANY_CATEGORIES 순서의 비트마스크
+        self.company_masks = {}
+        self.company_stats = {key: 0 for key in COMPANY_CATEGORIES}
+
+    @property
+    def is_loaded(self):
+        return self.headers is not None
+
+    @property
+    def next_row(self):
+        """다음에 가져올 시트 행 번호 (1행은 헤더)."""
+        return self.row_count + 2
+
+    def ingest(self, df, headers=None):
+        """새로 추가된 행(DataFrame)의 기여분을 누적 집계에 더합니다."""
+        if headers is not None:
+            self.headers = list(headers)
+        if df.empty:
+            return
+
+        self.row_count += len(df)
+        self.tag_counts.update(analyze_tags(df))
+        self.total_consultations += count_consultations(df)
+
+        flags = company_category_flags(df)
+        keys = list(COMPANY_CATEGORIES)
+        bit_values = 1 << np.arange(len(keys))
+        masks = flags[keys].to_numpy(dtype=np.int64) @ bit_values
+        for company, mask in zip(flags.index, masks.tolist()):
+            previous = self.company_masks.get(company, 0)
+            gained = mask & ~previous
+            if not gained:
+                continue
+            self.company_masks[company] = previous | mask
+            for i, key in enumerate(keys):
+                if gained >> i & 1:
+                    self.company_stats[key] += 1
+
+    def result(self):
+        """현재 누적 집계를 AnalysisResult로 반환합니다."""
+        tag_counts = dict(self.tag_counts)
+        return AnalysisResult(
+            tag_counts=tag_counts,
+            category_counts=categorize_tags_advanced(tag_counts),
+            company_stats=dict(self.company_stats),
+            total_consultations=self.total_consultations,
+        )
@@ -0,0 +1,244 @@
+"""다중 비교 집계
+
+선택한 시트들을 sheet 열을 붙여 하나로 이어 붙인 뒤, 한 번의 처리로 시트별 상담 수,
+태그 × 시트 건수, 카테고리별 태그 건수 합계, 업체 통계를 계산합니다. 전월 대비 변화량은
+시트 축의 차분으로 한 번에 구합니다. 다중 비교 화면은 결과 객체(MultiSheetAnalysis)만
+읽습니다.
+
+모든 시트의 분석 결과가 분석 캐시에 있으면 다시 계산하지 않고 캐시된 결과로 같은 객체를
+만들며, 계산한 경우에는 시트별 결과를 분석 캐시에 저장해 단일 분석에서도 사용합니다.
+새로 분석할 시트가 많으면 한 번에 집계하는 대신 프로세스 풀에서 시트별로 병렬 분석합니다
+(analyzers.parallel).
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from analyzers import parallel
+from analyzers.analysis_cache import (
+    ANALYSIS_COLUMNS,
+    AnalysisResult,
+    analysis_key,
+    get_cached_analysis,
+    store_analysis,
+)
+from analyzers.tag_analyzer import categorize_tags_advanced, company_row_flags, explode_tags
+from analyzers.tag_matrix import CATEGORY_BITS, CATEGORY_KEYS, TagMatrix
+from config import COMPANY_CATEGORIES
+from utils import perf
+
+SHEET_COLUMN = "sheet"
+
+
+def sheet_deltas(values, require_previous=False):
+    """시트 축(첫 번째 축)의 전 시트 대비 변화량. 첫 시트는 NaN입니다.
+
+    require_previous=True이면 전 시트 값이 0인 곳도 NaN입니다.
+    """
+    values = np.asarray(values, dtype=float)
+    deltas = np.full(values.shape, np.nan)
+    deltas[1:] = values[1:] - values[:-1]
+    if require_previous:
+        deltas[1:][values[:-1] <= 0] = np.nan
+    return deltas
+
+
+def change_rates(values):
+    """시트 축의 전 시트 대비 증감률. 첫 시트와 전 시트 값이 0인 곳은 NaN입니다."""
+    values = np.asarray(values, dtype=float)
+    rates = np.full(values.shape, np.nan)
+    np.divide(values[1:] - values[:-1], values[:-1], out=rates[1:], where=values[:-1] > 0)
+    return rates
+
+
+class MultiSheetAnalysis:
+    """시트별 다중 비교 집계 결과입니다. 모든 배열·표의 시트 순서는 sheets 순서입니다.
+
+    Attributes:
+        sheets: 시트 이름 목록
+        totals: 시트별 상담 수 (int64 배열)
+        matrix: 태그 × 시트 건수 (TagMatrix)
+        category_totals: 시트 × 카테고리 키(CATEGORY_KEYS) 태그 건수 합계 DataFrame
+        company_stats: 시트 × COMPANY_CATEGORIES 키 업체 수 DataFrame
+        total_deltas: 시트별 상담 수 전 시트 대비 변화량 (첫 시트 NaN)
+        category_deltas: 카테고리 합계 변화량 (첫 시트와 전 시트 합계가 0인 곳은 NaN)
+        company_deltas, company_change_rates: 업체 수 변화량과 증감률
+    """
+
+    def __init__(self, sheets, totals, matrix, company_stats, tag_orders=None):
+        self.sheets = list(sheets)
+        self.totals = np.asarray(totals, dtype=np.int64)
+        self.matrix = matrix
+        self.company_stats = company_stats
+        # 시트별 태그가 처음 나타난 순서 (시트별 분석 결과를 단일 분석과 같은 순서로 만들 때 사용)
+        self._tag_orders = tag_orders
+
+        # 태그 × 카테고리 소속 행렬로 모든 시트·카테고리 합계를 한 번에 계산
+        membership = (matrix.category_masks[:, None] & np.array([CATEGORY_BITS[key] for key in CATEGORY_KEYS])) != 0
+        self.category_totals = pd.DataFrame(
+            matrix.counts.T @ membership.astype(np.int64),
+            index=self.sheets,
+            columns=CATEGORY_KEYS,
+        )
+
+        self.total_deltas = sheet_deltas(self.totals)
+        self.category_deltas = pd.DataFrame(
+            sheet_deltas(self.category_totals.to_numpy(), require_previous=True),
+            index=self.sheets,
+            columns=CATEGORY_KEYS,
+        )
+        self.company_deltas = pd.DataFrame(
+            sheet_deltas(company_stats.to_numpy()), index=self.sheets, columns=company_stats.columns
+        )
+        self.company_change_rates = pd.DataFrame(
+            change_rates(company_stats.to_numpy()), index=self.sheets, columns=company_stats.columns
+        )
+
+    @classmethod
+    def from_analyses(cls, analyses):
+        """{시트 이름: AnalysisResult} (시트 순서대로)로 만듭니다."""
+        sheets = list(analyses)
+        matrix = TagMatrix.from_tag_counts(
+            {sheet: result.tag_counts for sheet, result in analyses.items()}, sheets
+        )
+        company_stats = pd.DataFrame(
+            [[int(analyses[sheet].company_stats.get(key, 0)) for key in COMPANY_CATEGORIES] for sheet in sheets],
+            index=sheets,
+            columns=list(COMPANY_CATEGORIES),
+            dtype=np.int64,
+        )
+        totals = [analyses[sheet].total_consultations for sheet in sheets]
+        return cls(sheets, totals, matrix, company_stats)
+
+    def sheet_analysis(self, sheet):
+        """시트 하나의 결과를 단일 분석과 같은 AnalysisResult로 반환합니다."""
+        column = self.sheets.index(sheet)
+        counts = self.matrix.counts[:, column]
+        if self._tag_orders is None:
+            rows = np.flatnonzero(counts)
+        else:
+            rows = self._tag_orders[column]
+        tag_counts = dict(zip(self.matrix.tags[rows].tolist(), counts[rows].tolist()))
+        return AnalysisResult(
+            tag_counts=tag_counts,
+            category_counts=categorize_tags_advanced(tag_counts),
+            company_stats={key: int(value) for key, value in self.company_stats.loc[sheet].items()},
+            total_consultations=int(self.totals[column]),
+        )
+
+
+def _concat_column(frames, column):
+    """시트별 column 열을 Python 문자열 객체로 바꾸지 않고 이어 붙입니다.
+
+    모든 시트에서 범주형이면 범주를 합쳐 코드만 이어 붙이고, 아니면 Arrow 문자열로
+    이어 붙입니다. 열이 없는 시트는 결측값으로 채웁니다.
+    """
+    parts = []
+    for df in frames.values():
+        if column in df.columns:
+            parts.append(df[column])
+        else:
+            parts.append(pd.Series(pd.NA, index=range(len(df)), dtype="string[pyarrow]"))
+
+    if not parts:
+        return pd.Series(dtype="string[pyarrow]", name=column)
+    if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+        return pd.Series(union_categoricals(parts, ignore_order=True), name=column)
+    return pd.concat([part.astype("string[pyarrow]") for part in parts], ignore_index=True).rename(column)
+
+
+def concat_sheets(frames):
+    """{시트 이름: DataFrame}을 분석 열과 sheet 열(시트 순서의 범주형)만 남겨 이어 붙입니다.
+
+    문자열 열은 Arrow 문자열·범주형 dtype을 그대로 유지합니다.
+    """
+    sheets = list(frames)
+    combined = pd.DataFrame({column: _concat_column(frames, column) for column in ANALYSIS_COLUMNS})
+    combined[SHEET_COLUMN] = pd.Categorical.from_codes(
+        np.repeat(np.arange(len(sheets)), [len(df) for df in frames.values()]).astype(np.int64),
+        categories=sheets,
+    )
+    return combined
+
+
+def aggregate_frames(frames):
+    """{시트 이름: DataFrame}을 한 번에 집계한 MultiSheetAnalysis를 반환합니다."""
+    sheets = list(frames)
+    sheet_count = len(sheets)
+    combined = concat_sheets(frames)
+    sheet_codes = combined[SHEET_COLUMN].cat.codes.to_numpy(dtype=np.int64)
+
+    # 시트별 상담 수 (id가 비어 있지 않은 행)
+    ids = combined["id"]
+    valid_ids = (ids.notna() & (ids != "")).to_numpy(dtype=bool)
+    totals = np.bincount(sheet_codes[valid_ids], minlength=sheet_count)
+
+    # 태그 × 시트 건수: 한 행의 같은 태그는 1개로 세고 (시트, 태그) 조합별로 집계
+    tags = explode_tags(combined["tags"])
+    codes, vocabulary = pd.factorize(tags)
+    tag_count = len(vocabulary)
+    width = max(tag_count, 1)
+    rows = tags.index.to_numpy(dtype=np.int64)
+    first_in_row = ~pd.Index(rows * width + codes).duplicated()
+    pairs = sheet_codes[rows[first_in_row]] * width + codes[first_in_row]
+    counts = np.bincount(pairs, minlength=sheet_count * width)[: sheet_count * tag_count]
+    counts = counts.reshape(sheet_count, tag_count).T
+
+    # 시트별로 태그가 처음 나타난 순서
+    first_pairs = pairs[~pd.Index(pairs).duplicated()]
+    tag_orders = [first_pairs[first_pairs // width == column] % width for column in range(sheet_count)]
+
+    matrix = TagMatrix.from_counts(np.asarray(vocabulary, dtype=object), sheets, counts)
+
+    # 시트별 업체 통계: 행 플래그를 (시트, 업체)로 묶은 뒤 시트별로 업체 수를 셈
+    row_flags = company_row_flags(tags, len(combined))
+    companies = combined["name"]
+    valid_companies = (companies.notna() & (companies != "")).to_numpy(dtype=bool)
+    row_flags["company"] = companies.astype(str).str.strip().to_numpy()
+    row_flags[SHEET_COLUMN] = sheet_codes
+    company_stats = (
+        row_flags[valid_companies]
+        .groupby([SHEET_COLUMN, "company"], sort=False)
+        .any()
+        .groupby(level=0)
+        .sum()
+        .reindex(range(sheet_count), fill_value=0)
+        .astype(np.int64)
+    )
+    company_stats.index = sheets
+
+    return MultiSheetAnalysis(sheets, totals, matrix, company_stats, tag_orders)
+
+
+def analyze_sheets(frames):
+    """{시트 이름: DataFrame}의 다중 비교 집계를 반환합니다.
+
+    모든 시트가 분석 캐시에 있으면 캐시된 결과를 씁니다. 없는 시트가 PARALLEL_CONFIG의
+    min_sheets개 이상이면 그 시트들만 프로세스 풀에서 병렬 분석하고, 그보다 적으면 전체를
+    한 번에 집계합니다. 새로 분석한 시트의 결과는 캐시에 저장합니다.
+    """
+    with perf.timed("analyze_sheets", sheets=len(frames), rows=sum(len(df) for df in frames.values())) as record:
+        keys = {sheet: analysis_key(df) for sheet, df in frames.items()}
+        cached = {sheet: get_cached_analysis(key) for sheet, key in keys.items()}
+        if all(result is not None for result in cached.values()):
+            record["cache"] = "hit"
+            return MultiSheetAnalysis.from_analyses(cached)
+
+        record["cache"] = "miss"
+        missing = {sheet: frames[sheet] for sheet, result in cached.items() if result is None}
+        if parallel.is_enabled(len(missing)):
+            computed = parallel.analyze_frames(missing)
+            if computed is not None:
+                record["parallel"] = len(computed)
+                for sheet, result in computed.items():
+                    store_analysis(keys[sheet], result)
+                return MultiSheetAnalysis.from_analyses(
+                    {sheet: cached[sheet] or computed[sheet] for sheet in frames}
+                )
+
+        analysis = aggregate_frames(frames)
+        for sheet, result in cached.items():
+            if result is None:
+                store_analysis(keys[sheet], analysis.sheet_analysis(sheet))
+        return analysis
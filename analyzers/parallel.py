@@ -0,0 +1,114 @@
+"""프로세스 풀 시트 분석
+
+여러 달을 비교할 때 시트별 분석(태그 집계, 카테고리 분류, 업체 통계)을 GIL에 묶이지 않도록
+별도 프로세스에서 병렬로 실행합니다. 작업 프로세스는 spawn 방식으로 한 번 띄워 모든 세션이
+함께 쓰며, 시트는 분석 열만 Arrow IPC 스트림 바이트로 직렬화해 넘깁니다 (object 열을 pickle하지
+않음). 결과는 AnalysisResult(작은 dict 묶음)로 돌아옵니다.
+
+작업 프로세스 수는 PARALLEL_CONFIG["workers"]이며 1 이하이면 병렬 실행을 쓰지 않습니다.
+"""
+
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pyarrow as pa
+
+from analyzers.analysis_cache import ANALYSIS_COLUMNS, run_analysis
+from config import PARALLEL_CONFIG
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def is_enabled(sheet_count):
+    """시트 수가 병렬 분석을 쓸 만큼 많은지 확인합니다."""
+    return PARALLEL_CONFIG["workers"] > 1 and sheet_count >= PARALLEL_CONFIG["min_sheets"]
+
+
+def to_ipc(df):
+    """분석 열만 Arrow IPC 스트림 바이트로 직렬화합니다 (dtype 정보 포함)."""
+    columns = [column for column in ANALYSIS_COLUMNS if column in df.columns]
+    table = pa.Table.from_pandas(df[columns], preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def from_ipc(payload):
+    """to_ipc 바이트를 DataFrame으로 복원합니다."""
+    return pa.ipc.open_stream(payload).read_all().to_pandas()
+
+
+def _analyze_payload(payload):
+    """작업 프로세스에서 시트 하나를 분석합니다."""
+    return run_analysis(from_ipc(payload))
+
+
+def _warm_worker():
+    """작업 프로세스가 분석 모듈을 미리 불러오도록 하는 빈 작업입니다."""
+    return True
+
+
+def get_executor():
+    """공유 프로세스 풀을 반환합니다 (처음 호출할 때 생성)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=PARALLEL_CONFIG["workers"],
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def start_workers():
+    """작업 프로세스를 미리 띄웁니다 (기다리지 않음). 첫 분석 요청이 프로세스 시작을 기다리지 않게 합니다."""
+    if PARALLEL_CONFIG["workers"] <= 1:
+        return None
+    executor = get_executor()
+    for _ in range(PARALLEL_CONFIG["workers"]):
+        executor.submit(_warm_worker)
+    return executor
+
+
+def shutdown():
+    """프로세스 풀을 종료합니다. 다음 요청 때 새로 만듭니다."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def analyze_frames(frames):
+    """{시트 이름: DataFrame}을 프로세스 풀에서 병렬로 분석해 {시트 이름: AnalysisResult}를 반환합니다.
+
+    병렬로 분석할 수 없으면 None을 반환하며, 호출하는 쪽은 현재 프로세스에서 분석합니다.
+    작업 프로세스가 비정상 종료되면 다음 요청 때 풀을 새로 만들도록 정리합니다.
+    """
+    try:
+        payloads = {sheet: to_ipc(df) for sheet, df in frames.items()}
+    except (pa.ArrowException, TypeError, ValueError):
+        # 여러 타입이 섞인 object 열 등 Arrow로 직렬화할 수 없는 시트
+        return None
+
+    futures = {}
+    try:
+        executor = get_executor()
+        futures = {sheet: executor.submit(_analyze_payload, payload) for sheet, payload in payloads.items()}
+        return {sheet: future.result() for sheet, future in futures.items()}
+    except BrokenProcessPool:
+        shutdown()
+        return None
+    except Exception:
+        # 작업 프로세스에서 난 오류는 현재 프로세스에서 다시 분석해 그대로 드러나게 함
+        for future in futures.values():
+            future.cancel()
+        return None
+
+
+atexit.register(shutdown)
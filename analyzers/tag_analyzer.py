@@ -1,7 +1,21 @@
 """태그 분석 로직"""
 
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
-from collections import Counter
+import pyarrow as pa
+
+from config import (
+    COMPANY_CATEGORIES,
+    COMPANY_PRODUCT_PREFIXES,
+    TAG_CATEGORIES,
+    TAG_PREFIX_ALIASES,
+    TAG_SUBCATEGORY_MATCH,
+)
+from utils.perf import timed_function
+
+OTHER_CATEGORY = "기타"
 
 
 def parse_tags(tag_string):
@@ -11,126 +25,173 @@ def parse_tags(tag_string):
     return [tag.strip() for tag in str(tag_string).split(",") if tag.strip()]
 
 
+def explode_tags(tag_series):
+    """태그 열을 행 위치(0부터)를 인덱스로 갖는 개별 태그 Series로 펼칩니다.
+
+    parse_tags와 동일하게 빈 값과 공백뿐인 태그는 제외합니다.
+    """
+    tag_series = tag_series.set_axis(pd.RangeIndex(len(tag_series)))
+    tag_series = tag_series[tag_series.notna()]
+    tag_series = tag_series[tag_series.astype(bool)]
+
+    # Arrow 문자열 열은 Python 문자열 객체를 만들지 않고 그대로 Arrow 연산으로 넘김
+    tags = (
+        tag_series.astype(str)
+        .astype(pd.ArrowDtype(pa.string()))
+        .str.split(",")
+        .explode()
+        .str.strip()
+    )
+    return tags[tags != ""]
+
+
+def count_consultations(df, id_column="id"):
+    """id가 비어 있지 않은 상담 건수를 반환합니다."""
+    if id_column not in df.columns:
+        return 0
+    ids = df[id_column]
+    return int((ids.notna() & (ids != "")).sum())
+
+
+@timed_function("analyze_tags", rows=lambda df, *args, **kwargs: len(df))
 def analyze_tags(df, tag_column="tags"):
-    """태그 열을 분석하여 각 태그별 개수를 반환합니다."""
+    """태그 열을 분석하여 각 태그별 개수를 반환합니다.
+
+    행 단위 루프 대신 문자열 연산(분리 → 펼치기 → 공백 제거 → 행별 중복 제거 →
+    집계)으로 처리하며, 한 행에 같은 태그가 여러 번 있어도 1개로 셉니다.
+    """
     if tag_column not in df.columns:
         return {}
 
-    tag_counts = Counter()
-    for tag_string in df[tag_column]:
-        unique_tags = set(parse_tags(tag_string))
-        for tag in unique_tags:
-            tag_counts[tag] += 1
+    tags = explode_tags(df[tag_column])
+    if tags.empty:
+        return {}
+
+    # (행 위치, 태그) 조합으로 행별 중복 제거
+    codes, _ = pd.factorize(tags)
+    row_tag_keys = tags.index.to_numpy(dtype=np.int64) * (codes.max() + 1) + codes
+    tags = tags[~pd.Index(row_tag_keys).duplicated()]
+
+    return {tag: int(count) for tag, count in tags.value_counts(sort=False).items()}
+
+
+@lru_cache(maxsize=1)
+def _tag_rule_index():
+    """TAG_CATEGORIES 키로부터 대분류별 분류 규칙 색인을 만듭니다.
+
+    키 형식은 "{대분류}_상담태그" 또는 "{대분류}_{중분류}_상담태그"이며,
+    대분류 → (대분류 전체 키, ((중분류, 키), ...)) 형태로 반환합니다.
+    """
+    rules = {}
+    for key, _ in TAG_CATEGORIES:
+        product, *subcategory = key.split("_")[:-1]
+        rule = rules.setdefault(product, {"all": None, "subcategories": []})
+        if subcategory:
+            rule["subcategories"].append(("_".join(subcategory), key))
+        else:
+            rule["all"] = key
+
+    index = {
+        product: (rule["all"], tuple(rule["subcategories"]))
+        for product, rule in rules.items()
+    }
+    for alias, product in TAG_PREFIX_ALIASES.items():
+        if product in index:
+            index[alias] = index[product]
+    return index
+
+
+def is_product_category(key):
+    """중분류 없이 대분류 전체를 모으는 카테고리 키인지 확인합니다."""
+    return any(all_key == key for all_key, _ in _tag_rule_index().values())
+
 
-    return dict(tag_counts)
+def _matches_subcategory(subcategory, parts):
+    """태그 분류(parts)가 중분류 규칙에 해당하는지 확인합니다."""
+    match = TAG_SUBCATEGORY_MATCH.get(subcategory, "contains")
+    if match == "exact_or_next":
+        return parts[1] == subcategory or (len(parts) > 2 and parts[2] == subcategory)
+    return subcategory in parts[1]
 
 
+@lru_cache(maxsize=65536)
+def classify(tag):
+    """태그가 속하는 카테고리 키 집합을 반환합니다.
+
+    대분류가 규칙에 없으면 {"기타"}를 반환합니다. 중분류는 TAG_CATEGORIES
+    순서대로 첫 번째로 일치하는 것 하나만 인정합니다.
+    """
+    parts = tag.split("/")
+    rule = _tag_rule_index().get(parts[0]) if len(parts) >= 2 else None
+    if rule is None:
+        return frozenset([OTHER_CATEGORY])
+
+    all_key, subcategories = rule
+    keys = [all_key] if all_key else []
+    for subcategory, key in subcategories:
+        if _matches_subcategory(subcategory, parts):
+            keys.append(key)
+            break
+
+    return frozenset(keys or [OTHER_CATEGORY])
+
+
+@timed_function("categorize_tags_advanced", rows=lambda tag_counts: len(tag_counts))
 def categorize_tags_advanced(tag_counts):
     """태그를 대분류, 중분류에 따라 세분화하여 분류합니다."""
-    categories = {
-        "리뷰_상담태그": {},
-        "리뷰_요청사항_상담태그": {},
-        "리뷰_도입문의_상담태그": {},
-        "리뷰_기능문의_상담태그": {},
-        "업셀_상담태그": {},
-        "업셀_요청사항_상담태그": {},
-        "업셀_도입문의_상담태그": {},
-        "업셀_기능문의_상담태그": {},
-        "푸시_상담태그": {},
-        "푸시_요청사항_상담태그": {},
-        "푸시_도입문의_상담태그": {},
-        "푸시_기능문의_상담태그": {},
-        "기타": {},
-    }
+    categories = {key: {} for key, _ in TAG_CATEGORIES}
+    categories[OTHER_CATEGORY] = {}
 
     for tag, count in tag_counts.items():
-        if "/" not in tag:
-            categories["기타"][tag] = count
-            continue
-
-        parts = tag.split("/")
-        if len(parts) < 2:
-            categories["기타"][tag] = count
-            continue
-
-        first_category = parts[0]
-        second_category = parts[1]
-        third_category = parts[2] if len(parts) > 2 else ""
-
-        is_intro = "도입문의" in second_category
-        is_request = "요청사항" in second_category
-        is_function = second_category == "기능문의" or third_category == "기능문의"
-
-        if first_category in ["리뷰", "리뷰목록"]:
-            categories["리뷰_상담태그"][tag] = count
-            if is_request:
-                categories["리뷰_요청사항_상담태그"][tag] = count
-            elif is_intro:
-                categories["리뷰_도입문의_상담태그"][tag] = count
-            elif is_function:
-                categories["리뷰_기능문의_상담태그"][tag] = count
-
-        elif first_category == "업셀":
-            categories["업셀_상담태그"][tag] = count
-            if is_request:
-                categories["업셀_요청사항_상담태그"][tag] = count
-            elif is_intro:
-                categories["업셀_도입문의_상담태그"][tag] = count
-            elif is_function:
-                categories["업셀_기능문의_상담태그"][tag] = count
-
-        elif first_category == "푸시":
-            categories["푸시_상담태그"][tag] = count
-            if is_request:
-                categories["푸시_요청사항_상담태그"][tag] = count
-            elif is_intro:
-                categories["푸시_도입문의_상담태그"][tag] = count
-            elif is_function:
-                categories["푸시_기능문의_상담태그"][tag] = count
-
-        else:
-            categories["기타"][tag] = count
+        for key in classify(tag):
+            categories[key][tag] = count
 
     return categories
 
 
-def analyze_company_stats(df, tag_column="tags", company_column="name"):
-    """대분류별 업체 수를 계산합니다."""
+def company_row_flags(tags, row_count):
+    """펼친 태그(explode_tags 결과)로 행마다 업체 통계 카테고리 해당 여부를 계산합니다.
+
+    행 위치(0부터)를 인덱스, COMPANY_CATEGORIES 키를 열로 갖는 bool DataFrame을 반환합니다.
+    """
+    tag_rows = tags.index.to_numpy()
+
+    product_masks = {}
+    for product, prefix in COMPANY_PRODUCT_PREFIXES.items():
+        mask = np.zeros(row_count, dtype=bool)
+        mask[tag_rows[tags.str.startswith(prefix).to_numpy(dtype=bool)]] = True
+        product_masks[product] = mask
+
+    # 조합(리뷰&업셀 등)은 한 행에서 동시에 문의된 경우만 인정
+    return pd.DataFrame(
+        {
+            key: np.logical_and.reduce([product_masks[p] for p in key.split("_")])
+            for key in COMPANY_CATEGORIES
+        }
+    )
+
+
+def company_category_flags(df, tag_column="tags", company_column="name"):
+    """업체별로 각 업체 통계 카테고리에 해당하는지 여부를 계산합니다.
+
+    행마다 대분류 보유 여부와 조합 여부를 마스크로 계산한 뒤, 업체명 기준으로
+    묶어(any) 업체명을 인덱스, COMPANY_CATEGORIES 키를 열로 갖는 bool DataFrame을
+    반환합니다.
+    """
     if tag_column not in df.columns or company_column not in df.columns:
-        return {"review": 0, "upsell": 0, "push": 0, "review_upsell": 0, 
-                "upsell_push": 0, "push_review": 0, "review_upsell_push": 0}
+        return pd.DataFrame(columns=list(COMPANY_CATEGORIES), dtype=bool)
 
-    company_sets = {
-        "review": set(), "upsell": set(), "push": set(),
-        "review_upsell": set(), "upsell_push": set(), 
-        "push_review": set(), "review_upsell_push": set()
-    }
+    row_flags = company_row_flags(explode_tags(df[tag_column]), len(df))
 
-    for _, row in df.iterrows():
-        if pd.isna(row[company_column]) or row[company_column] == "":
-            continue
-
-        company = str(row[company_column]).strip()
-        tags = parse_tags(row[tag_column])
-
-        is_review = any(tag.startswith("리뷰") for tag in tags)
-        is_upsell = any(tag.startswith("업셀") for tag in tags)
-        is_push = any(tag.startswith("푸시") for tag in tags)
-
-        if is_review:
-            company_sets["review"].add(company)
-        if is_upsell:
-            company_sets["upsell"].add(company)
-        if is_push:
-            company_sets["push"].add(company)
-
-        if is_review and is_upsell:
-            company_sets["review_upsell"].add(company)
-        if is_upsell and is_push:
-            company_sets["upsell_push"].add(company)
-        if is_push and is_review:
-            company_sets["push_review"].add(company)
-        if is_review and is_upsell and is_push:
-            company_sets["review_upsell_push"].add(company)
-
-    return {key: len(companies) for key, companies in company_sets.items()}
\ No newline at end of file
+    companies = df[company_column]
+    valid = (companies.notna() & (companies != "")).to_numpy(dtype=bool)
+    row_flags["company"] = companies.astype(str).str.strip().to_numpy()
+
+    return row_flags[valid].groupby("company", sort=False).any()
+
+
+@timed_function("analyze_company_stats", rows=lambda df, *args, **kwargs: len(df))
+def analyze_company_stats(df, tag_column="tags", company_column="name"):
+    """대분류별 업체 수를 계산합니다."""
+    counts = company_category_flags(df, tag_column, company_column).sum()
+    return {key: int(counts.get(key, 0)) for key in COMPANY_CATEGORIES}
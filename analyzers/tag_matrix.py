@@ -0,0 +1,95 @@
+"""태그 × 시트 건수 행렬
+
+다중 비교에서 카테고리마다 전체 태그 × 시트를 dict로 조회하지 않도록, 시트별 태그 집계를
+한 번만 행렬로 옮겨 둡니다. 태그는 어휘(vocabulary)에 등록한 순번으로 행을 갖고,
+태그마다 속한 카테고리를 비트마스크로 기록하여 카테고리별 비교 테이블, 변화량,
+추이 차트 입력을 행렬 슬라이싱으로 만듭니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+from analyzers.tag_analyzer import OTHER_CATEGORY, classify
+from config import TAG_CATEGORIES
+
+# 카테고리 비트 순서 (TAG_CATEGORIES 순서, 마지막이 기타)
+CATEGORY_KEYS = [key for key, _ in TAG_CATEGORIES] + [OTHER_CATEGORY]
+CATEGORY_BITS = {key: 1 << i for i, key in enumerate(CATEGORY_KEYS)}
+
+
+class TagMatrix:
+    """태그 × 시트 건수 행렬과 태그별 카테고리 비트마스크입니다.
+
+    Attributes:
+        tags: 태그 이름 배열 (행 순서, 처음 등장한 순)
+        sheets: 시트 이름 목록 (열 순서)
+        counts: (태그 수, 시트 수) int64 건수 행렬
+        category_masks: 태그별 CATEGORY_BITS 비트마스크 (int64)
+    """
+
+    def __init__(self, tags, sheets, counts, category_masks):
+        self.tags = tags
+        self.sheets = list(sheets)
+        self.counts = counts
+        self.category_masks = category_masks
+
+    @classmethod
+    def from_tag_counts(cls, tag_counts_by_sheet, sheets):
+        """{시트 이름: {태그: 건수}}로 행렬을 만듭니다.
+
+        sheets 순서대로 열을 만들며, 집계가 없는 시트의 열은 0입니다.
+        """
+        vocabulary = {}
+        for sheet in sheets:
+            for tag in tag_counts_by_sheet.get(sheet, {}):
+                vocabulary.setdefault(tag, len(vocabulary))
+
+        counts = np.zeros((len(vocabulary), len(sheets)), dtype=np.int64)
+        for column, sheet in enumerate(sheets):
+            tag_counts = tag_counts_by_sheet.get(sheet, {})
+            if tag_counts:
+                rows = np.fromiter(
+                    (vocabulary[tag] for tag in tag_counts), dtype=np.int64, count=len(tag_counts)
+                )
+                counts[rows, column] = np.fromiter(
+                    tag_counts.values(), dtype=np.int64, count=len(tag_counts)
+                )
+
+        return cls.from_counts(np.array(list(vocabulary), dtype=object), sheets, counts)
+
+    @classmethod
+    def from_counts(cls, tags, sheets, counts):
+        """태그 이름 배열과 (태그 수, 시트 수) 건수 행렬로 만들며, 카테고리 비트마스크를 계산합니다."""
+        category_masks = np.fromiter(
+            (sum(CATEGORY_BITS[key] for key in classify(tag)) for tag in tags),
+            dtype=np.int64,
+            count=len(tags),
+        )
+        return cls(tags, sheets, counts, category_masks)
+
+    def category_rows(self, key):
+        """카테고리에 속하는 태그의 행 번호 배열을 반환합니다."""
+        return np.flatnonzero(self.category_masks & CATEGORY_BITS[key])
+
+    def category_totals(self, key):
+        """카테고리의 시트별 태그 건수 합계 배열을 반환합니다."""
+        return self.counts[self.category_rows(key)].sum(axis=0)
+
+    def category_frame(self, key):
+        """카테고리 비교용 DataFrame을 반환합니다.
+
+        열은 "태그"(원래 태그 이름), 시트별 건수, "변화량"(시트 간 최댓값 - 최솟값)이며,
+        변화량이 큰 순으로 정렬되어 있습니다.
+        """
+        rows = self.category_rows(key)
+        counts = self.counts[rows]
+        if len(self.sheets):
+            spread = counts.max(axis=1) - counts.min(axis=1)
+        else:
+            spread = np.zeros(len(rows), dtype=np.int64)
+        order = np.argsort(-spread, kind="stable")
+
+        df = pd.DataFrame(counts[order], columns=self.sheets)
+        df.insert(0, "태그", self.tags[rows][order])
+        df["변화량"] = spread[order]
+        return df
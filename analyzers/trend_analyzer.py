@@ -0,0 +1,138 @@
+"""월별 태그 추이 분석
+
+태그 × 월 건수 행렬(TagMatrix.counts, 열이 시간 순서)에서 전월 대비 증감률, 이동 평균,
+z-score 급증 감지, 추세 기울기를 한 번에 벡터 연산으로 계산합니다.
+개월 수와 태그 수가 많아도 태그별 반복 없이 행렬 연산만 사용합니다.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from config import TREND_CONFIG
+
+_MONTH_PATTERN = re.compile(r"(\d{2}|\d{4})\s*[-./년_]\s*(\d{1,2})")
+
+
+def sheet_month(sheet_name):
+    """시트 이름에서 "YYYY-MM" 형식의 월을 찾습니다. 찾지 못하면 시트 이름을 그대로 반환합니다."""
+    match = _MONTH_PATTERN.search(sheet_name)
+    if not match:
+        return sheet_name
+    year, month = match.groups()
+    if len(year) == 2:
+        year = f"20{year}"
+    return f"{year}-{int(month):02d}"
+
+
+def sheet_order_key(sheet_name):
+    """시트를 시간 순서로 정렬하는 키.
+
+    월을 찾은 시트는 월 순서로 앞에, 월을 찾지 못한 시트는 그 뒤에 이름 순서로 둡니다
+    (sheet_month가 돌려주는 시트 이름과 "YYYY-MM"이 섞여 정렬되지 않도록).
+    """
+    month = sheet_month(sheet_name)
+    if month == sheet_name:
+        return (1, sheet_name)
+    return (0, month, sheet_name)
+
+
+def month_over_month(counts):
+    """월별 전월 대비 증감률 행렬 (태그 × (개월 수 - 1)).
+
+    전월 건수가 0이면 NaN입니다.
+    """
+    counts = np.asarray(counts, dtype=float)
+    previous = counts[:, :-1]
+    return np.divide(
+        counts[:, 1:] - previous,
+        previous,
+        out=np.full(previous.shape, np.nan),
+        where=previous > 0,
+    )
+
+
+def rolling_mean(counts, window=None):
+    """월별 이동 평균 행렬 (태그 × 개월 수).
+
+    앞쪽 window - 1개월은 있는 달만으로 평균을 냅니다.
+    """
+    window = window or TREND_CONFIG["rolling_window"]
+    counts = np.asarray(counts, dtype=float)
+    cumulative = np.cumsum(counts, axis=1)
+    shifted = np.zeros_like(cumulative)
+    shifted[:, window:] = cumulative[:, :-window]
+    periods = np.minimum(np.arange(1, counts.shape[1] + 1), window)
+    return (cumulative - shifted) / periods
+
+
+def tag_trends(matrix, window=None):
+    """태그별 최근 추이 지표 DataFrame을 반환합니다.
+
+    matrix는 TagMatrix이며 시트 열이 시간 순서라고 가정합니다. 열:
+        tag             태그 이름
+        latest          마지막 달 건수
+        previous        전월 건수
+        peak            전체 기간 최대 건수
+        change          전월 대비 증감 건수
+        growth          전월 대비 증감률 (전월 0건이면 NaN)
+        rolling_mean    마지막 달 기준 이동 평균
+        zscore          마지막 달이 이전 달들의 평균에서 떨어진 정도 (이전 달 편차가 0이면 NaN)
+        spike           zscore가 spike_zscore 이상이고 마지막 달이 min_count 이상
+        slope           전체 기간 최소제곱 추세 기울기 (월당 건수)
+    """
+    counts = matrix.counts.astype(float)
+    tag_count, month_count = counts.shape
+    nan_column = np.full(tag_count, np.nan)
+
+    if month_count == 0:
+        latest = previous = peak = change = growth = rolling = zscore = slope = nan_column
+    else:
+        latest = counts[:, -1]
+        peak = counts.max(axis=1)
+        rolling = rolling_mean(counts, window)[:, -1]
+        if month_count >= 2:
+            previous = counts[:, -2]
+            change = latest - previous
+            growth = month_over_month(counts[:, -2:])[:, 0]
+
+            history = counts[:, :-1]
+            mean = history.mean(axis=1)
+            std = history.std(axis=1)
+            zscore = np.divide(latest - mean, std, out=nan_column.copy(), where=std > 0)
+
+            offsets = np.arange(month_count) - (month_count - 1) / 2
+            slope = counts @ offsets / (offsets @ offsets)
+        else:
+            previous = change = growth = zscore = slope = nan_column
+
+    spike = (zscore >= TREND_CONFIG["spike_zscore"]) & (latest >= TREND_CONFIG["min_count"])
+    return pd.DataFrame(
+        {
+            "tag": matrix.tags,
+            "latest": latest,
+            "previous": previous,
+            "peak": peak,
+            "change": change,
+            "growth": growth,
+            "rolling_mean": rolling,
+            "zscore": zscore,
+            "spike": spike,
+            "slope": slope,
+        }
+    )
+
+
+def rising_tags(trends, limit=None):
+    """추세가 오르는 태그를 기울기가 큰 순으로 반환합니다 (마지막 달 min_count 이상)."""
+    limit = limit or TREND_CONFIG["top_n"]
+    candidates = trends[(trends["slope"] > 0) & (trends["latest"] >= TREND_CONFIG["min_count"])]
+    return candidates.sort_values(["slope", "change"], ascending=False, kind="stable").head(limit)
+
+
+def declining_tags(trends, limit=None):
+    """추세가 내려가는 태그를 기울기가 작은 순으로 반환합니다 (기간 중 최대 min_count 이상)."""
+    limit = limit or TREND_CONFIG["top_n"]
+    candidates = trends[(trends["slope"] < 0) & (trends["peak"] >= TREND_CONFIG["min_count"])]
+    return candidates.sort_values(["slope", "change"], kind="stable").head(limit)
@@ -0,0 +1 @@
+"""성능 측정 (python -m benchmarks.run)"""
@@ -0,0 +1,110 @@
+"""가짜 Sheets API로 로딩·캐시·동시성 전체 경로 측정
+
+합성 월별 시트를 가짜 API(SHEETS_BACKEND=fake) 디렉터리에 만들고, 실제 앱과 같은 경로
+(스냅샷 확인 → batchGet → DataFrame 변환 → 분석 캐시)로 불러오는 시간을 잽니다.
+
+    python -m benchmarks.end_to_end [--months 12] [--rows 10000] [--sessions 8]
+                                    [--latency-ms 200] [--error-rate 0.0]
+
+측정 단계:
+    cold        스냅샷이 없는 상태에서 전체 시트 로드
+    warm        재확인 주기 안의 스냅샷으로 로드 (API 호출 없음)
+    revalidate  재확인 주기가 지나 서명 열(A열, id·name·tags)만 확인하고 스냅샷 사용
+    sessions    여러 세션이 동시에 전체 시트를 로드·분석 (세션별 지연 시간 p50/p95)
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _configure(args):
+    """config를 불러오기 전에 가짜 API와 임시 캐시 경로를 환경 변수로 지정합니다."""
+    work_dir = tempfile.mkdtemp(prefix="sheets-e2e-")
+    os.environ.update(
+        {
+            "SHEETS_BACKEND": "fake",
+            "SPREADSHEET_ID": "local",
+            "FAKE_SHEETS_DIR": os.path.join(work_dir, "sheets"),
+            "FAKE_SHEETS_LATENCY_MS": str(args.latency_ms),
+            "FAKE_SHEETS_ERROR_RATE": str(args.error_rate),
+            "SNAPSHOT_CACHE_DIR": os.path.join(work_dir, "snapshots"),
+        }
+    )
+    return work_dir
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.end_to_end",
+        description="가짜 Sheets API로 시트 로딩·캐시·동시 세션 성능을 측정합니다.",
+    )
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--sessions", type=int, default=8, help="동시 세션 수")
+    parser.add_argument("--latency-ms", type=float, default=200, help="가짜 API 요청당 지연 시간")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="가짜 API 429 응답 비율 (0~1)")
+    args = parser.parse_args(argv)
+
+    work_dir = _configure(args)
+
+    from analyzers.analysis_cache import analyze_sheet
+    from benchmarks.synthetic import write_fake_spreadsheet
+    from config import SHEET_COLUMNS, SNAPSHOT_CONFIG
+    from services.fake_sheets import request_count
+    from services.sheets_service import load_sheets_concurrently
+
+    sheet_names = write_fake_spreadsheet(os.environ["FAKE_SHEETS_DIR"], args.months, args.rows)
+    refs = [("local", sheet_name) for sheet_name in sheet_names]
+    print(
+        f"{args.months}개월 × {args.rows:,}행, 지연 {args.latency_ms:g}ms, "
+        f"429 비율 {args.error_rate:g}, 작업 디렉터리 {work_dir}"
+    )
+
+    def load_all():
+        frames, errors = load_sheets_concurrently(refs, SHEET_COLUMNS, share=True)
+        for df in frames.values():
+            if df is not None:
+                analyze_sheet(df)
+        return errors
+
+    def timed(label, func):
+        before = request_count()
+        started = time.perf_counter()
+        errors = func()
+        elapsed = time.perf_counter() - started
+        print(f"{label:<12}{elapsed * 1000:>10.0f}ms  요청 {request_count() - before:>4}건  오류 {len(errors)}건")
+
+    timed("cold", load_all)
+    timed("warm", load_all)
+
+    revalidate_seconds = SNAPSHOT_CONFIG["revalidate_seconds"]
+    SNAPSHOT_CONFIG["revalidate_seconds"] = 0
+    try:
+        timed("revalidate", load_all)
+    finally:
+        SNAPSHOT_CONFIG["revalidate_seconds"] = revalidate_seconds
+
+    def session():
+        started = time.perf_counter()
+        errors = load_all()
+        return time.perf_counter() - started, errors
+
+    def run_sessions():
+        with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+            results = list(pool.map(lambda _: session(), range(args.sessions)))
+        latencies = sorted(latency for latency, _ in results)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"  세션별 p50 {statistics.median(latencies) * 1000:.0f}ms, p95 {p95 * 1000:.0f}ms")
+        return [error for _, errors in results for error in errors]
+
+    timed(f"sessions×{args.sessions}", run_sessions)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
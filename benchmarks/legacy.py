@@ -0,0 +1,60 @@
+"""벡터화 이전 분석 구현 (기준 구현)
+
+iterrows로 작성했던 이전 analyze_company_stats입니다. 앱에서는 쓰지 않으며, 벤치마크
+(benchmarks.run)의 속도 비교와 tests/의 결과 일치 확인에만 사용합니다.
+
+이전 로더는 object 열을 만들었으므로, Arrow 문자열·범주형 열은 object로 바꾸고 결측값
+(pd.NA)은 None으로 바꿔 이전과 같은 입력으로 실행합니다.
+"""
+
+import pandas as pd
+
+from analyzers.tag_analyzer import parse_tags
+
+
+def _as_object(values):
+    values = values.astype(object)
+    return values.where(values.notna(), None)
+
+
+def legacy_analyze_company_stats(df, tag_column="tags", company_column="name"):
+    """iterrows로 행마다 대분류를 판별해 대분류별 업체 수를 계산합니다."""
+    if tag_column not in df.columns or company_column not in df.columns:
+        return {"review": 0, "upsell": 0, "push": 0, "review_upsell": 0,
+                "upsell_push": 0, "push_review": 0, "review_upsell_push": 0}
+
+    df = _as_object(df[[tag_column, company_column]])
+    company_sets = {
+        "review": set(), "upsell": set(), "push": set(),
+        "review_upsell": set(), "upsell_push": set(),
+        "push_review": set(), "review_upsell_push": set()
+    }
+
+    for _, row in df.iterrows():
+        if pd.isna(row[company_column]) or row[company_column] == "":
+            continue
+
+        company = str(row[company_column]).strip()
+        tags = parse_tags(row[tag_column])
+
+        is_review = any(tag.startswith("리뷰") for tag in tags)
+        is_upsell = any(tag.startswith("업셀") for tag in tags)
+        is_push = any(tag.startswith("푸시") for tag in tags)
+
+        if is_review:
+            company_sets["review"].add(company)
+        if is_upsell:
+            company_sets["upsell"].add(company)
+        if is_push:
+            company_sets["push"].add(company)
+
+        if is_review and is_upsell:
+            company_sets["review_upsell"].add(company)
+        if is_upsell and is_push:
+            company_sets["upsell_push"].add(company)
+        if is_push and is_review:
+            company_sets["push_review"].add(company)
+        if is_review and is_upsell and is_push:
+            company_sets["review_upsell_push"].add(company)
+
+    return {key: len(companies) for key, companies in company_sets.items()}
@@ -0,0 +1,201 @@
+"""분석·로드·차트 함수 성능 측정
+
+합성 상담데이터로 주요 함수의 실행 시간, 처리량, 최대 메모리를 측정합니다.
+
+    python -m benchmarks.run [--sizes 1k,10k,100k,1m] [--repeat 3]
+                             [--json 결과.json] [--baseline 이전결과.json] [--tolerance 0.2]
+
+--baseline을 지정하면 같은 항목·행 수의 최소 시간이 기준보다 tolerance 비율 이상 느려진
+경우를 회귀로 표시하고 종료 코드 1을 반환합니다.
+
+최대 메모리는 tracemalloc으로 잰 Python 할당량이며, pyarrow 메모리 풀(Arrow 문자열 연산)은
+포함되지 않습니다. 메모리 측정은 tracemalloc 부하가 시간에 섞이지 않도록 시간 측정과 따로 한 번 실행합니다.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+from analyzers.tag_analyzer import (  # noqa: E402
+    analyze_company_stats,
+    analyze_tags,
+    categorize_tags_advanced,
+    classify,
+    parse_tags,
+)
+from analyzers.multi_sheet import aggregate_frames  # noqa: E402
+from analyzers.tag_matrix import TagMatrix  # noqa: E402
+from benchmarks.legacy import legacy_analyze_company_stats  # noqa: E402
+from benchmarks.synthetic import generate_rows  # noqa: E402
+from services.sheets_service import _values_to_dataframe  # noqa: E402
+from utils.font_manager import setup_korean_font  # noqa: E402
+from visualizers.chart_creator import create_chart, create_trend_chart  # noqa: E402
+from visualizers.table_styler import top_rank_styles  # noqa: E402
+
+DEFAULT_SIZES = "1k,10k,100k,1m"
+CHART_KEY = "리뷰_상담태그"
+CHART_TITLE = "리뷰 전체 상담태그"
+TREND_MONTHS = 6
+# iterrows 기준 구현은 느려서(10만 행에 10초 이상) 이 행 수까지만 측정
+LEGACY_MAX_ROWS = 100_000
+
+
+def parse_size(text):
+    """"10k", "1m", "5000" 형식을 정수로 바꿉니다."""
+    text = text.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    if multiplier > 1:
+        text = text[:-1]
+    return int(float(text) * multiplier)
+
+
+def _cases(rows):
+    """행 수 하나에 대한 측정 항목 (이름, 처리 항목 수, 준비 함수, 측정 함수) 목록."""
+    tag_strings = [row[2] if len(row) > 2 else "" for row in rows[1:]]
+    df = _values_to_dataframe(rows)
+    tag_counts = analyze_tags(df)
+
+    # 행을 달 수만큼 나누어 추이 차트 입력을 만듦
+    chunk = -(-len(df) // TREND_MONTHS)
+    months = [f"M{i + 1}" for i in range(TREND_MONTHS)]
+    month_frames = {
+        month: df.iloc[i * chunk:(i + 1) * chunk].reset_index(drop=True)
+        for i, month in enumerate(months)
+    }
+    monthly_counts = {month: analyze_tags(month_df) for month, month_df in month_frames.items()}
+    comparison = TagMatrix.from_tag_counts(monthly_counts, months).category_frame(CHART_KEY)
+    chart_data = categorize_tags_advanced(tag_counts)[CHART_KEY]
+    comparison_counts = comparison.select_dtypes(include="number").drop(columns="변화량")
+
+    def close(fig):
+        if fig is not None:
+            plt.close(fig)
+
+    row_count = len(df)
+    cases = [
+        ("parse_tags", row_count, None, lambda: [parse_tags(tags) for tags in tag_strings]),
+        ("values_to_dataframe", row_count, None, lambda: _values_to_dataframe(rows)),
+        ("analyze_tags", row_count, None, lambda: analyze_tags(df)),
+        # 분류 캐시를 비워 처음 보는 태그를 분류하는 비용을 잼
+        ("categorize_tags_advanced", len(tag_counts), classify.cache_clear,
+         lambda: categorize_tags_advanced(tag_counts)),
+        ("analyze_company_stats", row_count, None, lambda: analyze_company_stats(df)),
+        # 같은 행을 달 수만큼 나눈 시트들을 다중 비교용으로 한 번에 집계
+        ("aggregate_frames", row_count, None, lambda: aggregate_frames(month_frames)),
+        ("create_chart", len(chart_data), None, lambda: close(create_chart(chart_data, CHART_TITLE))),
+        ("create_trend_chart", len(comparison), None,
+         lambda: close(create_trend_chart(comparison, CHART_TITLE, CHART_KEY))),
+        ("top_rank_styles", len(comparison_counts), None, lambda: top_rank_styles(comparison_counts)),
+    ]
+    if row_count <= LEGACY_MAX_ROWS:
+        # analyze_company_stats와 비교할 이전 iterrows 구현
+        cases.append(("company_stats_iterrows", row_count, None, lambda: legacy_analyze_company_stats(df)))
+    return cases
+
+
+def measure(func, setup=None, repeat=3):
+    """(실행 시간 목록(초), tracemalloc 최대 할당 바이트)를 반환합니다."""
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return timings, peak
+
+
+def run(sizes, repeat=3, seed=0):
+    """측정 결과 dict 목록을 반환하며, 진행 상황을 표로 출력합니다."""
+    results = []
+    print(f"{'항목':<26}{'행 수':>10}{'최소(ms)':>12}{'중앙(ms)':>12}{'처리량(/s)':>14}{'최대 메모리(MB)':>16}")
+    for size in sizes:
+        rows = generate_rows(size, seed)
+        for name, items, setup, func in _cases(rows):
+            timings, peak = measure(func, setup, repeat)
+            best = min(timings)
+            result = {
+                "case": name,
+                "rows": size,
+                "items": items,
+                "best_seconds": best,
+                "median_seconds": statistics.median(timings),
+                "throughput": items / best if best > 0 else None,
+                "peak_bytes": peak,
+            }
+            results.append(result)
+            print(
+                f"{name:<26}{size:>10,}{best * 1000:>12.1f}{result['median_seconds'] * 1000:>12.1f}"
+                f"{result['throughput'] or 0:>14,.0f}{peak / 1024 / 1024:>16.1f}"
+            )
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """기준 결과보다 tolerance 비율 이상 느려진 항목 설명 목록을 반환합니다."""
+    previous = {(item["case"], item["rows"]): item["best_seconds"] for item in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result["case"], result["rows"]))
+        if before and result["best_seconds"] > before * (1 + tolerance):
+            regressions.append(
+                f"{result['case']} ({result['rows']:,}행): "
+                f"{before * 1000:.1f}ms → {result['best_seconds'] * 1000:.1f}ms"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="합성 상담데이터로 분석·로드·차트 함수 성능을 측정합니다.",
+    )
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="쉼표로 구분한 행 수 (예: 1k,10k,100k,1m)")
+    parser.add_argument("--repeat", type=int, default=3, help="항목당 반복 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 판단할 느려짐 비율")
+    args = parser.parse_args(argv)
+
+    # 앱과 같은 폰트로 그리며, 한글 폰트가 없는 환경의 글리프 경고는 숨김
+    setup_korean_font()
+    warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+
+    sizes = [parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    results = run(sizes, args.repeat, args.seed)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"⚠️  느려짐: {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""합성 상담데이터 생성기
+
+실제 상담데이터 시트와 같은 모양(id, name, 쉼표로 구분한 계층형 tags)의 데이터를 만듭니다.
+태그 빈도와 업체별 상담 건수는 Zipf 분포를 따르므로 소수의 태그·업체가 대부분을 차지하고,
+같은 상담(id)이 여러 행에 걸쳐 기록되는 경우도 포함합니다.
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from services.fake_sheets import write_sheet
+from services.sheets_service import _values_to_dataframe
+
+# 대분류 → (중분류 목록, 소분류 수). 소분류가 없는 "대분류/중분류" 태그도 섞음
+_TAG_TREE = {
+    "리뷰": (["요청사항", "도입문의", "기능문의", "오류"], 60),
+    "리뷰목록": (["요청사항", "기능문의"], 15),
+    "업셀": (["요청사항", "도입문의", "기능문의"], 40),
+    "푸시": (["요청사항", "도입문의", "기능문의"], 30),
+    "결제": (["환불", "청구"], 10),
+    "계정": (["로그인", "권한"], 8),
+}
+
+
+def tag_vocabulary(seed=0):
+    """계층형 태그 어휘를 빈도 순위 순으로 섞어 반환합니다."""
+    tags = []
+    for product, (subcategories, leaf_count) in _TAG_TREE.items():
+        for subcategory in subcategories:
+            tags.append(f"{product}/{subcategory}")
+            for i in range(leaf_count):
+                tags.append(f"{product}/{subcategory}/항목{i}")
+        # 세 번째 분류가 기능문의인 태그 (예: 리뷰/위젯/기능문의)
+        tags.append(f"{product}/위젯/기능문의")
+    rng = np.random.default_rng(seed)
+    return [tags[i] for i in rng.permutation(len(tags))]
+
+
+def _zipf_choice(rng, size, population, exponent):
+    """0..population-1 중에서 순위^-exponent 비율로 size개를 뽑습니다."""
+    weights = 1.0 / np.arange(1, population + 1) ** exponent
+    return rng.choice(population, size=size, p=weights / weights.sum())
+
+
+def generate_rows(row_count, seed=0, tag_exponent=1.1, company_exponent=1.2,
+                  companies_per_row=0.1, rows_per_consultation=1.3, max_tags=4):
+    """합성 시트 행(list of list, 첫 행은 헤더)을 반환합니다.
+
+    Sheets API 응답처럼 모든 값은 문자열이고, 태그가 없는 행은 마지막 빈 칸이
+    잘려 길이가 짧습니다.
+
+    Args:
+        row_count: 데이터 행 수
+        tag_exponent: 태그 빈도 Zipf 지수 (클수록 상위 태그 쏠림)
+        company_exponent: 업체별 상담 건수 Zipf 지수
+        companies_per_row: 행 수 대비 업체 수 (업체 재방문 비율의 역수)
+        rows_per_consultation: 상담 하나가 차지하는 평균 행 수
+        max_tags: 한 행의 최대 태그 수
+    """
+    rng = np.random.default_rng(seed)
+    vocabulary = np.array(tag_vocabulary(seed), dtype=object)
+
+    consultation_count = max(1, int(row_count / rows_per_consultation))
+    ids = np.sort(rng.integers(0, consultation_count, row_count))
+
+    company_count = max(1, int(row_count * companies_per_row))
+    companies = _zipf_choice(rng, row_count, company_count, company_exponent)
+
+    tag_counts = rng.integers(0, max_tags + 1, row_count)
+    tag_ids = _zipf_choice(rng, int(tag_counts.sum()), len(vocabulary), tag_exponent)
+    tag_strings = [
+        ", ".join(tags) for tags in np.split(vocabulary[tag_ids], np.cumsum(tag_counts)[:-1])
+    ]
+
+    rows = [["id", "name", "tags"]]
+    for consultation_id, company, tags in zip(ids.tolist(), companies.tolist(), tag_strings):
+        if tags:
+            rows.append([f"C{consultation_id:07d}", f"업체{company:05d}", tags])
+        else:
+            rows.append([f"C{consultation_id:07d}", f"업체{company:05d}"])
+    return rows
+
+
+def generate_sheet(row_count, seed=0, **kwargs):
+    """합성 시트를 앱이 로드한 것과 같은 dtype의 DataFrame으로 반환합니다."""
+    return _values_to_dataframe(generate_rows(row_count, seed, **kwargs))
+
+
+def month_sheet_name(month):
+    """0부터 시작하는 달 번호의 시트 이름 (2020-01 상담데이터부터)."""
+    return f"{2020 + month // 12}-{month % 12 + 1:02d} 상담데이터"
+
+
+def generate_months(month_count, row_count, seed=0):
+    """여러 달의 시트를 {시트 이름: DataFrame}으로 반환합니다 (달마다 시드가 다름)."""
+    return {
+        month_sheet_name(month): generate_sheet(row_count, seed + month)
+        for month in range(month_count)
+    }
+
+
+def write_fake_spreadsheet(directory, month_count, row_count, seed=0):
+    """가짜 Sheets API(SHEETS_BACKEND=fake)가 읽을 월별 시트 CSV 파일을 만듭니다."""
+    names = []
+    for month in range(month_count):
+        name = month_sheet_name(month)
+        write_sheet(directory, name, generate_rows(row_count, seed + month))
+        names.append(name)
+    return names
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.synthetic",
+        description="가짜 Sheets API용 합성 상담데이터 CSV 파일을 만듭니다.",
+    )
+    parser.add_argument("directory", nargs="?", default=os.environ.get("FAKE_SHEETS_DIR", os.path.join(".cache", "fake_sheets")))
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    names = write_fake_spreadsheet(args.directory, args.months, args.rows, args.seed)
+    print(f"✅ {len(names)}개 시트 ({args.rows:,}행) → {args.directory}")
+
@@ -1,8 +1,38 @@
 """설정 상수 및 환경 변수"""
 
+import os
+
 # Google Sheets API 설정
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
+SHEETS_API_CONFIG = {
+    "batch_ranges": 10,  # batchGet 요청 한 번에 담을 최대 범위 수 (URL 길이 제한)
+    "max_workers": 4,  # 동시 로딩 스레드 수
+    "requests_per_minute": 60,  # 분당 읽기 요청 한도 (사용자당 기본 쿼터)
+    "max_retries": 5,  # 429/5xx 응답 재시도 횟수
+    "backoff_base_seconds": 1.0,
+    "backoff_max_seconds": 32.0,
+}
+
+# 데이터 소스 설정
+# "google": Google Sheets API, "fake": 로컬 CSV/Parquet 파일 (services/fake_sheets.py)
+SHEETS_SOURCE_CONFIG = {
+    "backend": os.environ.get("SHEETS_BACKEND", "google"),
+    "fake_dir": os.environ.get("FAKE_SHEETS_DIR", os.path.join(".cache", "fake_sheets")),
+    "fake_latency_seconds": float(os.environ.get("FAKE_SHEETS_LATENCY_MS", "0")) / 1000,
+    "fake_error_rate": float(os.environ.get("FAKE_SHEETS_ERROR_RATE", "0")),  # 429 응답 비율 (0~1)
+}
+
+# 분석에 필요한 시트 열 (이 열만 가져옴)
+SHEET_COLUMNS = ["id", "name", "tags"]
+
+# 메모리 절약용 열 dtype
+SHEET_COLUMN_DTYPES = {
+    "id": "string[pyarrow]",
+    "name": "category",
+    "tags": "string[pyarrow]",
+}
+
 # 태그 카테고리 설정
 TAG_CATEGORIES = [
     ("리뷰_상담태그", "리뷰 전체 상담태그"),
@@ -19,6 +49,18 @@ TAG_CATEGORIES = [
     ("푸시_기능문의_상담태그", "푸시 기능문의 상담태그"),
 ]
 
+# 태그 분류 규칙은 TAG_CATEGORIES 키("{대분류}_{중분류}_상담태그")에서 만들어집니다.
+# 대분류 별칭: 태그의 첫 번째 분류 → TAG_CATEGORIES의 대분류
+TAG_PREFIX_ALIASES = {
+    "리뷰목록": "리뷰",
+}
+
+# 중분류 판별 방식 (기본값 "contains": 두 번째 분류에 중분류명이 포함)
+# "exact_or_next": 두 번째 또는 세 번째 분류가 중분류명과 일치
+TAG_SUBCATEGORY_MATCH = {
+    "기능문의": "exact_or_next",
+}
+
 # 업체 통계 카테고리
 COMPANY_CATEGORIES = {
     "review": "리뷰",
@@ -30,6 +72,13 @@ COMPANY_CATEGORIES = {
     "review_upsell_push": "리뷰&업셀&푸시",
 }
 
+# 업체 통계 대분류별 태그 접두어 (조합 키는 "_"로 연결된 대분류 키)
+COMPANY_PRODUCT_PREFIXES = {
+    "review": "리뷰",
+    "upsell": "업셀",
+    "push": "푸시",
+}
+
 # 차트 색상 설정
 CATEGORY_COLORS = {
     "리뷰_상담태그": "#c198e1",  # R193 G152 B225
@@ -44,8 +93,88 @@ BLUE_SHADES = [
 
 # 차트 설정
 CHART_CONFIG = {
+    # "altair": 브라우저에서 렌더링, "matplotlib": 서버에서 이미지로 렌더링 (altair가 없으면 자동 사용)
+    "backend": os.environ.get("CHART_BACKEND", "altair"),
     "figsize": (12, 8),
     "trend_figsize": (10, 6),
     "max_tags_display": 50,
     "top_tags_limit": 15,
-}
\ No newline at end of file
+    "render_dpi": 200,  # 차트 이미지 해상도 (st.pyplot 기본값과 동일)
+    "render_cache_max_bytes": 64 * 1024 * 1024,  # 렌더링된 차트 이미지 캐시 한도
+}
+
+# 월별 태그 추이 분석 설정
+TREND_CONFIG = {
+    "min_count": 5,  # 추이 차트·급상승 목록에 포함할 최소 월 건수
+    "significance_keys": ["리뷰_상담태그", "리뷰_요청사항_상담태그"],  # 추이 차트에서 min_count 필터를 적용할 카테고리
+    "rolling_window": 3,  # 이동 평균 개월 수
+    "spike_zscore": 2.0,  # 마지막 달 z-score가 이 값 이상이면 급증
+    "top_n": 10,  # 급상승·하락 태그 표시 개수
+}
+
+# 시트 스냅샷 캐시 설정 (Parquet, 컨테이너 재시작 후에도 유지)
+SNAPSHOT_CONFIG = {
+    "dir": os.environ.get("SNAPSHOT_CACHE_DIR", os.path.join(".cache", "snapshots")),
+    "revalidate_seconds": 300,  # 이 시간 안에는 변경 확인 없이 스냅샷 사용
+    "max_age_days": 30,  # 생성 후 이 기간이 지나면 다시 가져옴
+    "max_bytes": 200 * 1024 * 1024,  # 전체 스냅샷 용량 한도
+    # 변경 감지 서명에 A열과 함께 넣을 열 (태그만 고쳐도 다시 가져오도록)
+    "signature_headers": ("id", "name", "tags"),
+}
+
+# 프로세스 공유 Arrow 테이블 저장소 (services/table_store.py)
+TABLE_STORE_CONFIG = {
+    # 세션이 쓰지 않는 테이블까지 포함한 메모리 한도, 넘으면 유휴 테이블부터 지움
+    "max_bytes": int(os.environ.get("TABLE_STORE_MAX_MB", "512")) * 1024 * 1024,
+}
+
+# 분석 결과 캐시 설정 (disk_dir을 지정하면 디스크에도 저장)
+ANALYSIS_CACHE_CONFIG = {
+    "max_entries": 32,
+    "disk_dir": os.environ.get("ANALYSIS_CACHE_DIR"),
+    "disk_max_age_days": 30,  # 마지막 사용 후 이 기간이 지난 디스크 캐시는 삭제
+    "disk_max_bytes": 50 * 1024 * 1024,  # 디스크 캐시 용량 한도
+}
+
+# 다중 비교 시 시트별 분석을 프로세스 풀에서 병렬 실행 (analyzers/parallel.py)
+PARALLEL_CONFIG = {
+    # 작업 프로세스 수, 1 이하이면 병렬 분석을 쓰지 않음
+    "workers": int(os.environ.get("ANALYSIS_WORKERS", str(min(4, os.cpu_count() or 1)))),
+    "min_sheets": 3,  # 새로 분석할 시트가 이보다 적으면 현재 프로세스에서 한 번에 집계
+}
+
+# 화면 렌더링 설정
+RENDER_CONFIG = {
+    "lazy_sections": True,  # 서비스별 섹션을 펼쳤을 때만 테이블·차트 렌더링
+    # 태그 테이블에 한 번에 보낼 행 수 ("더 보기"마다 이만큼 늘어남)
+    "table_page_size": int(os.environ.get("TABLE_PAGE_SIZE", "100")),
+}
+
+# 단계별 실행 시간 계측 (utils/perf.py)
+PERF_CONFIG = {
+    "enabled": os.environ.get("PERF_ENABLED", "1").lower() in ("1", "true"),
+    # 단계마다 한 줄짜리 JSON 로그를 stderr로 출력 (App Runner 로그에서 조회)
+    "json_logs": os.environ.get("PERF_JSON_LOGS", "").lower() in ("1", "true"),
+    "log_min_seconds": float(os.environ.get("PERF_LOG_MIN_SECONDS", "0")),
+}
+
+# Prometheus 지표 서버 설정 (앱 프로세스 안에서 /metrics 제공)
+METRICS_CONFIG = {
+    "enabled": os.environ.get("METRICS_ENABLED", "1").lower() in ("1", "true"),
+    "address": os.environ.get("METRICS_ADDRESS", "127.0.0.1"),  # 컨테이너 밖에서 수집하려면 0.0.0.0
+    "port": int(os.environ.get("METRICS_PORT", "9464")),
+}
+
+# 서버 시작 시 미리 불러올 최근 상담데이터 시트 설정
+WARMUP_CONFIG = {
+    "sheet_count": int(os.environ.get("WARMUP_SHEET_COUNT", "3")),
+    "timeout_seconds": 120,  # 이 시간이 지나면 기다리지 않고 앱을 시작
+    "kill_grace_seconds": 10,  # 제한 시간 뒤에도 자식 프로세스가 남아 있으면 이만큼 더 기다린 뒤 종료
+    # run_streamlit.py --warm 없이 실행할 때 앱 프로세스 안에서 백그라운드로 미리 불러오기
+    "background": os.environ.get("WARMUP_IN_BACKGROUND", "").lower() in ("1", "true"),
+}
+
+# 월별 집계 일괄 계산 (python -m analyzers.batch) 저장 경로
+BATCH_CONFIG = {
+    "db_path": os.environ.get("AGGREGATE_DB_PATH", os.path.join(".cache", "aggregates.sqlite")),
+}
@@ -1,28 +1,63 @@
 #!/usr/bin/env python3
 """
 Streamlit 앱 실행 스크립트
+
+    python run_streamlit.py [--warm] [streamlit run 옵션...]
+
+--warm을 지정하면 최근 상담데이터 시트를 스냅샷·분석 캐시에 미리 불러온 뒤 앱을 시작합니다.
+앱이 포트를 열기 전에 끝나므로 헬스 체크는 미리 불러오기가 끝난 뒤에 통과합니다. 미리
+불러오기는 잠깐 띄우는 자식 프로세스에서 실행하므로, 앱이 도는 동안 이 실행 스크립트는
+불러온 데이터를 메모리에 들고 있지 않습니다 (앱은 디스크 캐시를 사용). 자식 프로세스가
+제한 시간(WARMUP_CONFIG["timeout_seconds"])을 넘기고도 끝나지 않으면 종료시키고 앱을 시작합니다.
 """
 
 import subprocess
 import sys
 import os
 
-def run_streamlit():
+
+def warm_caches():
+    """최근 시트를 자식 프로세스에서 미리 불러옵니다 (services.warmup.warm_up_with_timeout)."""
+    from dotenv import load_dotenv
+
+    # config를 불러오기 전에 .env를 적용하도록 자식 프로세스에 환경 변수로 넘김
+    load_dotenv()
+    from config import WARMUP_CONFIG
+
+    try:
+        subprocess.run(
+            [sys.executable, "-m", "services.warmup"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            timeout=WARMUP_CONFIG["timeout_seconds"] + WARMUP_CONFIG["kill_grace_seconds"],
+        )
+    except subprocess.TimeoutExpired:
+        # subprocess.run이 자식 프로세스를 종료시킨 뒤 발생
+        print("⚠️  미리 불러오기가 끝나지 않아 종료하고 앱을 시작합니다.")
+    except Exception as e:
+        print(f"⚠️  미리 불러오기 실패: {e}")
+
+
+def run_streamlit(streamlit_args=()):
     """Streamlit 앱을 실행합니다."""
     try:
         # 현재 디렉토리에서 streamlit 실행
-        cmd = [sys.executable, "-m", "streamlit", "run", "streamlit_app.py"]
-        
+        cmd = [sys.executable, "-m", "streamlit", "run", "streamlit_app.py", *streamlit_args]
+
         print("🚀 Streamlit 앱을 시작합니다...")
         print("📱 브라우저에서 http://localhost:8501 로 접속하세요")
         print("⏹️  종료하려면 Ctrl+C를 누르세요")
-        
+
         subprocess.run(cmd, cwd=os.path.dirname(os.path.abspath(__file__)))
-        
+
     except KeyboardInterrupt:
         print("\n👋 Streamlit 앱이 종료되었습니다.")
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
 
 if __name__ == "__main__":
-    run_streamlit()
\ No newline at end of file
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    args = sys.argv[1:]
+    if "--warm" in args:
+        args.remove("--warm")
+        warm_caches()
+    run_streamlit(args)
@@ -0,0 +1,228 @@
+"""로컬 파일 기반 가짜 Sheets API
+
+실제 자격 증명과 네트워크 없이 앱을 실행하거나 부하 테스트를 할 수 있도록, 앱이 사용하는
+googleapiclient Sheets 서비스의 일부(spreadsheets.get, values.get, values.batchGet)를
+로컬 CSV/Parquet 파일로 흉내 냅니다.
+
+디렉터리 구조:
+    {디렉터리}/{시트 이름}.csv 또는 .parquet          모든 스프레드시트 ID에서 공유
+    {디렉터리}/{스프레드시트 ID}/{시트 이름}.csv       해당 스프레드시트 전용 (있으면 우선)
+
+파일의 첫 행은 헤더이며, 값은 모두 문자열로 반환합니다. 요청마다 지연 시간을 두거나
+일정 비율로 429 오류를 발생시켜 재시도·동시성 동작을 확인할 수 있습니다.
+"""
+
+import os
+import random
+import re
+import threading
+import time
+
+import httplib2
+import pandas as pd
+from googleapiclient.errors import HttpError
+
+from config import SHEETS_SOURCE_CONFIG
+
+_RANGE_PATTERN = re.compile(r"^([A-Z]*)(\d*)(?::([A-Z]*)(\d*))?$")
+_SUPPORTED_EXTENSIONS = (".parquet", ".csv")
+
+_file_cache = {}
+_file_cache_lock = threading.Lock()
+
+_request_count = 0
+_request_count_lock = threading.Lock()
+
+
+def request_count():
+    """프로세스 시작 후 가짜 API가 받은 요청 수 (부하 테스트용)."""
+    return _request_count
+
+
+def _column_index(letters):
+    """열 문자(A, B, ..., AA)를 0부터 시작하는 번호로 바꿉니다."""
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def _read_values(path):
+    """파일을 헤더 포함 문자열 행 목록으로 읽습니다 (수정 시각이 같으면 캐시 사용)."""
+    mtime = os.path.getmtime(path)
+    with _file_cache_lock:
+        cached = _file_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path).astype(object)
+        df = df.where(df.notna(), "").astype(str)
+    else:
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    values = [list(df.columns)] + df.to_numpy().tolist()
+
+    with _file_cache_lock:
+        _file_cache[path] = (mtime, values)
+    return values
+
+
+def _trim(cells):
+    """API 응답처럼 뒤쪽 빈 칸을 잘라냅니다."""
+    end = len(cells)
+    while end and cells[end - 1] == "":
+        end -= 1
+    return cells[:end]
+
+
+def write_sheet(directory, sheet_name, rows):
+    """헤더 포함 행 목록을 가짜 API가 읽는 CSV 파일로 저장합니다."""
+    os.makedirs(directory, exist_ok=True)
+    headers = rows[0]
+    df = pd.DataFrame(
+        [list(row) + [""] * (len(headers) - len(row)) for row in rows[1:]],
+        columns=headers,
+    )
+    df.to_csv(os.path.join(directory, f"{sheet_name}.csv"), index=False)
+
+
+class _Request:
+    """googleapiclient HttpRequest처럼 execute()로 실행되는 요청입니다."""
+
+    def __init__(self, service, handler, method_id):
+        self._service = service
+        self._handler = handler
+        self.methodId = method_id
+
+    def execute(self):
+        self._service.simulate_network()
+        return self._handler()
+
+
+class FakeSheetsService:
+    """로컬 파일을 읽는 Sheets v4 서비스 대역입니다.
+
+    service.spreadsheets().get(...), service.spreadsheets().values().get(...)/batchGet(...)
+    형태의 호출을 지원하며 스레드 간에 공유해도 안전합니다.
+    """
+
+    def __init__(self, directory, latency_seconds=0.0, error_rate=0.0):
+        self.directory = directory
+        self.latency_seconds = latency_seconds
+        self.error_rate = error_rate
+
+    @classmethod
+    def from_config(cls):
+        return cls(
+            SHEETS_SOURCE_CONFIG["fake_dir"],
+            SHEETS_SOURCE_CONFIG["fake_latency_seconds"],
+            SHEETS_SOURCE_CONFIG["fake_error_rate"],
+        )
+
+    def simulate_network(self):
+        """설정된 지연 시간만큼 기다리고, error_rate 확률로 429 오류를 발생시킵니다."""
+        global _request_count
+        with _request_count_lock:
+            _request_count += 1
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        if self.error_rate and random.random() < self.error_rate:
+            raise HttpError(
+                httplib2.Response({"status": 429, "reason": "Too Many Requests"}),
+                b'{"error": {"code": 429, "message": "Quota exceeded (fake)"}}',
+            )
+
+    # googleapiclient 리소스 체인 (spreadsheets() / values())
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return _FakeValues(self)
+
+    def get(self, spreadsheetId, **kwargs):
+        return _Request(self, lambda: self._spreadsheet(spreadsheetId), "sheets.spreadsheets.get")
+
+    def _sheet_paths(self, spreadsheet_id):
+        """{시트 이름: 파일 경로} (스프레드시트 전용 디렉터리의 파일이 우선)."""
+        paths = {}
+        for directory in (self.directory, os.path.join(self.directory, spreadsheet_id)):
+            try:
+                names = sorted(os.listdir(directory))
+            except OSError:
+                continue
+            for name in names:
+                stem, extension = os.path.splitext(name)
+                if extension in _SUPPORTED_EXTENSIONS:
+                    paths[stem] = os.path.join(directory, name)
+        return paths
+
+    def _spreadsheet(self, spreadsheet_id):
+        return {
+            "spreadsheetId": spreadsheet_id,
+            "sheets": [
+                {"properties": {"sheetId": i, "title": title}}
+                for i, title in enumerate(self._sheet_paths(spreadsheet_id))
+            ],
+        }
+
+    def value_range(self, spreadsheet_id, a1_range, major_dimension="ROWS"):
+        """A1 표기 범위 하나의 ValueRange 응답을 만듭니다."""
+        sheet_name, _, cells = a1_range.rpartition("!")
+        sheet_name = sheet_name.strip("'")
+        path = self._sheet_paths(spreadsheet_id).get(sheet_name)
+        if path is None:
+            raise HttpError(
+                httplib2.Response({"status": 400, "reason": "Bad Request"}),
+                f'{{"error": {{"code": 400, "message": "Unable to parse range: {a1_range}"}}}}'.encode("utf-8"),
+            )
+
+        match = _RANGE_PATTERN.match(cells.upper())
+        start_col, start_row, end_col, end_row = match.groups() if match else ("", "", "", "")
+        if not match or ":" not in cells:
+            end_col, end_row = start_col, start_row
+
+        values = _read_values(path)
+        first_row = int(start_row) - 1 if start_row else 0
+        last_row = int(end_row) if end_row else len(values)
+        first_col = _column_index(start_col) if start_col else 0
+        last_col = _column_index(end_col) + 1 if end_col else None
+
+        rows = [row[first_col:last_col] for row in values[first_row:last_row]]
+        if major_dimension == "COLUMNS":
+            width = max((len(row) for row in rows), default=0)
+            rows = [[row[i] if i < len(row) else "" for row in rows] for i in range(width)]
+
+        rows = [_trim(row) for row in rows]
+        while rows and not rows[-1]:
+            rows.pop()
+
+        response = {"range": a1_range, "majorDimension": major_dimension}
+        if rows:
+            response["values"] = rows
+        return response
+
+
+class _FakeValues:
+    """spreadsheets().values() 리소스입니다."""
+
+    def __init__(self, service):
+        self._service = service
+
+    def get(self, spreadsheetId, range, majorDimension="ROWS", **kwargs):
+        return _Request(
+            self._service,
+            lambda: self._service.value_range(spreadsheetId, range, majorDimension),
+            "sheets.spreadsheets.values.get",
+        )
+
+    def batchGet(self, spreadsheetId, ranges, majorDimension="ROWS", **kwargs):
+        def run():
+            return {
+                "spreadsheetId": spreadsheetId,
+                "valueRanges": [
+                    self._service.value_range(spreadsheetId, a1_range, majorDimension)
+                    for a1_range in ranges
+                ],
+            }
+
+        return _Request(self._service, run, "sheets.spreadsheets.values.batchGet")
@@ -1,43 +1,170 @@
 """Google Sheets API 서비스"""
+import contextvars
 import json
 import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import streamlit as st
 import pandas as pd
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
-from config import SCOPES
+from googleapiclient.errors import HttpError
+from config import SCOPES, SHEET_COLUMN_DTYPES, SHEETS_API_CONFIG, SHEETS_SOURCE_CONFIG, SNAPSHOT_CONFIG
 from dotenv import load_dotenv
+from services.fake_sheets import FakeSheetsService
+from services import table_store
+from services.snapshot_store import (
+    column_signature,
+    is_recently_checked,
+    read_snapshot,
+    read_snapshot_meta,
+    signature_letters,
+    touch_snapshot,
+    write_snapshot,
+)
+from utils import metrics, perf
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
 
 
-@st.cache_resource
-def get_google_sheets_service():
-    """Google Sheets 서비스 객체 반환"""
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class _QuotaGovernor:
+    """분당 API 요청 수를 제한합니다 (최근 60초 슬라이딩 윈도우)."""
+
+    def __init__(self, requests_per_minute):
+        self.requests_per_minute = requests_per_minute
+        self._timestamps = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """요청 가능할 때까지 대기한 뒤 요청 1건을 기록합니다."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= 60:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.requests_per_minute:
+                    self._timestamps.append(now)
+                    return
+                wait = 60 - (now - self._timestamps[0])
+            time.sleep(wait)
+
+
+_quota = _QuotaGovernor(SHEETS_API_CONFIG["requests_per_minute"])
+
+
+def _execute(request):
+    """API 요청을 실행합니다.
+
+    분당 요청 한도를 지키고, 429/5xx 응답은 지터를 둔 지수 백오프로 재시도합니다.
+    응답 본문 크기는 현재 계측 단계의 bytes로, 시도마다의 응답 코드와 소요 시간은
+    Sheets API 지표로 기록합니다.
+    """
+    method = getattr(request, "methodId", "unknown").removeprefix("sheets.spreadsheets.")
+    postproc = getattr(request, "postproc", None)
+    if postproc is not None:
+        def counting_postproc(resp, content):
+            perf.add_bytes(len(content))
+            metrics.sheets_api_bytes.inc(len(content), method=method)
+            return postproc(resp, content)
+        request.postproc = counting_postproc
+
+    max_retries = SHEETS_API_CONFIG["max_retries"]
+    for attempt in range(max_retries + 1):
+        _quota.acquire()
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = request.execute()
+            status = "200"
+            return response
+        except HttpError as e:
+            status = str(e.resp.status)
+            if e.resp.status not in RETRYABLE_STATUS_CODES or attempt == max_retries:
+                raise
+        except (ConnectionError, TimeoutError):
+            if attempt == max_retries:
+                raise
+        finally:
+            metrics.sheets_api_requests.inc(method=method, status=status)
+            metrics.sheets_api_seconds.observe(time.perf_counter() - started, method=method)
+
+        backoff = min(
+            SHEETS_API_CONFIG["backoff_max_seconds"],
+            SHEETS_API_CONFIG["backoff_base_seconds"] * 2 ** attempt,
+        )
+        time.sleep(random.uniform(0, backoff))
+
+
+def _load_service_account_info():
+    """서비스 계정 정보를 (정보, 오류 메시지)로 반환합니다."""
     google_service_account = os.environ.get("GOOGLE_SERVICE_ACCOUNT")
-    service_account_info = None
 
     if google_service_account:
         try:
-            service_account_info = json.loads(google_service_account)
+            return json.loads(google_service_account), None
         except json.JSONDecodeError:
-            st.error("GOOGLE_SERVICE_ACCOUNT 환경변수 형식이 올바르지 않습니다.")
-            return None
-    else:
-        try:
-            with open("token.json", "r") as f:
-                service_account_info = json.load(f)
-        except FileNotFoundError:
-            st.error("token.json 파일을 찾을 수 없고 GOOGLE_SERVICE_ACCOUNT 환경변수도 설정되지 않았습니다.")
-            return None
+            return None, "GOOGLE_SERVICE_ACCOUNT 환경변수 형식이 올바르지 않습니다."
+
+    try:
+        with open("token.json", "r") as f:
+            return json.load(f), None
+    except FileNotFoundError:
+        return None, "token.json 파일을 찾을 수 없고 GOOGLE_SERVICE_ACCOUNT 환경변수도 설정되지 않았습니다."
 
+
+def _build_service(service_account_info):
+    """서비스 계정 정보로 Sheets 서비스 객체를 만듭니다."""
     credentials = service_account.Credentials.from_service_account_info(
         service_account_info, scopes=SCOPES
     )
     return build("sheets", "v4", credentials=credentials)
 
 
+def _create_service():
+    """설정된 데이터 소스의 서비스 객체를 (서비스, 오류 메시지)로 반환합니다.
+
+    SHEETS_SOURCE_CONFIG["backend"]가 "fake"이면 로컬 파일을 읽는 FakeSheetsService를,
+    아니면 서비스 계정으로 Google Sheets 서비스를 만듭니다.
+    """
+    if SHEETS_SOURCE_CONFIG["backend"] == "fake":
+        return FakeSheetsService.from_config(), None
+
+    service_account_info, error = _load_service_account_info()
+    if error:
+        return None, error
+    return _build_service(service_account_info), None
+
+
+def create_service():
+    """Streamlit 밖(CLI, 미리 불러오기)에서 쓸 서비스 객체를 새로 만듭니다.
+
+    Raises:
+        RuntimeError: 서비스 계정 정보가 없거나 형식이 올바르지 않을 때
+    """
+    service, error = _create_service()
+    if error:
+        raise RuntimeError(error)
+    return service
+
+
+@st.cache_resource
+def get_google_sheets_service():
+    """Google Sheets 서비스 객체 반환"""
+    service, error = _create_service()
+    if error:
+        st.error(error)
+        return None
+
+    return service
+
+
 @st.cache_data
 def get_sheet_list(_service):
     """상담데이터 시트 목록을 조회합니다."""
@@ -50,24 +177,267 @@ def get_sheet_list(_service):
         return []
 
     try:
-        spreadsheet = _service.spreadsheets().get(
-            spreadsheetId=spreadsheet_id
-        ).execute()
-
-        sheets = []
-        for sheet in spreadsheet.get("sheets", []):
-            title = sheet.get("properties", {}).get("title")
-            if title and ("상담데이터" in title or "상담 데이터" in title):
-                sheets.append(title)
-
-        return sorted(sheets, reverse=True)
+        return list_consultation_sheets(_service, spreadsheet_id)
 
     except Exception as e:
         st.error(f"시트 목록 조회 실패: {str(e)}")
         return []
 
-def load_sheet_data(sheet_name):
-    """시트 데이터를 로드합니다."""
+
+def list_consultation_sheets(service, spreadsheet_id):
+    """상담데이터 시트 이름을 최신순(이름 역순)으로 반환합니다. 실패하면 예외가 발생합니다."""
+    spreadsheet = _execute(service.spreadsheets().get(
+        spreadsheetId=spreadsheet_id
+    ))
+
+    sheets = []
+    for sheet in spreadsheet.get("sheets", []):
+        title = sheet.get("properties", {}).get("title")
+        if title and ("상담데이터" in title or "상담 데이터" in title):
+            sheets.append(title)
+
+    return sorted(sheets, reverse=True)
+
+def _apply_column_dtypes(df):
+    """SHEET_COLUMN_DTYPES에 지정된 열을 메모리가 적은 dtype으로 변환합니다."""
+    for column, dtype in SHEET_COLUMN_DTYPES.items():
+        # 헤더가 중복된 열은 변환하지 않음
+        if column in df.columns and isinstance(df[column], pd.Series):
+            df[column] = df[column].astype(dtype)
+    return df
+
+
+@perf.timed_function("values_to_dataframe", rows=lambda values: max(len(values) - 1, 0))
+def _values_to_dataframe(values):
+    """Sheets API 값 목록(헤더 + 데이터 행)을 DataFrame으로 변환합니다.
+
+    행마다 길이가 달라도 DataFrame 생성 시 한 번에 맞추고(부족한 칸은 ""),
+    헤더보다 긴 행은 잘라냅니다.
+    """
+    headers = values[0]
+    df = pd.DataFrame(values[1:], dtype=object)
+    df = df.reindex(columns=range(len(headers))).fillna("")
+    df.columns = headers
+    return _apply_column_dtypes(df)
+
+
+@perf.timed_function(
+    "columns_to_dataframe",
+    rows=lambda column_cells: max((len(cells) for cells in column_cells.values()), default=0),
+)
+def _columns_to_dataframe(column_cells):
+    """{열 이름: 값 목록}을 길이를 맞춰 열 단위로 DataFrame을 만듭니다."""
+    length = max((len(cells) for cells in column_cells.values()), default=0)
+    df = pd.DataFrame(
+        {
+            column: pd.array(cells + [""] * (length - len(cells)), dtype=object)
+            for column, cells in column_cells.items()
+        }
+    )
+    return _apply_column_dtypes(df)
+
+
+def _column_letter(index):
+    """0부터 시작하는 열 번호를 A~Z 열 문자로 바꿉니다."""
+    return chr(ord("A") + index)
+
+
+def _batch_get_values(service, spreadsheet_id, ranges, major_dimension="ROWS"):
+    """여러 범위를 batchGet으로 조회하여 범위 순서대로 값 목록을 반환합니다.
+
+    요청 한도를 넘지 않도록 SHEETS_API_CONFIG["batch_ranges"]개씩 나누어 요청합니다.
+    """
+    batch_size = SHEETS_API_CONFIG["batch_ranges"]
+    results = []
+    for start in range(0, len(ranges), batch_size):
+        response = _execute(service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges[start:start + batch_size],
+            majorDimension=major_dimension
+        ))
+        results.extend(
+            value_range.get("values", [])
+            for value_range in response.get("valueRanges", [])
+        )
+    return results
+
+
+def _store_key(spreadsheet_id, sheet_name, columns, signature):
+    """공유 테이블 저장소 키 (리비전은 변경 감지 서명)."""
+    revision = (signature or {}).get("hash")
+    return table_store.table_key(spreadsheet_id, sheet_name, columns, revision)
+
+
+def _snapshot_frame(spreadsheet_id, sheet_name, meta, columns=None, share=False):
+    """스냅샷 DataFrame을 반환합니다.
+
+    share=True이면 공유 테이블 저장소에서, 없으면 Parquet 파일에서 읽어 저장소에 넣고 반환합니다.
+    """
+    if not share:
+        df, _ = read_snapshot(spreadsheet_id, sheet_name, columns)
+        return df
+
+    key = _store_key(spreadsheet_id, sheet_name, columns, meta.get("signature"))
+    df = table_store.get(key)
+    if df is None:
+        df, _ = read_snapshot(spreadsheet_id, sheet_name, columns)
+        if df is not None:
+            df = table_store.put(key, df)
+    return df
+
+
+def _load_cached_snapshots(service, spreadsheet_id, sheet_names, columns=None, share=False, revalidate=False):
+    """변경되지 않은 스냅샷을 {시트 이름: DataFrame}으로 반환합니다.
+
+    재확인 주기 안이면 API 호출 없이, 지났으면 서명에 쓴 열(A열과 태그 등)만 한 번에
+    조회해 서명을 비교합니다. revalidate=True이면 재확인 주기와 관계없이 서명을 비교합니다.
+    share=True이면 프로세스 공유 테이블 저장소에 있는 데이터는 파일을 읽지 않고 그 뷰를 씁니다.
+    """
+    cached = {}
+    to_check = {}
+    for sheet_name in sheet_names:
+        meta = read_snapshot_meta(spreadsheet_id, sheet_name, columns)
+        if meta is None:
+            continue
+        if is_recently_checked(meta) and not revalidate:
+            df = _snapshot_frame(spreadsheet_id, sheet_name, meta, columns, share)
+            if df is not None:
+                cached[sheet_name] = df
+        else:
+            to_check[sheet_name] = meta
+
+    if to_check:
+        ranges = [
+            f"{sheet_name}!{letter}1:{letter}"
+            for sheet_name, meta in to_check.items()
+            for letter in signature_letters(meta)
+        ]
+        column_values = iter(
+            _batch_get_values(service, spreadsheet_id, ranges, major_dimension="COLUMNS")
+        )
+        for sheet_name, meta in to_check.items():
+            signature = column_signature({
+                letter: _first_column(next(column_values)) for letter in signature_letters(meta)
+            })
+            if signature == meta.get("signature"):
+                touch_snapshot(spreadsheet_id, sheet_name, meta, columns)
+                df = _snapshot_frame(spreadsheet_id, sheet_name, meta, columns, share)
+                if df is not None:
+                    cached[sheet_name] = df
+
+    perf.annotate(snapshot_hits=len(cached), snapshot_misses=len(sheet_names) - len(cached))
+    metrics.cache_requests.inc(len(cached), cache="snapshot", result="hit")
+    metrics.cache_requests.inc(len(sheet_names) - len(cached), cache="snapshot", result="miss")
+    return cached
+
+
+def _first_column(values):
+    """majorDimension=COLUMNS 응답 값에서 첫 번째 열의 셀 목록을 꺼냅니다."""
+    return values[0] if values else []
+
+
+def _signature_columns(headers):
+    """변경 감지 서명에 쓸 {열 문자: 열 번호} (A열과 SNAPSHOT_CONFIG["signature_headers"] 열)."""
+    columns = {"A": 0}
+    for index, header in enumerate(headers):
+        if header in SNAPSHOT_CONFIG["signature_headers"]:
+            columns.setdefault(_column_letter(index), index)
+    return columns
+
+
+def _fetch_sheet_values(service, spreadsheet_id, sheet_names):
+    """시트 전체(A:Z)를 가져와 {시트 이름: (DataFrame, 서명)}을 반환합니다."""
+    ranges = [f"{sheet_name}!A:Z" for sheet_name in sheet_names]
+    sheet_values = _batch_get_values(service, spreadsheet_id, ranges)
+
+    fetched = {}
+    for sheet_name, values in zip(sheet_names, sheet_values):
+        if not values or len(values) < 2:
+            fetched[sheet_name] = (None, None)
+            continue
+        signature = column_signature({
+            letter: [row[index] if index < len(row) else "" for row in values]
+            for letter, index in _signature_columns(values[0]).items()
+        })
+        fetched[sheet_name] = (_values_to_dataframe(values), signature)
+    return fetched
+
+
+def _fetch_sheet_columns(service, spreadsheet_id, sheet_names, columns):
+    """필요한 열만 열 단위 범위로 가져와 {시트 이름: (DataFrame, 서명)}을 반환합니다.
+
+    헤더 행을 먼저 조회해 열 위치를 찾은 뒤, 해당 열과 변경 감지용 서명 열만
+    majorDimension=COLUMNS로 요청하여 행 단위 변환 없이 열 배열로 만듭니다.
+    """
+    header_values = _batch_get_values(
+        service, spreadsheet_id, [f"{sheet_name}!A1:Z1" for sheet_name in sheet_names]
+    )
+
+    plans = {}
+    ranges = []
+    for sheet_name, header_rows in zip(sheet_names, header_values):
+        headers = header_rows[0] if header_rows else []
+        letters = {}
+        for index, header in enumerate(headers):
+            if header in columns and header not in letters:
+                letters[header] = _column_letter(index)
+
+        plan = [(column, letters[column]) for column in columns if column in letters]
+        signature_columns = list(_signature_columns(headers))
+        needed_letters = sorted({letter for _, letter in plan} | set(signature_columns))
+        plans[sheet_name] = (plan, needed_letters, signature_columns)
+        ranges.extend(f"{sheet_name}!{letter}1:{letter}" for letter in needed_letters)
+
+    column_values = iter(
+        _batch_get_values(service, spreadsheet_id, ranges, major_dimension="COLUMNS")
+    )
+
+    fetched = {}
+    for sheet_name in sheet_names:
+        plan, needed_letters, signature_columns = plans[sheet_name]
+        cells_by_letter = {letter: _first_column(next(column_values)) for letter in needed_letters}
+
+        column_cells = {column: cells_by_letter[letter][1:] for column, letter in plan}
+        if not any(column_cells.values()):
+            fetched[sheet_name] = (None, None)
+            continue
+
+        signature = column_signature({letter: cells_by_letter[letter] for letter in signature_columns})
+        fetched[sheet_name] = (_columns_to_dataframe(column_cells), signature)
+    return fetched
+
+
+def _fetch_sheets(service, spreadsheet_id, sheet_names, columns=None, share=False):
+    """시트를 가져와 스냅샷을 갱신하고 {시트 이름: DataFrame 또는 None}을 반환합니다.
+
+    columns를 지정하면 해당 열만 가져옵니다. share=True이면 공유 테이블 저장소에도 넣고
+    저장소 테이블의 뷰를 반환합니다.
+    """
+    if columns:
+        fetched = _fetch_sheet_columns(service, spreadsheet_id, sheet_names, columns)
+    else:
+        fetched = _fetch_sheet_values(service, spreadsheet_id, sheet_names)
+
+    frames = {}
+    for sheet_name, (df, signature) in fetched.items():
+        if df is not None:
+            write_snapshot(spreadsheet_id, sheet_name, df, signature, columns)
+            if share:
+                df = table_store.put(_store_key(spreadsheet_id, sheet_name, columns, signature), df)
+        frames[sheet_name] = df
+    return frames
+
+
+@perf.timed_function("load_sheet_data")
+def load_sheet_data(sheet_name, columns=None, share=False, revalidate=False, refresh=False):
+    """시트 데이터를 로드합니다.
+
+    로컬 스냅샷이 최신이면 디스크에서 읽고, 아니면 API로 가져와 스냅샷을 갱신합니다.
+    columns(열 이름 목록)를 지정하면 해당 열만 가져옵니다. share=True이면 세션 간
+    공유 테이블 저장소를 거칩니다 (Streamlit 앱 전용, 일회성 작업은 쓰지 않음).
+    revalidate=True이면 재확인 주기 안의 스냅샷도 서명을 비교한 뒤 쓰고, refresh=True이면
+    스냅샷을 쓰지 않고 API로 다시 가져옵니다.
+    """
     service = get_google_sheets_service()
     if not service:
         return None
@@ -78,30 +448,175 @@ def load_sheet_data(sheet_name):
         if not spreadsheet_id:
             st.error("SPREADSHEET_ID가 .env 파일에 설정되지 않았습니다.")
             return None
-            
-        range_name = f"{sheet_name}!A:Z"
-        result = service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id, 
-            range=range_name
-        ).execute()
-
-        values = result.get("values", [])
-        if not values or len(values) < 2:
+
+        cached = {} if refresh else _load_cached_snapshots(
+            service, spreadsheet_id, [sheet_name], columns, share, revalidate
+        )
+        if sheet_name in cached:
+            perf.annotate(rows=len(cached[sheet_name]))
+            return cached[sheet_name]
+
+        df = _fetch_sheets(service, spreadsheet_id, [sheet_name], columns, share)[sheet_name]
+        if df is None:
             st.error("시트에 충분한 데이터가 없습니다.")
-            return None
+        else:
+            perf.annotate(rows=len(df))
+        return df
+
+    except Exception as e:
+        st.error(f"데이터 로드 실패: {str(e)}")
+        return None
+
+
+_worker_local = threading.local()
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """시트 로딩용 스레드 풀을 반환합니다 (프로세스당 하나, 재사용)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=SHEETS_API_CONFIG["max_workers"],
+                thread_name_prefix="sheets-loader",
+            )
+        return _executor
 
-        headers = values[0]
-        data_rows = values[1:]
 
-        # 행 길이 정규화
-        for row in data_rows:
-            while len(row) < len(headers):
-                row.append("")
-            if len(row) > len(headers):
-                row[:] = row[:len(headers)]
+def _worker_service():
+    """작업 스레드 전용 서비스 객체를 반환합니다.
 
-        return pd.DataFrame(data_rows, columns=headers)
+    googleapiclient의 http 객체는 스레드 안전하지 않으므로 스레드마다 따로 만듭니다.
+    """
+    if getattr(_worker_local, "service", None) is None:
+        _worker_local.service = create_service()
+    return _worker_local.service
+
+
+def _load_sheet_chunk(spreadsheet_id, sheet_names, columns=None, share=False):
+    """작업 스레드에서 시트 묶음 하나를 스냅샷 또는 API로 로드합니다."""
+    with perf.timed("load_sheet_chunk", sheets=len(sheet_names)) as record:
+        service = _worker_service()
+        frames = _load_cached_snapshots(service, spreadsheet_id, sheet_names, columns, share)
+        missing = [name for name in sheet_names if name not in frames]
+        if missing:
+            frames.update(_fetch_sheets(service, spreadsheet_id, missing, columns, share))
+        record["rows"] = sum(len(df) for df in frames.values() if df is not None)
+    return frames
+
+
+def load_sheets_concurrently(sheet_refs, columns=None, share=False):
+    """여러 스프레드시트의 시트를 스레드 풀에서 동시에 로드합니다.
+
+    sheet_refs는 (스프레드시트 ID, 시트 이름) 목록이며, 스프레드시트별로
+    batchGet 단위 묶음을 나누어 병렬로 요청합니다. 전체 소요 시간은 각 묶음의
+    합이 아니라 가장 느린 묶음에 맞춰집니다. share는 load_sheet_data와 같습니다.
+
+    Returns:
+        ({(스프레드시트 ID, 시트 이름): DataFrame 또는 None}, [오류 메시지])
+        데이터가 부족한 시트는 None, 요청이 실패한 시트는 결과에서 빠집니다.
+    """
+    sheets_by_spreadsheet = {}
+    for spreadsheet_id, sheet_name in sheet_refs:
+        sheet_names = sheets_by_spreadsheet.setdefault(spreadsheet_id, [])
+        if sheet_name not in sheet_names:
+            sheet_names.append(sheet_name)
+
+    # 열 단위로 가져오면 시트당 범위가 여러 개이므로 묶음당 시트 수를 줄임
+    batch_size = SHEETS_API_CONFIG["batch_ranges"]
+    if columns:
+        batch_size = max(1, batch_size // (len(columns) + 1))
+    executor = _get_executor()
+    futures = []
+    for spreadsheet_id, sheet_names in sheets_by_spreadsheet.items():
+        for start in range(0, len(sheet_names), batch_size):
+            chunk = sheet_names[start:start + batch_size]
+            # 작업 스레드의 계측 기록이 호출한 쪽 실행에 모이도록 컨텍스트를 복사해 실행
+            context = contextvars.copy_context()
+            futures.append(
+                (spreadsheet_id, chunk, executor.submit(context.run, _load_sheet_chunk, spreadsheet_id, chunk, columns, share))
+            )
+
+    results = {}
+    errors = []
+    for spreadsheet_id, chunk, future in futures:
+        try:
+            frames = future.result()
+        except Exception as e:
+            errors.append(f"{', '.join(chunk)}: {str(e)}")
+            continue
+        for sheet_name in chunk:
+            results[(spreadsheet_id, sheet_name)] = frames.get(sheet_name)
+    return results, errors
+
+
+@perf.timed_function("load_sheet_rows")
+def load_sheet_rows(sheet_name, start_row, columns=None):
+    """start_row(시트 행 번호)부터 마지막 행까지만 가져옵니다.
+
+    증분 적재용으로 스냅샷을 거치지 않으며, 헤더 행과 새 행을 한 번의 요청으로
+    가져옵니다. 새 행이 없으면 빈 DataFrame을 반환합니다.
+    """
+    service = get_google_sheets_service()
+    if not service:
+        return None
+
+    try:
+        spreadsheet_id = os.environ.get("SPREADSHEET_ID")
+        if not spreadsheet_id:
+            st.error("SPREADSHEET_ID가 .env 파일에 설정되지 않았습니다.")
+            return None
+
+        header_rows, rows = _batch_get_values(
+            service,
+            spreadsheet_id,
+            [f"{sheet_name}!A1:Z1", f"{sheet_name}!A{start_row}:Z"],
+        )
+        if not header_rows:
+            return None
+
+        df = _values_to_dataframe([header_rows[0]] + rows)
+        if columns:
+            df = df[[column for column in columns if column in df.columns]]
+        perf.annotate(rows=len(df))
+        return df
 
     except Exception as e:
         st.error(f"데이터 로드 실패: {str(e)}")
-        return None
\ No newline at end of file
+        return None
+
+
+@perf.timed_function("load_sheets_data")
+def load_sheets_data(sheet_names, columns=None, share=False):
+    """여러 시트 데이터를 한 번에 로드하여 {시트 이름: DataFrame}으로 반환합니다.
+
+    스냅샷으로 해결되지 않는 시트만 batchGet 요청으로 묶어 가져오며,
+    묶음이 여러 개면 스레드 풀에서 동시에 요청합니다. columns를 지정하면
+    해당 열만 가져옵니다. 데이터가 부족하거나 로드에 실패한 시트는 결과에서 빠집니다.
+    share는 load_sheet_data와 같습니다.
+    """
+    spreadsheet_id = os.environ.get("SPREADSHEET_ID")
+    if not spreadsheet_id:
+        st.error("SPREADSHEET_ID가 .env 파일에 설정되지 않았습니다.")
+        return {}
+
+    frames, errors = load_sheets_concurrently(
+        [(spreadsheet_id, sheet_name) for sheet_name in sheet_names], columns, share
+    )
+    for error in errors:
+        st.error(f"데이터 로드 실패: {error}")
+
+    results = {}
+    for sheet_name in sheet_names:
+        if (spreadsheet_id, sheet_name) not in frames:
+            continue
+        df = frames[(spreadsheet_id, sheet_name)]
+        if df is None:
+            st.error(f"'{sheet_name}' 시트에 충분한 데이터가 없습니다.")
+            continue
+        results[sheet_name] = df
+
+    perf.annotate(sheets=len(results), rows=sum(len(df) for df in results.values()))
+    return results
@@ -0,0 +1,190 @@
+"""시트 데이터 로컬 스냅샷 저장소
+
+스프레드시트 ID와 시트 이름별로 DataFrame을 Parquet 파일로, 메타데이터를 JSON으로
+저장합니다. 컨테이너가 재시작되어도 디스크에 남아 있으므로 지난달 시트는
+API를 다시 호출하지 않고 바로 읽을 수 있습니다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from config import SNAPSHOT_CONFIG
+
+
+def _snapshot_paths(spreadsheet_id, sheet_name, columns=None):
+    """스냅샷 Parquet/메타데이터 파일 경로를 반환합니다.
+
+    일부 열만 가져온 스냅샷은 열 목록별로 따로 저장합니다.
+    """
+    key = f"{spreadsheet_id}\0{sheet_name}"
+    if columns:
+        key += "\0" + "\0".join(columns)
+    key = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    base = os.path.join(SNAPSHOT_CONFIG["dir"], key)
+    return f"{base}.parquet", f"{base}.json"
+
+
+def column_signature(column_cells):
+    """{열 문자: 헤더부터의 셀 목록}으로 변경 감지용 서명(행 수, 해시, 열 목록)을 만듭니다.
+
+    행 수는 A열 기준입니다. 열 단위로 조회한 응답과 전체 범위를 조회한 응답에서
+    같은 서명이 나오도록 열마다 끝의 빈 셀은 제외합니다.
+    """
+    columns = {}
+    for letter, cells in sorted(column_cells.items()):
+        cells = list(cells)
+        while cells and cells[-1] == "":
+            cells.pop()
+        columns[letter] = cells
+
+    digest = hashlib.sha1(json.dumps(columns, ensure_ascii=False).encode("utf-8"))
+    return {
+        "row_count": len(columns.get("A", [])),
+        "hash": digest.hexdigest(),
+        "columns": list(columns),
+    }
+
+
+def signature_letters(meta):
+    """스냅샷의 변경 확인 때 다시 조회할 열 문자 목록 (이전 형식 서명은 A열만)."""
+    return (meta.get("signature") or {}).get("columns") or ["A"]
+
+
+def read_snapshot_meta(spreadsheet_id, sheet_name, columns=None):
+    """저장된 스냅샷의 메타데이터를 반환합니다. 없거나 만료되었으면 None.
+
+    스냅샷 사용 시각도 갱신합니다 (용량 초과 시 오래 안 쓴 스냅샷부터 삭제).
+    """
+    data_path, meta_path = _snapshot_paths(spreadsheet_id, sheet_name, columns)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        os.utime(data_path)
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - meta.get("created_at", 0) > SNAPSHOT_CONFIG["max_age_days"] * 86400:
+        return None
+    return meta
+
+
+def read_snapshot(spreadsheet_id, sheet_name, columns=None):
+    """저장된 스냅샷을 (DataFrame, 메타데이터)로 반환합니다. 없으면 (None, None)."""
+    meta = read_snapshot_meta(spreadsheet_id, sheet_name, columns)
+    if meta is None:
+        return None, None
+
+    data_path, _ = _snapshot_paths(spreadsheet_id, sheet_name, columns)
+    try:
+        df = pd.read_parquet(data_path)
+    except (OSError, ValueError):
+        return None, None
+    return df, meta
+
+
+def is_recently_checked(meta):
+    """마지막 변경 확인 후 재확인 주기가 지나지 않았는지 확인합니다."""
+    checked_at = meta.get("checked_at", 0)
+    return time.time() - checked_at < SNAPSHOT_CONFIG["revalidate_seconds"]
+
+
+def write_snapshot(spreadsheet_id, sheet_name, df, signature, columns=None):
+    """스냅샷을 저장합니다. 저장할 수 없는 데이터면 False를 반환합니다."""
+    data_path, meta_path = _snapshot_paths(spreadsheet_id, sheet_name, columns)
+    now = time.time()
+    meta = {
+        "spreadsheet_id": spreadsheet_id,
+        "sheet_name": sheet_name,
+        "signature": signature,
+        "created_at": now,
+        "checked_at": now,
+    }
+
+    try:
+        os.makedirs(SNAPSHOT_CONFIG["dir"], exist_ok=True)
+        _replace_file(data_path, lambda f: df.to_parquet(f, index=False))
+        _write_meta(meta_path, meta)
+    except (OSError, ValueError, TypeError):
+        # 중복·빈 헤더 등 Parquet로 저장할 수 없는 시트는 캐시하지 않음
+        return False
+
+    evict_snapshots()
+    return True
+
+
+def touch_snapshot(spreadsheet_id, sheet_name, meta, columns=None):
+    """변경이 없음을 확인한 스냅샷의 확인 시각을 갱신합니다."""
+    _, meta_path = _snapshot_paths(spreadsheet_id, sheet_name, columns)
+    meta = {**meta, "checked_at": time.time()}
+    try:
+        _write_meta(meta_path, meta)
+    except OSError:
+        pass
+    return meta
+
+
+def _replace_file(path, write):
+    """같은 디렉터리의 고유한 임시 파일에 write(f)로 쓴 뒤 path로 교체합니다.
+
+    읽는 쪽은 깨진 파일을 보지 않고, 같은 시트를 동시에 쓰는 스레드끼리 임시 파일이
+    섞이지 않습니다.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(temp_path, path)
+    except BaseException:
+        _remove_files(temp_path)
+        raise
+
+
+def _write_meta(meta_path, meta):
+    _replace_file(meta_path, lambda f: f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8")))
+
+
+def evict_snapshots():
+    """오래된 스냅샷을 지우고, 전체 용량이 한도를 넘으면 최근에 쓰지 않은 것부터 지웁니다."""
+    cache_dir = SNAPSHOT_CONFIG["dir"]
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+
+    now = time.time()
+    max_age = SNAPSHOT_CONFIG["max_age_days"] * 86400
+    snapshots = []
+    for name in names:
+        if not name.endswith(".parquet"):
+            continue
+        data_path = os.path.join(cache_dir, name)
+        meta_path = data_path[: -len(".parquet")] + ".json"
+        try:
+            stat = os.stat(data_path)
+        except OSError:
+            continue
+
+        if now - stat.st_mtime > max_age:
+            _remove_files(data_path, meta_path)
+        else:
+            snapshots.append((stat.st_mtime, stat.st_size, data_path, meta_path))
+
+    total_bytes = sum(size for _, size, _, _ in snapshots)
+    for _, size, data_path, meta_path in sorted(snapshots):
+        if total_bytes <= SNAPSHOT_CONFIG["max_bytes"]:
+            break
+        _remove_files(data_path, meta_path)
+        total_bytes -= size
+
+
+def _remove_files(*paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,154 @@
+"""프로세스 공유 Arrow 테이블 저장소
+
+같은 달 시트를 여러 세션이 불러와도 프로세스 안에 Arrow 테이블 하나만 두고, 세션에는 그
+테이블을 가리키는 DataFrame(문자열 열은 Arrow 버퍼를 그대로 공유)을 돌려줍니다. 테이블은
+(스프레드시트 ID, 시트, 리비전)으로 찾으며 리비전은 스냅샷의 변경 감지 서명입니다.
+
+돌려준 DataFrame이 살아 있는 동안은 참조 수가 남아 테이블을 지우지 않고, 참조가 없는(유휴)
+테이블은 전체 크기가 TABLE_STORE_CONFIG["max_bytes"]를 넘으면 오래 안 쓴 것부터 지웁니다.
+새로 가져온 데이터나 같은 시트의 새 리비전이 들어오면 이전 테이블은 저장소에서 빠지고,
+참조가 모두 사라질 때까지만 크기 집계에 남습니다.
+
+DataFrame이 사라질 때의 참조 해제는 가비지 컬렉션 중(잠금을 잡은 스레드 안일 수도 있음)에
+호출되므로 잠금 없이 _released 큐에 넣기만 하고, 다음 get/put/stats가 잠금 안에서 처리합니다.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+
+import pyarrow as pa
+
+from config import TABLE_STORE_CONFIG
+from utils import metrics
+
+_entries = OrderedDict()  # 키 → _Entry (앞쪽이 오래 안 쓴 것)
+_retired = set()  # 저장소에서 빠졌지만 아직 DataFrame이 남아 있는 _Entry
+_released = deque()  # DataFrame이 사라진 _Entry (잠금 없이 넣고 _lock 안에서 처리)
+_lock = threading.Lock()
+
+
+class _Entry:
+    """저장된 테이블과 참조 수입니다."""
+
+    __slots__ = ("table", "nbytes", "refs", "last_used")
+
+    def __init__(self, table):
+        self.table = table
+        self.nbytes = table.nbytes
+        self.refs = 0
+        self.last_used = time.time()
+
+
+def table_key(spreadsheet_id, sheet_name, columns, revision):
+    """저장소 키 (열 일부만 불러온 시트는 열 목록별로 따로 저장)."""
+    return (spreadsheet_id, (sheet_name, tuple(columns) if columns else None), revision)
+
+
+def _drain_released():
+    """사라진 DataFrame의 참조 수를 줄이고 다 쓴 이전 테이블을 놓습니다 (_lock 안에서 호출)."""
+    while _released:
+        entry = _released.popleft()
+        entry.refs -= 1
+        entry.last_used = time.time()
+        if entry.refs == 0:
+            _retired.discard(entry)
+
+
+def _pin(key, entry):
+    """DataFrame을 하나 내줄 참조를 잡습니다 (_lock 안에서 호출)."""
+    entry.refs += 1
+    entry.last_used = time.time()
+    _entries.move_to_end(key)
+
+
+def _view(entry):
+    """테이블을 가리키는 DataFrame을 만들고, 사라질 때 참조를 놓도록 등록합니다.
+
+    잠금 밖에서 호출합니다 (to_pandas 중 가비지 컬렉션이 돌 수 있음).
+    """
+    try:
+        df = entry.table.to_pandas()
+    except BaseException:
+        _released.append(entry)
+        raise
+    weakref.finalize(df, _released.append, entry)
+    return df
+
+
+def _retire(key):
+    """키의 테이블을 저장소에서 빼고, 쓰는 DataFrame이 남아 있으면 다 쓸 때까지 집계에 남깁니다."""
+    entry = _entries.pop(key)
+    if entry.refs:
+        _retired.add(entry)
+
+
+def get(key):
+    """저장된 테이블의 DataFrame 뷰를 반환합니다. 없으면 None."""
+    with _lock:
+        _drain_released()
+        entry = _entries.get(key)
+        if entry is None:
+            metrics.cache_requests.inc(cache="table_store", result="miss")
+            return None
+        metrics.cache_requests.inc(cache="table_store", result="hit")
+        _pin(key, entry)
+    return _view(entry)
+
+
+def put(key, df):
+    """DataFrame을 Arrow 테이블로 저장하고 저장된 테이블의 DataFrame 뷰를 반환합니다.
+
+    같은 키나 같은 시트의 다른 리비전으로 저장된 테이블은 새 데이터로 바꿉니다.
+    Arrow로 바꿀 수 없는 데이터(중복 헤더 등)는 저장하지 않고 df를 그대로 반환합니다.
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, ValueError, TypeError):
+        return df
+
+    entry = _Entry(table)
+    with _lock:
+        _drain_released()
+        spreadsheet_id, sheet, _ = key
+        for other_key in [k for k in _entries if k[:2] == (spreadsheet_id, sheet)]:
+            _retire(other_key)
+        _entries[key] = entry
+        _pin(key, entry)
+        _evict()
+    return _view(entry)
+
+
+def _evict():
+    """유휴 테이블을 오래 안 쓴 것부터 지워 전체 크기를 한도 아래로 맞춥니다 (_lock 안에서 호출)."""
+    total = sum(entry.nbytes for entry in _entries.values()) + sum(entry.nbytes for entry in _retired)
+    for key, entry in list(_entries.items()):
+        if total <= TABLE_STORE_CONFIG["max_bytes"]:
+            break
+        if entry.refs == 0:
+            del _entries[key]
+            total -= entry.nbytes
+
+
+def stats():
+    """{"tables", "bytes", "pinned_tables", "pinned_bytes", "views"} 저장소 현황.
+
+    저장소에서 빠졌지만 아직 세션이 쓰는 이전 테이블도 포함합니다.
+    """
+    with _lock:
+        _drain_released()
+        entries = list(_entries.values()) + list(_retired)
+    pinned = [entry for entry in entries if entry.refs]
+    return {
+        "tables": len(entries),
+        "bytes": sum(entry.nbytes for entry in entries),
+        "pinned_tables": len(pinned),
+        "pinned_bytes": sum(entry.nbytes for entry in pinned),
+        "views": sum(entry.refs for entry in entries),
+    }
+
+
+store_bytes = metrics.Gauge("table_store_bytes", "공유 Arrow 테이블 저장소 크기 (바이트)", callback=lambda: stats()["bytes"])
+store_tables = metrics.Gauge("table_store_tables", "공유 Arrow 테이블 저장소 테이블 수", callback=lambda: stats()["tables"])
+store_views = metrics.Gauge("table_store_views", "세션에 나간 DataFrame 뷰 수", callback=lambda: stats()["views"])
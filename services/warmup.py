@@ -0,0 +1,104 @@
+"""서버 시작 시 최근 시트 미리 불러오기
+
+시트 목록을 조회한 뒤 최근 상담데이터 시트 N개를 스냅샷 캐시에 불러오고 분석해 둡니다.
+하루 첫 사용자가 서비스 생성, 시트 목록 조회, 전체 다운로드와 분석을 기다리지 않도록
+`run_streamlit.py --warm`으로 앱 시작 전에 별도 프로세스(python -m services.warmup)로
+실행하거나, 앱 프로세스 안에서 백그라운드 스레드로 실행합니다. 별도 프로세스로 실행하면
+끝난 뒤 불러온 데이터는 메모리에서 사라지고 디스크 캐시(스냅샷, 분석 결과)만 남습니다.
+
+별도 프로세스로 실행할 때 제한 시간이 지나면 남은 다운로드(sheets-loader 스레드)를 기다리지
+않고 os._exit로 바로 끝냅니다. 일반 종료는 인터프리터 종료 시 스레드 풀을 join하므로
+다운로드가 멈춰 있으면 프로세스가 끝나지 않습니다.
+"""
+
+import os
+import sys
+import threading
+import time
+
+from analyzers.analysis_cache import analyze_sheet
+from config import SHEET_COLUMNS, WARMUP_CONFIG
+from services.sheets_service import (
+    create_service,
+    list_consultation_sheets,
+    load_sheets_concurrently,
+)
+
+
+def warm_up(sheet_count=None):
+    """최근 상담데이터 시트를 미리 불러와 분석합니다.
+
+    앱과 같은 스냅샷·분석 캐시 키를 쓰도록 SHEET_COLUMNS 열만 가져옵니다.
+    예외를 밖으로 내보내지 않으며, 결과 요약 dict를 반환합니다.
+    """
+    if sheet_count is None:
+        sheet_count = WARMUP_CONFIG["sheet_count"]
+
+    started = time.monotonic()
+    summary = {"sheets": [], "errors": [], "seconds": 0.0}
+
+    spreadsheet_id = os.environ.get("SPREADSHEET_ID")
+    if not spreadsheet_id:
+        summary["errors"].append("SPREADSHEET_ID 환경변수가 설정되지 않았습니다.")
+        return summary
+
+    try:
+        sheet_names = list_consultation_sheets(create_service(), spreadsheet_id)[:sheet_count]
+        frames, errors = load_sheets_concurrently(
+            [(spreadsheet_id, sheet_name) for sheet_name in sheet_names], SHEET_COLUMNS
+        )
+        summary["errors"].extend(errors)
+
+        for (_, sheet_name), df in frames.items():
+            if df is None:
+                continue
+            analyze_sheet(df)
+            summary["sheets"].append(sheet_name)
+    except Exception as e:
+        summary["errors"].append(str(e))
+
+    summary["seconds"] = time.monotonic() - started
+    return summary
+
+
+def start_background_warmup(sheet_count=None):
+    """백그라운드 스레드에서 warm_up을 실행합니다.
+
+    Returns:
+        (스레드, 요약 dict) — 요약 dict는 스레드가 끝나면 warm_up 결과로 채워집니다.
+    """
+    summary = {}
+    thread = threading.Thread(
+        target=lambda: summary.update(warm_up(sheet_count)),
+        name="sheets-warmup",
+        daemon=True,
+    )
+    thread.start()
+    return thread, summary
+
+
+def warm_up_with_timeout():
+    """warm_up을 실행하고 결과를 출력합니다. 제한 시간이 지나면 기다리지 않고 넘어갑니다.
+
+    Returns:
+        제한 시간 안에 끝났으면 True
+    """
+    print("🔥 최근 상담데이터 시트를 미리 불러오는 중...")
+    thread, summary = start_background_warmup()
+    thread.join(WARMUP_CONFIG["timeout_seconds"])
+
+    if thread.is_alive():
+        print(f"⚠️  {WARMUP_CONFIG['timeout_seconds']}초 안에 끝나지 않아 미리 불러오기를 건너뜁니다.")
+        return False
+
+    for error in summary["errors"]:
+        print(f"⚠️  미리 불러오기 실패: {error}")
+    print(f"✅ {len(summary['sheets'])}개 시트 준비 완료 ({summary['seconds']:.1f}초)")
+    return True
+
+
+if __name__ == "__main__":
+    if not warm_up_with_timeout():
+        # 남은 다운로드 스레드를 join하지 않고 종료
+        sys.stdout.flush()
+        os._exit(1)
@@ -1,26 +1,43 @@
-import matplotlib.pyplot as plt
 import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv
 
-from analyzers.tag_analyzer import (
-    analyze_company_stats,
-    analyze_tags,
-    categorize_tags_advanced,
+from analyzers.analysis_cache import analyze_sheet
+from analyzers import parallel
+from analyzers.incremental import IncrementalAggregate
+from analyzers.multi_sheet import analyze_sheets
+from analyzers.tag_analyzer import is_product_category
+from analyzers.trend_analyzer import declining_tags, rising_tags, sheet_order_key, tag_trends
+from config import (
+    CATEGORY_COLORS,
+    COMPANY_CATEGORIES,
+    METRICS_CONFIG,
+    PARALLEL_CONFIG,
+    RENDER_CONFIG,
+    SHEET_COLUMNS,
+    TAG_CATEGORIES,
+    WARMUP_CONFIG,
 )
-from config import CATEGORY_COLORS, COMPANY_CATEGORIES, TAG_CATEGORIES
+from services import table_store
 from services.sheets_service import (
     get_google_sheets_service,
     get_sheet_list,
     load_sheet_data,
+    load_sheet_rows,
+    load_sheets_data,
 )
+from services.warmup import start_background_warmup
+from utils import metrics, perf
 from utils.font_manager import setup_korean_font
+from visualizers.chart_cache import create_chart_image, create_trend_chart_image
 from visualizers.chart_creator import (
     clean_tag_name,
-    create_chart,
-    create_trend_chart,
-    highlight_top5_per_column,
+    create_chart_spec,
+    create_trend_chart_spec,
+    get_chart_backend,
 )
+from visualizers.paged_table import render_paged_table
+from visualizers.table_styler import TOP3_OPACITIES, top_rank_styles, top_row_styles
 
 # 초기 설정
 st.set_page_config(page_title="샐러드랩 상담데이터 분석", page_icon="🥗", layout="wide")
@@ -28,24 +45,211 @@ load_dotenv()
 setup_korean_font()
 
 
-def render_single_analysis(selected_sheet):
+@st.cache_resource
+def start_warmup():
+    """프로세스당 한 번, 최근 시트를 백그라운드에서 미리 불러옵니다."""
+    return start_background_warmup()
+
+
+@st.cache_resource
+def start_metrics_server():
+    """프로세스당 한 번, Prometheus 지표 서버(/metrics)를 시작합니다."""
+    return metrics.start_server()
+
+
+@st.cache_resource
+def start_analysis_workers():
+    """프로세스당 한 번, 다중 비교용 분석 프로세스 풀을 미리 띄웁니다."""
+    return parallel.start_workers()
+
+
+@st.cache_resource
+def get_live_aggregate(sheet_name):
+    """시트별 증분 집계 상태 (모든 세션이 공유)"""
+    return IncrementalAggregate()
+
+
+def load_live_analysis(sheet_name, reload=False):
+    """새로 추가된 행만 가져와 누적 집계에 더한 뒤 분석 결과를 반환합니다."""
+    aggregate = get_live_aggregate(sheet_name)
+    with aggregate.lock:
+        if reload:
+            aggregate.reset()
+
+        if not aggregate.is_loaded:
+            # 처음에는 서명을 확인한 스냅샷, 전체 다시 불러오기는 API에서 새로 가져옴
+            # (재확인 주기 안의 스냅샷은 그 사이 추가된 행이 빠져 있을 수 있음)
+            df = load_sheet_data(
+                sheet_name, columns=SHEET_COLUMNS, share=True, revalidate=True, refresh=reload
+            )
+            if df is None:
+                return None
+            aggregate.ingest(df, headers=df.columns)
+        else:
+            new_rows = load_sheet_rows(sheet_name, aggregate.next_row, columns=SHEET_COLUMNS)
+            if new_rows is None:
+                return None
+            aggregate.ingest(new_rows)
+            if len(new_rows):
+                st.toast(f"새 행 {len(new_rows)}개를 반영했습니다.")
+
+        return aggregate.result()
+
+
+def show_chart(data, title):
+    """설정된 백엔드로 막대 차트를 표시합니다."""
+    if get_chart_backend() == "altair":
+        chart = create_chart_spec(data, title)
+        if chart is not None:
+            with perf.timed("chart_render", rows=len(data)):
+                st.altair_chart(chart, use_container_width=True)
+        return
+
+    chart_image = create_chart_image(data, title)
+    if chart_image:
+        st.image(chart_image, use_container_width=True)
+
+
+def show_trend_chart(comparison_data, title, key):
+    """설정된 백엔드로 추이 차트를 표시합니다."""
+    if get_chart_backend() == "altair":
+        chart = create_trend_chart_spec(comparison_data, title, key)
+        if chart is not None:
+            with perf.timed("chart_render", rows=len(comparison_data)):
+                st.altair_chart(chart, use_container_width=True)
+        return
+
+    trend_image = create_trend_chart_image(comparison_data, title, key)
+    if trend_image:
+        st.image(trend_image, use_container_width=True)
+
+
+def render_category_heading(key, title, margin_bottom=None):
+    """카테고리 제목을 서비스 색상으로 렌더링합니다."""
+    margin = f" margin-bottom: {margin_bottom};" if margin_bottom else ""
+    if key in CATEGORY_COLORS:
+        hex_color = CATEGORY_COLORS[key]
+        # hex를 rgba로 변환하여 투명도 추가
+        r = int(hex_color[1:3], 16)
+        g = int(hex_color[3:5], 16)
+        b = int(hex_color[5:7], 16)
+        bg_color = f"rgba({r}, {g}, {b}, 0.3)"
+        st.markdown(
+            f'<h4 style="background-color: {bg_color}; padding: 4px; border-radius: 3px;{margin}">{title}</h4>',
+            unsafe_allow_html=True,
+        )
+    else:
+        st.markdown(
+            f'<h4 style="padding: 4px; border-radius: 3px;{margin}">‣ {title}</h4>',
+            unsafe_allow_html=True,
+        )
+
+
+@st.fragment
+def render_lazy_section(section_key, render, *args):
+    """펼쳤을 때만 내용을 계산·렌더링합니다.
+
+    fragment로 실행되므로 섹션을 열고 닫아도 이 섹션만 다시 실행됩니다.
+    """
+    if st.toggle("자세히 보기", key=f"lazy_{section_key}"):
+        render(*args)
+
+
+def render_section(section_key, lazy, render, *args):
+    """지연 렌더링 여부에 따라 섹션 내용을 렌더링합니다."""
+    if lazy:
+        render_lazy_section(section_key, render, *args)
+    else:
+        render(*args)
+
+
+def render_category_detail(key, title, data):
+    """카테고리 하나의 통계·테이블·차트를 렌더링합니다 (단일 분석)."""
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        # 통계 정보
+        st.markdown(
+            f"· 태그 종류: {len(data)}개  \n· 총 개수: {sum(data.values())}개"
+        )
+
+        # 테이블 데이터 준비
+        if is_product_category(key):
+            clean_data = [
+                ("/".join(tag.split("/")[1:]), count)
+                for tag, count in data.items()
+            ]
+        else:
+            clean_data = [
+                (clean_tag_name(tag), count) for tag, count in data.items()
+            ]
+
+        df_category = pd.DataFrame(clean_data, columns=["태그", "개수"])
+
+        # 개수 상위 행만 표시하고 Top 3 값 하이라이트
+        # (Styler는 st.dataframe 직렬화 시 계산되므로 함께 계측)
+        with perf.timed("styler", rows=len(df_category)):
+            render_paged_table(
+                df_category,
+                f"single_{key}",
+                sort_column="개수",
+                styles=top_row_styles(df_category, "개수"),
+            )
+
+    with col2:
+        # 차트 표시
+        chart_data = data
+        if key in ["리뷰_상담태그", "리뷰_요청사항_상담태그"]:
+            chart_data = dict(
+                sorted(data.items(), key=lambda x: int(x[1]), reverse=True)[:50]
+            )
+
+        show_chart(chart_data, title)
+
+
+def render_other_tags(other_data):
+    """기타 태그 통계와 테이블을 렌더링합니다."""
+    st.markdown(
+        f"· 태그 종류: {len(other_data)}개  \n· 총 개수: {sum(other_data.values())}개"
+    )
+
+    clean_other_data = [(tag, count) for tag, count in other_data.items()]
+    df_other = pd.DataFrame(clean_other_data, columns=["태그", "개수"])
+
+    with perf.timed("styler", rows=len(df_other)):
+        render_paged_table(
+            df_other,
+            "single_기타",
+            sort_column="개수",
+            styles=top_rank_styles(df_other[["개수"]], TOP3_OPACITIES),
+        )
+
+
+def render_single_analysis(selected_sheet, incremental=False, lazy=False):
     """단일 분석 모드 렌더링"""
     with st.spinner("데이터를 분석 중입니다..."):
-        df = load_sheet_data(selected_sheet)
-        if df is None:
+        if incremental:
+            analysis = load_live_analysis(
+                selected_sheet, reload=st.session_state.pop("reload_live", False)
+            )
+        else:
+            df = load_sheet_data(selected_sheet, columns=SHEET_COLUMNS, share=True)
+            # 같은 내용의 시트는 캐시된 결과 사용
+            analysis = analyze_sheet(df) if df is not None else None
+        if analysis is None:
             return
 
         st.success(f"'{selected_sheet}' 시트 데이터를 성공적으로 로드했습니다!")
 
         # 태그 분석
-        tag_counts = analyze_tags(df)
-        category_counts = categorize_tags_advanced(tag_counts)
+        tag_counts = analysis.tag_counts
+        category_counts = analysis.category_counts
 
         # 전체 통계
         st.subheader("📈 전체 분석")
         col1, col2, col3 = st.columns(3)
 
-        total_consultations = len(df[df["id"].notna() & (df["id"] != "")])
+        total_consultations = analysis.total_consultations
 
         with col1:
             st.metric("총 태그 종류", len(tag_counts))
@@ -53,7 +257,7 @@ def render_single_analysis(selected_sheet):
             st.metric("총 상담 수", total_consultations)
 
         # 업체 통계
-        company_stats = analyze_company_stats(df)
+        company_stats = analysis.company_stats
         st.markdown("#### 상담 인입 업체 수")
 
         stats_data = {
@@ -72,166 +276,138 @@ def render_single_analysis(selected_sheet):
             if not data:
                 continue
 
-            # 제목 스타일링
-            if key in CATEGORY_COLORS:
-                hex_color = CATEGORY_COLORS[key]
-                # hex를 rgba로 변환하여 투명도 추가
-                r = int(hex_color[1:3], 16)
-                g = int(hex_color[3:5], 16)
-                b = int(hex_color[5:7], 16)
-                bg_color = f"rgba({r}, {g}, {b}, 0.3)"
-                st.markdown(
-                    f'<h4 style="background-color: {bg_color}; padding: 4px; border-radius: 3px;">{title}</h4>',
-                    unsafe_allow_html=True,
-                )
-            else:
-                st.markdown(
-                    f'<h4 style="padding: 4px; border-radius: 3px;">‣ {title}</h4>',
-                    unsafe_allow_html=True,
-                )
-
-            col1, col2 = st.columns([1, 2])
-
-            with col1:
-                # 통계 정보
-                st.markdown(
-                    f"· 태그 종류: {len(data)}개  \n· 총 개수: {sum(data.values())}개"
-                )
-
-                # 테이블 데이터 준비
-                if key in ["리뷰_상담태그", "업셀_상담태그", "푸시_상담태그"]:
-                    clean_data = [
-                        ("/".join(tag.split("/")[1:]), count)
-                        for tag, count in data.items()
-                    ]
-                else:
-                    clean_data = [
-                        (clean_tag_name(tag), count) for tag, count in data.items()
-                    ]
-
-                df_category = (
-                    pd.DataFrame(clean_data, columns=["태그", "개수"])
-                    .sort_values("개수", ascending=False)
-                    .reset_index(drop=True)
-                )
-
-                # Top 3 값 하이라이트
-                def highlight_top3(df):
-                    def highlight_top3_rows(row):
-                        top3_values = df["개수"].drop_duplicates().nlargest(3).tolist()
-                        opacities = [0.8, 0.5, 0.3]
-
-                        value = row["개수"]
-                        if value in top3_values and value > 0:
-                            rank = top3_values.index(value)
-                            opacity = opacities[rank]
-                            return [
-                                f"background-color: rgba(255, 255, 0, {opacity})"
-                            ] * len(row)
-                        return [""] * len(row)
-
-                    return df.style.apply(highlight_top3_rows, axis=1)
-
-                styled_df = highlight_top3(df_category)
-                st.dataframe(styled_df, use_container_width=True, hide_index=True)
-
-            with col2:
-                # 차트 표시
-                chart_data = data
-                if key in ["리뷰_상담태그", "리뷰_요청사항_상담태그"]:
-                    chart_data = dict(
-                        sorted(data.items(), key=lambda x: int(x[1]), reverse=True)[:50]
-                    )
-
-                fig = create_chart(chart_data, title)
-                if fig:
-                    st.pyplot(fig)
-                    plt.close(fig)
+            render_category_heading(key, title)
+            render_section(f"single_{key}", lazy, render_category_detail, key, title, data)
 
         # 기타 태그
         other_data = category_counts.get("기타", {})
         if other_data:
             st.write("### 기타 태그")
-            st.markdown(
-                f"· 태그 종류: {len(other_data)}개  \n· 총 개수: {sum(other_data.values())}개"
+            render_section("single_기타", lazy, render_other_tags, other_data)
+
+
+def render_category_comparison(key, title, analysis):
+    """카테고리 하나의 시트별 통계·비교 테이블·추이 차트를 렌더링합니다 (다중 비교)."""
+    matrix = analysis.matrix
+
+    # 각 시트별 통계
+    totals = analysis.category_totals[key].tolist()
+    deltas = analysis.category_deltas[key].tolist()
+    stats_cols = st.columns(len(analysis.sheets))
+    for i, sheet in enumerate(analysis.sheets):
+        current_count = totals[i]
+        delta = None if pd.isna(deltas[i]) else int(deltas[i])
+
+        with stats_cols[i]:
+            color = (
+                "#6c757d"
+                if delta is None
+                else (
+                    "#28a745"
+                    if delta > 0
+                    else "#dc3545" if delta < 0 else "#6c757d"
+                )
             )
 
-            clean_other_data = [(tag, count) for tag, count in other_data.items()]
-            df_other = (
-                pd.DataFrame(clean_other_data, columns=["태그", "개수"])
-                .sort_values("개수", ascending=False)
-                .reset_index(drop=True)
+            st.markdown(
+                f"""
+                <div style="
+                    background-color: #f8f9fa;
+                    padding: 0.4rem;
+                    border-radius: 0.3rem;
+                    border-left: 3px solid {color};
+                    margin-bottom: 0.3rem;
+                ">
+                    <p style="margin: 0; font-size: 0.75rem; color: #666;">{sheet}</p>
+                    <p style="margin: 0.1rem 0 0 0; font-size: 1rem; font-weight: bold; color: #262730;">{current_count}개</p>
+                    {f'<p style="margin: 0.1rem 0 0 0; font-size: 0.7rem; color: {color};">{delta:+d}개</p>' if delta is not None else '<p style="margin: 0.1rem 0 0 0; font-size: 0.7rem;">&nbsp;</p>'}
+                </div>
+                """,
+                unsafe_allow_html=True,
             )
 
-            def highlight_top3_other(df):
-                def highlight_top3_rows(s):
-                    top3_values = (
-                        s.drop_duplicates()
-                        .nlargest(3)
-                        .sort_values(ascending=False)
-                        .tolist()
-                    )
-                    result = []
-                    opacities = [0.8, 0.5, 0.3]
-
-                    for v in s:
-                        if v in top3_values and v > 0:
-                            idx = top3_values.index(v)
-                            opacity = opacities[idx]
-                            result.append(
-                                f"background-color: rgba(255, 255, 0, {opacity})"
-                            )
-                        else:
-                            result.append("")
-                    return result
-
-                return df.style.apply(highlight_top3_rows, subset=["개수"])
-
-            styled_df_other = highlight_top3_other(df_other)
-            st.dataframe(styled_df_other, use_container_width=True, hide_index=True)
-
+    # 비교 테이블 생성 (변화량 순으로 정렬된 태그 × 시트 행렬 조각)
+    df_comparison = matrix.category_frame(key)
+    if is_product_category(key):
+        df_comparison["태그"] = ["/".join(tag.split("/")[1:]) for tag in df_comparison["태그"]]
+    else:
+        df_comparison["태그"] = [clean_tag_name(tag) for tag in df_comparison["태그"]]
+    display_df = df_comparison.drop("변화량", axis=1)
+
+    # 변화량 순서대로 한 페이지씩 표시하고, 시트별 상위 5개 값은 전체 표 기준으로 하이라이트
+    with perf.timed("styler", rows=len(display_df)):
+        render_paged_table(
+            display_df,
+            f"compare_{key}",
+            styles=top_rank_styles(display_df[list(matrix.sheets)]),
+        )
 
-def render_multi_comparison(selected_sheets):
+    # 추이 그래프
+    show_trend_chart(df_comparison, title, key)
+
+
+def _trend_table(trends):
+    """추이 지표를 표시용 DataFrame으로 변환합니다."""
+    growth = [
+        f"{rate * 100:+.1f}%" if not pd.isna(rate) else "new" if latest > 0 else "-"
+        for rate, latest in zip(trends["growth"], trends["latest"])
+    ]
+    return pd.DataFrame(
+        {
+            "태그": trends["tag"].to_numpy(),
+            "전월": trends["previous"].astype(int).to_numpy(),
+            "최근": trends["latest"].astype(int).to_numpy(),
+            "증감률": growth,
+            "추세(월당)": trends["slope"].round(1).to_numpy(),
+            "급증": trends["spike"].map({True: "⚡", False: ""}).to_numpy(),
+        }
+    )
+
+
+def render_trend_rankings(matrix):
+    """선택한 시트 순서를 시간 순서로 보고 추세가 가장 크게 오르내린 태그를 표시합니다."""
+    trends = tag_trends(matrix)
+    rising = rising_tags(trends)
+    declining = declining_tags(trends)
+
+    rising_col, declining_col = st.columns(2)
+    with rising_col:
+        st.markdown("**📈 급상승 태그**")
+        if len(rising):
+            st.dataframe(_trend_table(rising), use_container_width=True, hide_index=True)
+        else:
+            st.info("상승 추세인 태그가 없습니다.")
+    with declining_col:
+        st.markdown("**📉 하락 태그**")
+        if len(declining):
+            st.dataframe(_trend_table(declining), use_container_width=True, hide_index=True)
+        else:
+            st.info("하락 추세인 태그가 없습니다.")
+
+
+def render_multi_comparison(selected_sheets, lazy=False):
     """다중 비교 모드 렌더링"""
     with st.spinner(f"{len(selected_sheets)}개 시트를 비교 분석 중입니다..."):
-        # 모든 시트 데이터 로드
-        sheet_data = {}
-        tag_counts_all = {}
-        category_counts_all = {}
-        company_stats_all = {}
-
-        for sheet in selected_sheets:
-            df = load_sheet_data(sheet)
-            if df is not None:
-                sheet_data[sheet] = df
-                tag_counts_all[sheet] = analyze_tags(df)
-                category_counts_all[sheet] = categorize_tags_advanced(
-                    tag_counts_all[sheet]
-                )
-                company_stats_all[sheet] = analyze_company_stats(df)
+        # 모든 시트를 불러와 오래된 달부터 한 번에 집계 (전월 대비 변화량과 추세가 시간 순서를 가정)
+        # 시트 이름에서 월을 찾지 못한 시트는 월이 있는 시트 뒤에 이름 순서로 둠
+        loaded = load_sheets_data(selected_sheets, columns=SHEET_COLUMNS, share=True)
+        frames = {sheet: loaded[sheet] for sheet in sorted(selected_sheets, key=sheet_order_key) if sheet in loaded}
 
-        if len(sheet_data) < 2:
+        if len(frames) < 2:
             st.error("비교할 데이터가 부족합니다.")
             return
 
+        analysis = analyze_sheets(frames)
+
         # 비교 통계
         st.subheader("📊 다중 비교 통계")
-        cols = st.columns(len(sheet_data))
-        sheet_list = list(tag_counts_all.items())
+        cols = st.columns(len(analysis.sheets))
 
-        for i, (sheet, tag_counts) in enumerate(sheet_list):
-            sheet_df = sheet_data[sheet]
-            current_total = len(
-                sheet_df[sheet_df["id"].notna() & (sheet_df["id"] != "")]
-            )
+        for i, sheet in enumerate(analysis.sheets):
+            current_total = int(analysis.totals[i])
 
             # 전월 대비 변화량
-            delta = None
-            if i > 0:
-                prev_sheet = sheet_list[i - 1][0]
-                prev_df = sheet_data[prev_sheet]
-                prev_total = len(prev_df[prev_df["id"].notna() & (prev_df["id"] != "")])
-                delta = current_total - prev_total
+            delta = None if i == 0 else int(analysis.total_deltas[i])
 
             with cols[i]:
                 color = (
@@ -266,145 +442,92 @@ def render_multi_comparison(selected_sheets):
         company_table_data = {}
 
         for category, name in COMPANY_CATEGORIES.items():
-            category_values = []
-            for i, sheet in enumerate(selected_sheets):
-                current_stats = company_stats_all[sheet]
-                current_count = current_stats[category]
+            counts = analysis.company_stats[category].tolist()
+            changes = analysis.company_deltas[category].tolist()
+            rates = analysis.company_change_rates[category].tolist()
 
+            category_values = []
+            for count, change, rate in zip(counts, changes, rates):
                 change_text = ""
-                if i > 0:
-                    prev_sheet = selected_sheets[i - 1]
-                    prev_stats = company_stats_all[prev_sheet]
-                    prev_count = prev_stats[category]
-                    change = current_count - prev_count
-                    if change != 0:
-                        if prev_count > 0:
-                            change_rate = (change / prev_count) * 100
-                            change_text = f" ({change_rate:+.1f}%)"
-                        else:
-                            change_text = " (new)"
-
-                category_values.append(f"{current_count}개{change_text}")
+                if not pd.isna(change) and change != 0:
+                    change_text = " (new)" if pd.isna(rate) else f" ({rate * 100:+.1f}%)"
+                category_values.append(f"{count}개{change_text}")
 
             company_table_data[name] = category_values
 
-        company_df = pd.DataFrame(company_table_data, index=selected_sheets)
+        company_df = pd.DataFrame(company_table_data, index=analysis.sheets)
         st.dataframe(company_df, use_container_width=True)
 
+        # 급상승·하락 태그
+        st.markdown("#### 🚀 급상승 / 하락 태그")
+        render_section("multi_trends", lazy, render_trend_rankings, analysis.matrix)
+
         st.markdown("---")
 
         # 태그 카테고리별 비교
         for key, title in TAG_CATEGORIES:
-            category_data = {}
-            all_tags = set()
-
-            for sheet in selected_sheets:
-                if sheet in category_counts_all:
-                    data = category_counts_all[sheet].get(key, {})
-                    category_data[sheet] = data
-                    all_tags.update(data.keys())
-
-            if not all_tags:
+            if not len(analysis.matrix.category_rows(key)):
                 continue
 
-            # 제목 스타일링
-            if key in CATEGORY_COLORS:
-                hex_color = CATEGORY_COLORS[key]
-                # hex를 rgba로 변환하여 투명도 추가
-                r = int(hex_color[1:3], 16)
-                g = int(hex_color[3:5], 16)
-                b = int(hex_color[5:7], 16)
-                bg_color = f"rgba({r}, {g}, {b}, 0.3)"
-                st.markdown(
-                    f'<h4 style="background-color: {bg_color}; padding: 4px; border-radius: 3px; margin-bottom: 9px;">{title}</h4>',
-                    unsafe_allow_html=True,
-                )
-            else:
-                st.markdown(
-                    f'<h4 style="padding: 4px; border-radius: 3px; margin-bottom: 9px;">‣ {title}</h4>',
-                    unsafe_allow_html=True,
-                )
-
-            # 각 시트별 통계
-            stats_cols = st.columns(len(selected_sheets))
-            for i, sheet in enumerate(selected_sheets):
-                sheet_data_for_category = category_data.get(sheet, {})
-                current_count = sum(sheet_data_for_category.values())
-
-                delta = None
-                if i > 0:
-                    prev_sheet = selected_sheets[i - 1]
-                    prev_data = category_data.get(prev_sheet, {})
-                    prev_count = sum(prev_data.values())
-                    if prev_count > 0:
-                        delta = current_count - prev_count
-
-                with stats_cols[i]:
-                    color = (
-                        "#6c757d"
-                        if delta is None
-                        else (
-                            "#28a745"
-                            if delta > 0
-                            else "#dc3545" if delta < 0 else "#6c757d"
-                        )
-                    )
+            render_category_heading(key, title, margin_bottom="9px")
+            render_section(
+                f"multi_{key}",
+                lazy,
+                render_category_comparison,
+                key,
+                title,
+                analysis,
+            )
 
-                    st.markdown(
-                        f"""
-                        <div style="
-                            background-color: #f8f9fa;
-                            padding: 0.4rem;
-                            border-radius: 0.3rem;
-                            border-left: 3px solid {color};
-                            margin-bottom: 0.3rem;
-                        ">
-                            <p style="margin: 0; font-size: 0.75rem; color: #666;">{sheet}</p>
-                            <p style="margin: 0.1rem 0 0 0; font-size: 1rem; font-weight: bold; color: #262730;">{current_count}개</p>
-                            {f'<p style="margin: 0.1rem 0 0 0; font-size: 0.7rem; color: {color};">{delta:+d}개</p>' if delta is not None else '<p style="margin: 0.1rem 0 0 0; font-size: 0.7rem;">&nbsp;</p>'}
-                        </div>
-                        """,
-                        unsafe_allow_html=True,
-                    )
 
-            # 비교 테이블 생성
-            comparison_data = []
-            for tag in all_tags:
-                if key in ["리뷰_상담태그", "업셀_상담태그", "푸시_상담태그"]:
-                    clean_tag = "/".join(tag.split("/")[1:])
-                else:
-                    clean_tag = clean_tag_name(tag)
-
-                row = {"태그": clean_tag}
-                counts = []
-                for sheet in selected_sheets:
-                    count = category_data.get(sheet, {}).get(tag, 0)
-                    row[sheet] = count
-                    counts.append(count)
-
-                row["변화량"] = max(counts) - min(counts) if counts else 0
-                comparison_data.append(row)
-
-            df_comparison = pd.DataFrame(comparison_data).sort_values(
-                "변화량", ascending=False
+def render_perf_panel():
+    """사이드바에 이번 실행의 단계별 소요 시간과 프로세스 누적 통계를 표시합니다."""
+    records = perf.run_records()
+    with st.sidebar.expander("⏱️ 성능", expanded=True):
+        if records:
+            run_df = pd.DataFrame(records).convert_dtypes()
+            run_df["ms"] = (run_df.pop("seconds") * 1000).round(1)
+            columns = ["stage", "ms"] + [c for c in run_df.columns if c not in ("stage", "ms")]
+            st.markdown(f"**이번 실행** · 합계 {run_df['ms'].sum():.0f}ms (중첩 단계 포함)")
+            st.dataframe(run_df[columns], use_container_width=True, hide_index=True)
+        else:
+            st.caption("이번 실행에서 계측된 단계가 없습니다.")
+
+        totals = perf.totals()
+        if totals:
+            st.markdown("**프로세스 누적**")
+            st.dataframe(
+                pd.DataFrame(
+                    [
+                        (stage, count, round(total / count * 1000, 1), round(longest * 1000, 1))
+                        for stage, (count, total, longest) in sorted(totals.items())
+                    ],
+                    columns=["stage", "횟수", "평균 ms", "최대 ms"],
+                ),
+                use_container_width=True,
+                hide_index=True,
             )
-            display_df = df_comparison.drop("변화량", axis=1).reset_index(drop=True)
 
-            styled_df = highlight_top5_per_column(display_df)
-            st.dataframe(styled_df, use_container_width=True, hide_index=True)
-
-            # 추이 그래프
-            trend_fig = create_trend_chart(comparison_data, title, key)
-            if trend_fig:
-                st.pyplot(trend_fig)
-                plt.close(trend_fig)
+        store = table_store.stats()
+        st.caption(
+            f"공유 테이블 {store['tables']}개 · {store['bytes'] / 1024 / 1024:.1f}MB "
+            f"(사용 중 {store['pinned_tables']}개, 뷰 {store['views']}개)"
+        )
 
 
 def main():
     """메인 애플리케이션"""
+    perf.start_run()
     st.title("🥗 샐러드랩 상담데이터 분석")
     st.markdown("---")
 
+    if METRICS_CONFIG["enabled"]:
+        start_metrics_server()
+    if WARMUP_CONFIG["background"]:
+        start_warmup()
+    if PARALLEL_CONFIG["workers"] > 1:
+        start_analysis_workers()
+
     # 시트 로드
     try:
         service = get_google_sheets_service()
@@ -423,11 +546,18 @@ def main():
 
     if analysis_mode == "단일 분석":
         selected_sheet = st.sidebar.selectbox("분석할 시트 선택", sheets)
+        incremental = st.sidebar.checkbox(
+            "증분 갱신",
+            help="새로 추가된 행만 가져와 기존 집계에 더합니다. 진행 중인 월 시트에 적합합니다.",
+        )
         if st.sidebar.button("분석 시작"):
             st.session_state.analyze = True
             st.session_state.compare = False
             st.session_state.selected_sheet = selected_sheet
+            st.session_state.incremental = incremental
             st.rerun()
+        if incremental and st.sidebar.button("전체 다시 불러오기"):
+            st.session_state.reload_live = True
     else:
         selected_sheets = st.sidebar.multiselect(
             "비교할 시트 선택 (2개 이상)",
@@ -442,14 +572,29 @@ def main():
         elif len(selected_sheets) < 2:
             st.sidebar.warning("비교하려면 2개 이상의 시트를 선택하세요.")
 
+    lazy = st.sidebar.checkbox(
+        "서비스별 섹션 열 때만 표시",
+        value=RENDER_CONFIG["lazy_sections"],
+        help="각 카테고리의 테이블과 차트를 펼쳤을 때만 계산해 첫 화면을 빠르게 표시합니다.",
+    )
+
+    show_perf = st.sidebar.checkbox("성능 패널 표시", help="단계별 소요 시간, 처리 행 수, 캐시 적중 여부를 표시합니다.")
+
     # 메인 컨텐츠
     if hasattr(st.session_state, "compare") and st.session_state.compare:
-        render_multi_comparison(st.session_state.selected_sheets)
+        render_multi_comparison(st.session_state.selected_sheets, lazy=lazy)
     elif hasattr(st.session_state, "analyze") and st.session_state.analyze:
-        render_single_analysis(st.session_state.selected_sheet)
+        render_single_analysis(
+            st.session_state.selected_sheet,
+            incremental=st.session_state.get("incremental", False),
+            lazy=lazy,
+        )
     else:
         st.info("👈 사이드바에서 분석 모드를 선택하고 버튼을 클릭하세요.")
 
+    if show_perf:
+        render_perf_panel()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,48 @@
+"""analyze_company_stats 결과가 이전 iterrows 구현과 같은지 확인합니다."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzers.tag_analyzer import analyze_company_stats
+from benchmarks.legacy import legacy_analyze_company_stats
+from benchmarks.synthetic import generate_sheet
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_synthetic_sheet_matches_legacy(seed):
+    df = generate_sheet(20_000, seed=seed)
+    assert analyze_company_stats(df) == legacy_analyze_company_stats(df)
+
+
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]", "category"])
+def test_edge_cases_match_legacy(dtype):
+    df = pd.DataFrame(
+        {
+            "name": pd.Series(
+                ["업체A", " 업체A ", "", None, "업체B", "업체B", "업체C", "업체D", np.nan, "업체E"],
+                dtype=dtype,
+            ),
+            "tags": pd.Series(
+                [
+                    "리뷰/요청사항",
+                    "업셀/도입문의",  # 다른 행의 조합은 인정하지 않음
+                    "리뷰/요청사항, 업셀/도입문의",  # 업체명이 비어 있음
+                    "푸시/기능문의",
+                    "리뷰/요청사항, 업셀/도입문의, 푸시/기능문의",
+                    None,
+                    " 푸시/기능문의 , 리뷰목록/요청사항",  # 리뷰목록도 "리뷰"로 시작
+                    ",",
+                    "리뷰/요청사항",
+                    "기타/문의",
+                ],
+                dtype=dtype,
+            ),
+        }
+    )
+    assert analyze_company_stats(df) == legacy_analyze_company_stats(df)
+
+
+def test_missing_columns():
+    df = pd.DataFrame({"tags": ["리뷰/요청사항"]})
+    assert analyze_company_stats(df) == legacy_analyze_company_stats(df)
@@ -0,0 +1,95 @@
+"""analyze_tags / explode_tags 결과가 기존 행 단위 루프와 같은지 확인합니다."""
+
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzers.tag_analyzer import analyze_tags, explode_tags, parse_tags
+from benchmarks.synthetic import generate_rows, generate_sheet
+
+
+def legacy_analyze_tags(df, tag_column="tags"):
+    """벡터화 이전의 행 단위 태그 집계 (기준 구현)."""
+    if tag_column not in df.columns:
+        return {}
+
+    # 이전 로더는 object 열을 만들었으므로 pd.NA(Arrow 문자열·범주형의 결측값)는 None으로 바꿔 비교
+    tags = df[tag_column].astype(object)
+    tag_counts = Counter()
+    for tag_string in tags.where(tags.notna(), None):
+        for tag in set(parse_tags(tag_string)):
+            tag_counts[tag] += 1
+    return dict(tag_counts)
+
+
+EDGE_CASES = [
+    np.nan,
+    None,
+    "",
+    ",",
+    ",,, ,",
+    "   ",
+    " , ",
+    "리뷰/요청사항",
+    "리뷰/요청사항, 리뷰/요청사항",
+    " 리뷰/요청사항 ,리뷰/요청사항,  ",
+    "업셀/도입문의,,푸시/기능문의",
+    "업셀/도입문의, 업셀/도입문의 , 업셀/도입문의",
+    "  푸시/기능문의/항목1  ",
+]
+
+
+# 로더가 만드는 dtype(config.SHEET_COLUMN_DTYPES: string[pyarrow], category)과 object·str
+DTYPES = [object, "str", "string[pyarrow]", "category"]
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_edge_cases_match_legacy(dtype):
+    df = pd.DataFrame({"tags": pd.Series(EDGE_CASES, dtype=dtype)})
+    assert analyze_tags(df) == legacy_analyze_tags(df)
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_each_edge_case_alone_matches_legacy(dtype):
+    for value in EDGE_CASES:
+        df = pd.DataFrame({"tags": pd.Series([value], dtype=dtype)})
+        assert analyze_tags(df) == legacy_analyze_tags(df), value
+
+
+def test_empty_and_missing_column():
+    assert analyze_tags(pd.DataFrame({"tags": pd.array([], dtype=object)})) == {}
+    assert analyze_tags(pd.DataFrame({"name": ["업체"]})) == {}
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_explode_tags_matches_parse_tags(dtype):
+    series = pd.Series(EDGE_CASES, index=range(100, 100 + len(EDGE_CASES)), dtype=dtype)
+    tags = explode_tags(series)
+
+    values = series.astype(object)
+    expected = [
+        (row, tag)
+        for row, value in enumerate(values.where(values.notna(), None))
+        for tag in parse_tags(value)
+    ]
+    assert list(zip(tags.index.tolist(), tags.tolist())) == expected
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_synthetic_sheet_matches_legacy(seed):
+    df = generate_sheet(120_000, seed=seed)
+    assert len(df) >= 100_000
+    assert analyze_tags(df) == legacy_analyze_tags(df)
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_synthetic_rows_with_edge_cases_match_legacy(dtype):
+    rows = generate_rows(100_000, seed=2)
+    df = pd.DataFrame(rows[1:], dtype=object).reindex(columns=range(3))
+    df.columns = rows[0]
+    # 잘린 행(태그 없음)은 NaN으로 두고 경계 사례 값을 섞음
+    df.loc[df.index[::997], "tags"] = np.resize(np.array(EDGE_CASES, dtype=object), len(df.index[::997]))
+    df["tags"] = df["tags"].astype(dtype)
+    assert analyze_tags(df) == legacy_analyze_tags(df)
@@ -0,0 +1,237 @@
+"""Prometheus 형식 운영 지표
+
+단계별 소요 시간 분포, Sheets API 호출 수와 응답 코드, 캐시 적중률, 활성 세션 수,
+프로세스 메모리(RSS)를 모아 Prometheus 텍스트 형식으로 내보냅니다. 앱 프로세스 안에서
+작은 HTTP 서버(start_server)를 띄워 /metrics로 제공합니다.
+
+단계별 지표는 utils.perf의 계측 기록에서 자동으로 쌓이므로(observe_stage), 새 단계는
+perf.timed로 감싸기만 하면 됩니다. Sheets API 지표는 services.sheets_service._execute가
+요청마다 기록합니다.
+
+    sheets_api_requests.inc(method="values.batchGet", status="429")
+    stage_seconds.observe(0.42, stage="analyze_sheet")
+"""
+
+import bisect
+import os
+import resource
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import METRICS_CONFIG
+
+_PREFIX = "doge_"
+_PROCESS_START = time.time()
+
+# 단계 소요 시간 버킷 (초): 캐시 적중(ms 단위)부터 느린 전체 로드(수십 초)까지
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_registry = []
+_registry_lock = threading.Lock()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in (*zip(names, values), *extra)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """이름·설명·라벨 이름을 가진 지표입니다. 값은 라벨 값 튜플별로 보관합니다.
+
+    callback을 지정하면 보관한 값 대신 내보낼 때마다 호출해 값을 구합니다 (None이면 생략).
+    """
+
+    kind = ""
+
+    def __init__(self, name, help_text, labels=(), callback=None):
+        self.name = _PREFIX + name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+        self.callback = callback
+        self._values = {}
+        self._lock = threading.Lock()
+        with _registry_lock:
+            _registry.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def samples(self):
+        """(이름 접미사, 라벨 값, 추가 라벨, 값) 목록."""
+        if self.callback is not None:
+            try:
+                value = self.callback()
+            except Exception:
+                value = None
+            return [] if value is None else [("", (), (), value)]
+        with self._lock:
+            return [("", key, (), value) for key, value in sorted(self._values.items())]
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, key, extra, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_label_text(self.label_names, key, extra)} {_number(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """계속 증가하는 누적 값 (요청 수, 캐시 적중 수 등)."""
+
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """현재 값 (세션 수, 메모리 사용량 등)."""
+
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """관측 값의 분포 (버킷별 누적 개수, 합계, 개수)."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=STAGE_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def samples(self):
+        with self._lock:
+            items = [(key, list(counts), total, count) for key, (counts, total, count) in sorted(self._values.items())]
+
+        samples = []
+        for key, counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                samples.append(("_bucket", key, (("le", _number(float(bound))),), cumulative))
+            samples.append(("_bucket", key, (("le", "+Inf"),), count))
+            samples.append(("_sum", key, (), total))
+            samples.append(("_count", key, (), count))
+        return samples
+
+
+def _resident_memory_bytes():
+    """현재 RSS (Linux는 /proc, 그 외에는 최대 RSS로 대신함)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _active_sessions():
+    """연결된 Streamlit 세션 수 (Streamlit 서버 밖이거나 세션 수를 알 수 없으면 None).
+
+    공개 API가 없어 Runtime의 내부 세션 관리자를 읽으므로, 다른 Streamlit 버전에서
+    속성이 없으면 지표를 비워 둡니다.
+    """
+    from streamlit.runtime import Runtime
+
+    if not Runtime.exists():
+        return None
+    session_mgr = getattr(Runtime.instance(), "_session_mgr", None)
+    num_active_sessions = getattr(session_mgr, "num_active_sessions", None)
+    if num_active_sessions is None:
+        return None
+    return num_active_sessions()
+
+
+stage_seconds = Histogram("stage_duration_seconds", "단계별 소요 시간 (utils.perf 계측 단계)", ["stage"])
+stage_rows = Counter("stage_rows_total", "단계별 처리 행 수", ["stage"])
+cache_requests = Counter(
+    "cache_requests_total", "캐시 조회 수 (cache=snapshot|table_store|analysis|chart, result=hit|miss)", ["cache", "result"]
+)
+sheets_api_requests = Counter(
+    "sheets_api_requests_total", "Sheets API 호출 수 (재시도 포함, status=HTTP 상태 또는 error)", ["method", "status"]
+)
+sheets_api_seconds = Histogram("sheets_api_request_duration_seconds", "Sheets API 호출 소요 시간", ["method"])
+sheets_api_bytes = Counter("sheets_api_response_bytes_total", "Sheets API 응답 본문 바이트 수", ["method"])
+active_sessions = Gauge("active_sessions", "연결된 Streamlit 세션 수", callback=_active_sessions)
+resident_memory = Gauge("process_resident_memory_bytes", "프로세스 RSS (바이트)", callback=_resident_memory_bytes)
+cpu_seconds = Counter("process_cpu_seconds_total", "프로세스 누적 CPU 시간 (초)", callback=time.process_time)
+uptime_seconds = Gauge("process_uptime_seconds", "프로세스 시작 후 경과 시간 (초)", callback=lambda: time.time() - _PROCESS_START)
+
+
+def observe_stage(record):
+    """utils.perf 단계 기록 하나를 지표에 반영합니다."""
+    stage = record["stage"]
+    stage_seconds.observe(record["seconds"], stage=stage)
+    if isinstance(record.get("rows"), int):
+        stage_rows.inc(record["rows"], stage=stage)
+
+
+def render():
+    """등록된 모든 지표를 Prometheus 텍스트 형식으로 반환합니다."""
+    with _registry_lock:
+        metrics = list(_registry)
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 수집 요청마다 접근 로그를 남기지 않음
+        pass
+
+
+def start_server(port=None, address=None):
+    """/metrics를 제공하는 HTTP 서버를 데몬 스레드로 시작하고 서버를 반환합니다.
+
+    포트를 열 수 없으면(이미 사용 중 등) None을 반환합니다.
+    """
+    port = METRICS_CONFIG["port"] if port is None else port
+    address = METRICS_CONFIG["address"] if address is None else address
+    try:
+        server = ThreadingHTTPServer((address, port), _MetricsHandler)
+    except OSError as e:
+        print(f"⚠️  지표 서버를 시작하지 못했습니다 ({address}:{port}): {e}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
@@ -0,0 +1,130 @@
+"""단계별 실행 시간 계측
+
+시트 로드, 행 변환, 태그 분석, 차트, 테이블 스타일 등 주요 단계의 소요 시간과 처리 행 수,
+가져온 바이트 수, 캐시 적중 여부를 기록합니다. 기록은 현재 실행(Streamlit 스크립트 실행
+한 번)별로 모아 사이드바 "성능" 패널에 보여 주고, 설정에 따라 한 줄짜리 JSON 로그로도
+출력합니다. 모든 기록은 utils.metrics의 단계별 지표에도 반영됩니다.
+
+    with timed("load_sheet_data", sheet=sheet_name) as record:
+        ...
+        record["rows"] = len(df)
+
+    @timed_function("analyze_tags", rows=lambda df, *args, **kwargs: len(df))
+    def analyze_tags(df): ...
+
+기록 목록은 contextvars로 전달되므로, 스레드 풀 작업을 contextvars.copy_context()로
+제출하면 작업 스레드의 기록도 같은 실행에 모입니다.
+"""
+
+import contextvars
+import functools
+import json
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from config import PERF_CONFIG
+from utils import metrics
+
+# 현재 실행의 기록 목록 (start_run()으로 새로 시작)
+_run_records = contextvars.ContextVar("perf_run_records", default=None)
+# 열려 있는 단계 기록 (안쪽 단계가 마지막), 바이트·캐시 정보를 붙일 대상
+_open_stages = contextvars.ContextVar("perf_open_stages", default=())
+
+# 프로세스 전체 단계별 누적 (횟수, 합계 초, 최대 초)
+_totals = {}
+_totals_lock = threading.Lock()
+
+_logger = logging.getLogger("perf")
+
+
+def _json_logger():
+    """JSON 한 줄을 그대로 stderr로 출력하는 로거를 준비합니다."""
+    if not _logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        _logger.addHandler(handler)
+        _logger.setLevel(logging.INFO)
+        _logger.propagate = False
+    return _logger
+
+
+def start_run():
+    """새 실행의 기록을 시작하고 기록 목록을 반환합니다."""
+    records = []
+    _run_records.set(records)
+    return records
+
+
+def run_records():
+    """현재 실행의 기록 목록 (시작하지 않았으면 빈 목록)."""
+    return list(_run_records.get() or [])
+
+
+def totals():
+    """프로세스 전체 단계별 {단계: (횟수, 합계 초, 최대 초)}."""
+    with _totals_lock:
+        return dict(_totals)
+
+
+def annotate(**fields):
+    """가장 안쪽에 열려 있는 단계 기록에 값을 추가합니다 (예: cache="hit")."""
+    stages = _open_stages.get()
+    if stages:
+        stages[-1].update(fields)
+
+
+def add_bytes(count):
+    """가장 안쪽에 열려 있는 단계가 가져온 바이트 수를 더합니다."""
+    stages = _open_stages.get()
+    if stages:
+        stages[-1]["bytes"] = stages[-1].get("bytes", 0) + count
+
+
+def _finish(record):
+    metrics.observe_stage(record)
+    with _totals_lock:
+        count, total, longest = _totals.get(record["stage"], (0, 0.0, 0.0))
+        _totals[record["stage"]] = (count + 1, total + record["seconds"], max(longest, record["seconds"]))
+
+    records = _run_records.get()
+    if records is not None:
+        records.append(record)
+
+    if PERF_CONFIG["json_logs"] and record["seconds"] >= PERF_CONFIG["log_min_seconds"]:
+        _json_logger().info(json.dumps({"event": "perf", **record}, ensure_ascii=False, default=str))
+
+
+@contextmanager
+def timed(stage, **fields):
+    """블록 실행 시간을 기록합니다. 블록 안에서 반환된 dict에 값을 추가할 수 있습니다."""
+    if not PERF_CONFIG["enabled"]:
+        yield {}
+        return
+
+    record = {"stage": stage, **fields}
+    token = _open_stages.set(_open_stages.get() + (record,))
+    started = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["seconds"] = time.perf_counter() - started
+        _open_stages.reset(token)
+        _finish(record)
+
+
+def timed_function(stage, rows=None):
+    """함수 실행 시간을 기록하는 데코레이터입니다.
+
+    rows를 지정하면 함수 인자로 처리 행 수를 계산해 기록합니다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            fields = {"rows": rows(*args, **kwargs)} if rows and PERF_CONFIG["enabled"] else {}
+            with timed(stage, **fields):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,100 @@
+"""렌더링된 차트 이미지 캐시
+
+차트 데이터, 제목, 차트 설정의 해시를 키로 PNG 바이트를 저장합니다.
+같은 차트를 다시 그릴 때는 matplotlib을 거치지 않고 저장된 이미지를 그대로 반환합니다.
+"""
+
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from config import CHART_CONFIG
+from utils import metrics, perf
+from visualizers.chart_creator import create_chart, create_trend_chart
+
+_png_cache = OrderedDict()
+_cache_bytes = 0
+_lock = threading.Lock()
+
+
+def _cache_key(kind, *payload):
+    """차트 종류, 입력 데이터, 차트·폰트 설정으로 캐시 키를 만듭니다."""
+    raw = json.dumps(
+        [kind, payload, CHART_CONFIG, plt.rcParams["font.family"]],
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _get(key):
+    with _lock:
+        png = _png_cache.get(key)
+        if png is not None:
+            _png_cache.move_to_end(key)
+    metrics.cache_requests.inc(cache="chart", result="miss" if png is None else "hit")
+    return png
+
+
+def _put(key, png):
+    global _cache_bytes
+    with _lock:
+        if key in _png_cache:
+            return
+        _png_cache[key] = png
+        _cache_bytes += len(png)
+        while _cache_bytes > CHART_CONFIG["render_cache_max_bytes"] and len(_png_cache) > 1:
+            _, evicted = _png_cache.popitem(last=False)
+            _cache_bytes -= len(evicted)
+
+
+def _render_png(fig):
+    """figure를 PNG 바이트로 저장하고 figure를 닫습니다."""
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(
+            buffer, format="png", dpi=CHART_CONFIG["render_dpi"], bbox_inches="tight"
+        )
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+def create_chart_image(data, title):
+    """막대 차트 PNG 바이트를 반환합니다. 데이터가 없으면 None."""
+    if not data:
+        return None
+
+    with perf.timed("chart_image", rows=len(data)) as record:
+        key = _cache_key("bar", list(data.items()), title)
+        png = _get(key)
+        record["cache"] = "miss" if png is None else "hit"
+        if png is None:
+            fig = create_chart(data, title)
+            # 그릴 것이 없는 경우도 빈 바이트로 캐시
+            png = _render_png(fig) if fig is not None else b""
+            _put(key, png)
+    return png or None
+
+
+def create_trend_chart_image(comparison_data, title, key):
+    """다중 비교 추이 차트 PNG 바이트를 반환합니다. 그릴 태그가 없으면 None."""
+    if comparison_data is None or len(comparison_data) == 0:
+        return None
+
+    with perf.timed("trend_chart_image", rows=len(comparison_data)) as record:
+        frame = pd.DataFrame(comparison_data)
+        frame_hash = pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes().hex()
+        cache_key = _cache_key("trend", list(frame.columns), frame_hash, title, key)
+        png = _get(cache_key)
+        record["cache"] = "miss" if png is None else "hit"
+        if png is None:
+            fig = create_trend_chart(comparison_data, title, key)
+            png = _render_png(fig) if fig is not None else b""
+            _put(cache_key, png)
+    return png or None
@@ -1,8 +1,82 @@
-"""차트 생성 로직"""
+"""차트 생성 로직
+
+matplotlib 차트(create_chart, create_trend_chart)는 서버에서 그려 이미지로 보내며,
+Altair 차트 명세(create_chart_spec, create_trend_chart_spec)는 브라우저에서
+Vega-Lite로 그려집니다. 사용할 백엔드는 CHART_CONFIG["backend"]로 정합니다.
+"""
+
+import json
 
 import matplotlib.pyplot as plt
 import pandas as pd
-from config import CHART_CONFIG, BLUE_SHADES
+from config import CHART_CONFIG, BLUE_SHADES, TREND_CONFIG
+from utils.perf import timed_function
+
+try:
+    import altair as alt
+except ImportError:  # altair가 없으면 matplotlib만 사용
+    alt = None
+
+
+def get_chart_backend():
+    """사용할 차트 백엔드("altair" 또는 "matplotlib")를 반환합니다."""
+    if CHART_CONFIG["backend"] == "altair" and alt is not None:
+        return "altair"
+    return "matplotlib"
+
+
+def _signature_color(title):
+    """제목의 서비스명에 맞는 시그니처 색상을 반환합니다."""
+    if "리뷰" in title:
+        return "#c198e1"  # R193 G152 B225
+    if "업셀" in title:
+        return "#ef9aae"  # R239 G154 B174
+    if "푸시" in title:
+        return "#5b9bd5"  # R91 G155 B213 (더 진한 파란색)
+    return "#87CEEB"  # 기본 색상
+
+
+def _bar_items(data):
+    """막대 차트용 (태그, 정리된 태그명, 개수) 목록을 개수 내림차순으로 반환합니다.
+
+    서로 다른 태그가 같은 이름으로 정리될 수 있으므로 막대는 정리된 이름이 아니라
+    순서(태그)로 구분하고, 정리된 이름은 축 레이블로만 씁니다.
+    """
+    sorted_items = sorted(data.items(), key=lambda x: x[1], reverse=True)
+    return [(tag, clean_tag_name(tag), count) for tag, count in sorted_items]
+
+
+def _trend_frame(comparison_data, key):
+    """추이 차트에 표시할 태그만 남긴 DataFrame과 시트 열 목록을 반환합니다.
+
+    comparison_data는 "태그", 시트별 건수, "변화량" 열을 갖는 DataFrame 또는 행 dict 목록입니다.
+    """
+    df = pd.DataFrame(comparison_data)
+    sheet_columns = [col for col in df.columns if col not in ["태그", "변화량"]]
+
+    # 유의미한 태그만 필터링
+    if key in TREND_CONFIG["significance_keys"]:
+        df = df[df[sheet_columns].max(axis=1) >= TREND_CONFIG["min_count"]]
+
+    # 상위 태그만 표시
+    last_sheet = sheet_columns[-1]
+    df = df.sort_values(last_sheet, ascending=False).head(CHART_CONFIG["top_tags_limit"])
+    return df, sheet_columns
+
+
+def _trend_colors(base_color, count):
+    """베이스 색상의 음영 목록을 만듭니다 (마지막 시트가 제일 진함)."""
+    colors = []
+    for i in range(count):
+        if count == 1:
+            opacity = 1.0
+        else:
+            opacity = 0.4 + (0.6 * i / (count - 1))
+        r = int(base_color[1:3], 16) / 255
+        g = int(base_color[3:5], 16) / 255
+        b = int(base_color[5:7], 16) / 255
+        colors.append((r, g, b, opacity))
+    return colors
 
 
 def clean_tag_name(tag):
@@ -24,6 +98,7 @@ def clean_tag_name(tag):
     return tag
 
 
+@timed_function("create_chart", rows=lambda data, title: len(data) if data else 0)
 def create_chart(data, title):
     """차트를 생성합니다."""
     if not data:
@@ -36,18 +111,11 @@ def create_chart(data, title):
     ax.set_title(title, fontsize=12)
 
     # 시그니처 색상 설정
-    if "리뷰" in title:
-        color = "#c198e1"  # R193 G152 B225
-    elif "업셀" in title:
-        color = "#ef9aae"  # R239 G154 B174
-    elif "푸시" in title:
-        color = "#5b9bd5"  # R91 G155 B213 (더 진한 파란색)
-    else:
-        color = "#87CEEB"  # 기본 색상
+    color = _signature_color(title)
 
-    sorted_items = sorted(data.items(), key=lambda x: x[1], reverse=True)
-    clean_tags = [clean_tag_name(tag) for tag, count in sorted_items]
-    counts = [count for tag, count in sorted_items]
+    items = _bar_items(data)
+    clean_tags = [clean_tag for _, clean_tag, _ in items]
+    counts = [count for _, _, count in items]
 
     bars = ax.bar(range(len(clean_tags)), counts, color=color)
     ax.set_xticks(range(len(clean_tags)))
@@ -68,49 +136,21 @@ def create_chart(data, title):
     return fig
 
 
+@timed_function("create_trend_chart", rows=lambda data, title, key: 0 if data is None else len(data))
 def create_trend_chart(comparison_data, title, key):
     """다중 비교용 선 그래프를 생성합니다."""
-    if not comparison_data:
+    if comparison_data is None or len(comparison_data) == 0:
         return None
 
-    df = pd.DataFrame(comparison_data)
-    sheet_columns = [col for col in df.columns if col not in ["태그", "변화량"]]
-
-    # 유의미한 태그만 필터링
-    if key in ["리뷰_상담태그", "리뷰_요청사항_상담태그"]:
-        df["max_value"] = df[sheet_columns].max(axis=1)
-        df = df[df["max_value"] >= 5].drop("max_value", axis=1)
-
-    # 상위 태그만 표시
-    last_sheet = sheet_columns[-1]
-    df = df.sort_values(last_sheet, ascending=False).head(CHART_CONFIG["top_tags_limit"])
-
+    df, sheet_columns = _trend_frame(comparison_data, key)
     if len(df) == 0:
         return None
 
     fig, ax = plt.subplots(figsize=CHART_CONFIG["trend_figsize"])
 
-    # 시그니처 색상 설정
-    if "리뷰" in title:
-        base_color = "#c198e1"  # R193 G152 B225
-    elif "업셀" in title:
-        base_color = "#ef9aae"  # R239 G154 B174
-    elif "푸시" in title:
-        base_color = "#5b9bd5"  # R91 G155 B213 (더 진한 파란색)
-    else:
-        base_color = "#87CEEB"  # 기본 색상
-    
-    # 베이스 색상의 다양한 음영 생성 (마지막 시트가 제일 진함)
-    colors = []
-    for i in range(len(sheet_columns)):
-        if len(sheet_columns) == 1:
-            opacity = 1.0
-        else:
-            opacity = 0.4 + (0.6 * i / (len(sheet_columns) - 1))
-        r = int(base_color[1:3], 16) / 255
-        g = int(base_color[3:5], 16) / 255
-        b = int(base_color[5:7], 16) / 255
-        colors.append((r, g, b, opacity))
+    # 시그니처 색상의 음영 (마지막 시트가 제일 진함)
+    base_color = _signature_color(title)
+    colors = _trend_colors(base_color, len(sheet_columns))
 
     for i, sheet in enumerate(sheet_columns):
         values = df[sheet].values
@@ -136,21 +176,53 @@ def create_trend_chart(comparison_data, title, key):
     return fig
 
 
-def highlight_top5_per_column(df):
-    """상위 5개 값을 하이라이트합니다."""
-    def high_top5(s):
-        top5_values = s.drop_duplicates().nlargest(5).sort_values(ascending=False).tolist()
-        result = []
-        opacities = [0.9, 0.7, 0.5, 0.3, 0.1]
-        
-        for v in s:
-            if v in top5_values and v > 0:
-                idx = top5_values.index(v)
-                opacity = opacities[idx]
-                result.append(f"background-color: rgba(255, 255, 0, {opacity})")
-            else:
-                result.append("")
-        return result
-
-    numeric_cols = df.select_dtypes(include="number").columns
-    return df.style.apply(high_top5, subset=numeric_cols)
\ No newline at end of file
+@timed_function("create_chart_spec", rows=lambda data, title: len(data) if data else 0)
+def create_chart_spec(data, title):
+    """브라우저에서 그릴 막대 차트(Altair)를 생성합니다."""
+    if not data:
+        return None
+
+    items = _bar_items(data)
+    df = pd.DataFrame(items, columns=["전체 태그", "태그", "개수"])
+    df["순서"] = range(len(df))
+    height = CHART_CONFIG["figsize"][1] * 50
+
+    # 같은 이름으로 정리된 태그가 한 막대로 합쳐지지 않도록 x는 순서로 두고 레이블만 정리된 이름으로 표시
+    label_expr = f"{json.dumps(df['태그'].tolist(), ensure_ascii=False)}[datum.value]"
+    bars = alt.Chart(df).mark_bar(color=_signature_color(title)).encode(
+        x=alt.X(
+            "순서:O",
+            sort=None,
+            title="태그",
+            axis=alt.Axis(labelAngle=-45, labelLimit=200, labelExpr=label_expr),
+        ),
+        y=alt.Y("개수:Q", title="개수"),
+        tooltip=["태그", "전체 태그", "개수"],
+    )
+    labels = bars.mark_text(dy=-6, fontSize=9).encode(text="개수:Q")
+    return (bars + labels).properties(title=title, height=height)
+
+
+@timed_function("create_trend_chart_spec", rows=lambda data, title, key: 0 if data is None else len(data))
+def create_trend_chart_spec(comparison_data, title, key):
+    """브라우저에서 그릴 다중 비교용 선 그래프(Altair)를 생성합니다."""
+    if comparison_data is None or len(comparison_data) == 0:
+        return None
+
+    df, sheet_columns = _trend_frame(comparison_data, key)
+    if len(df) == 0:
+        return None
+
+    long_df = df.melt(id_vars="태그", value_vars=sheet_columns, var_name="시트", value_name="개수")
+    colors = [
+        f"rgba({int(r * 255)}, {int(g * 255)}, {int(b * 255)}, {a:.2f})"
+        for r, g, b, a in _trend_colors(_signature_color(title), len(sheet_columns))
+    ]
+    height = CHART_CONFIG["trend_figsize"][1] * 50
+
+    return alt.Chart(long_df).mark_line(point=True, strokeWidth=2.5).encode(
+        x=alt.X("태그:N", sort=df["태그"].tolist(), title="태그", axis=alt.Axis(labelAngle=-90)),
+        y=alt.Y("개수:Q", title="월별 개수"),
+        color=alt.Color("시트:N", sort=sheet_columns, scale=alt.Scale(domain=sheet_columns, range=colors)),
+        tooltip=["태그", "시트", "개수"],
+    ).properties(title=f"{title} - 태그별 월별 추이", height=height)
@@ -0,0 +1,92 @@
+"""큰 태그 테이블의 상위 K행 표시
+
+전체 표를 정렬해 모두 보내는 대신, 상위 K행만 골라(argpartition, 전체 정렬 없음) 브라우저로
+보냅니다. "더 보기"를 누르면 한 페이지씩 늘어나고, 검색어는 서버에서 걸러 낸 뒤 다시 상위
+K행을 고릅니다. 한 번에 보내는 행 수는 태그 종류가 늘어나도 RENDER_CONFIG["table_page_size"]의
+배수로 제한됩니다.
+"""
+
+import numpy as np
+import streamlit as st
+
+from config import RENDER_CONFIG
+from visualizers.table_styler import apply_styles
+
+
+def top_k_positions(values, k):
+    """값이 큰 순서대로 상위 k개의 위치를 반환합니다 (같은 값은 앞쪽 위치 우선)."""
+    values = np.asarray(values, dtype=np.float64)
+    if k <= 0:
+        return np.arange(0)
+    if k >= len(values):
+        candidates = np.arange(len(values))
+    else:
+        # k번째로 큰 값을 찾고, 경계 값과 같은 위치는 앞에서부터 필요한 만큼만 고름
+        threshold = np.partition(values, len(values) - k)[len(values) - k]
+        above = np.flatnonzero(values > threshold)
+        ties = np.flatnonzero(values == threshold)[: k - len(above)]
+        candidates = np.concatenate([above, ties])
+    return candidates[np.lexsort((candidates, -values[candidates]))]
+
+
+def filter_rows(df, query, column="태그"):
+    """column에 검색어가 들어 있는 행만 남깁니다 (대소문자 무시)."""
+    if not query:
+        return df
+    mask = df[column].astype(str).str.contains(query.strip(), case=False, regex=False)
+    return df[mask.to_numpy()]
+
+
+def _show_more(limit_key, page_size):
+    st.session_state[limit_key] = st.session_state.get(limit_key, page_size) + page_size
+
+
+def _reset_limit(limit_key):
+    st.session_state.pop(limit_key, None)
+
+
+def render_paged_table(df, key, sort_column=None, styles=None, search_column="태그"):
+    """df의 상위 행을 한 페이지씩 표시합니다.
+
+    Args:
+        df: 표시할 전체 표 (인덱스가 고유해야 함)
+        key: 위젯 상태 키 (테이블마다 달라야 함)
+        sort_column: 이 열의 값이 큰 순으로 상위 행을 고름 (None이면 df 순서대로)
+        styles: df 전체 기준으로 만든 스타일 표 (table_styler.top_rank_styles 등)
+        search_column: 검색어를 찾을 열
+    """
+    page_size = RENDER_CONFIG["table_page_size"]
+    limit_key = f"{key}_limit"
+
+    view = df
+    if len(df) > page_size:
+        query = st.text_input(
+            "태그 검색",
+            key=f"{key}_search",
+            placeholder="태그 검색",
+            label_visibility="collapsed",
+            on_change=_reset_limit,
+            args=(limit_key,),
+        )
+        view = filter_rows(df, query, search_column)
+
+    limit = st.session_state.get(limit_key, page_size)
+    if sort_column is None:
+        page = view.head(limit)
+    else:
+        page = view.iloc[top_k_positions(view[sort_column].to_numpy(), limit)]
+
+    st.dataframe(
+        apply_styles(page, styles) if styles is not None else page,
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    if len(page) < len(view):
+        st.caption(f"전체 {len(view):,}개 중 상위 {len(page):,}개 표시")
+        st.button(
+            "더 보기",
+            key=f"{key}_more",
+            on_click=_show_more,
+            args=(limit_key, page_size),
+        )
@@ -0,0 +1,54 @@
+"""테이블 상위 값 하이라이트
+
+각 열의 값을 rank(method="dense")로 한 번에 순위 매긴 뒤, 순위를 미리 만들어 둔 CSS
+목록에서 골라 스타일 표를 만듭니다. 같은 값은 같은 순위(같은 색)를 받고, 0 이하의 값은
+순위 안에 들어도 칠하지 않습니다.
+
+전체 표 기준으로 스타일 표를 만든 뒤(top_rank_styles, top_row_styles) apply_styles로 표시할
+행에 입힙니다. 그러면 일부 행만 표시해도 순위 색은 전체 표 기준 그대로입니다.
+
+    styles = top_rank_styles(df[numeric_columns])            # 숫자 열마다 상위 5개
+    styles = top_row_styles(df, "개수")                        # 개수 상위 3개 행 전체
+    st.dataframe(apply_styles(page, styles), ...)
+"""
+
+import numpy as np
+import pandas as pd
+
+HIGHLIGHT_CSS = "background-color: rgba(255, 255, 0, {opacity})"
+TOP3_OPACITIES = (0.8, 0.5, 0.3)
+TOP5_OPACITIES = (0.9, 0.7, 0.5, 0.3, 0.1)
+
+
+def _style_lookup(opacities):
+    """순위(1부터) → CSS 배열. 0번은 순위 밖(빈 스타일)입니다."""
+    return np.array([""] + [HIGHLIGHT_CSS.format(opacity=opacity) for opacity in opacities], dtype=object)
+
+
+def top_rank_styles(frame, opacities=TOP5_OPACITIES):
+    """열마다 큰 값 순 dense 순위로 CSS를 고른 같은 모양의 DataFrame을 반환합니다."""
+    lookup = _style_lookup(opacities)
+    ranks = frame.rank(method="dense", ascending=False).to_numpy(dtype=float, na_value=np.nan)
+    values = frame.to_numpy(dtype=float, na_value=np.nan)
+
+    highlighted = (ranks <= len(opacities)) & (values > 0)
+    indexes = np.where(highlighted, np.nan_to_num(ranks), 0).astype(np.intp)
+    return pd.DataFrame(lookup[indexes], index=frame.index, columns=frame.columns)
+
+
+def top_row_styles(frame, column, opacities=TOP3_OPACITIES):
+    """column 값의 순위 CSS를 행 전체에 채운 frame과 같은 모양의 DataFrame을 반환합니다."""
+    styles = top_rank_styles(frame[[column]], opacities)[column].to_numpy()
+    return pd.DataFrame(
+        np.repeat(styles[:, None], frame.shape[1], axis=1),
+        index=frame.index,
+        columns=frame.columns,
+    )
+
+
+def apply_styles(df, styles):
+    """미리 만든 스타일 표(인덱스·열 이름 기준, 없는 칸은 빈 스타일)를 입힌 Styler를 반환합니다."""
+    def page_styles(frame):
+        return styles.reindex(index=frame.index, columns=frame.columns).fillna("")
+
+    return df.style.apply(page_styles, axis=None)